@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import timedelta
-from typing import Any
+from functools import partial
 
 from aiohttp.client_exceptions import ClientConnectorError, ClientError
 from homeassistant.config_entries import ConfigEntry
@@ -15,13 +15,12 @@ from homeassistant.core import (
     ServiceCall,
     ServiceResponse,
     SupportsResponse,
-    callback,
 )
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.util import dt as dt_util
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.event import async_track_time_interval
 from homecom_alt import (
     ApiError,
     AuthFailedError,
@@ -43,11 +42,27 @@ from homecom_alt import (
 )
 from homecom_alt.const import BACON_DEFAULT_REGION
 
+from .bacon import (
+    BACON_HISTORY_INTERVAL,
+    BaconHistoryClient,
+    BaconHistoryImporter,
+    RawCaptureBuffer,
+    async_get_bacon_sessions,
+    bacon_topic_filters,
+)
 from .const import (
+    CAPTURE_RAW_DEFAULT_BYTES,
+    CAPTURE_RAW_DEFAULT_PER_TOPIC,
     CAPTURE_RAW_DEFAULT_SECONDS,
+    CAPTURE_RAW_MAX_BYTES,
+    CAPTURE_RAW_MAX_PER_TOPIC,
     CAPTURE_RAW_MAX_SECONDS,
+    CAPTURE_RAW_MIN_BYTES,
+    CAPTURE_RAW_MIN_PER_TOPIC,
+    CONF_ADAPTIVE_POLLING,
     CONF_BACON_CLIENT_ID,
     CONF_BACON_REGION,
+    CONF_BACON_SUBSCRIBE_ALL,
     CONF_BRAND_BUDERUS,
     CONF_REFRESH,
     CONF_UPDATE_SECONDS,
@@ -65,6 +80,18 @@ from .coordinator import (
     BoschComModuleCoordinatorRrc2,
     BoschComModuleCoordinatorWddw2,
 )
+from .energyhistory import ENERGY_HISTORY_INTERVAL, EnergyHistoryImporter
+from .metrics import async_get_endpoint_stats, metrics_trace_config
+from .polling import AdaptivePollInterval, stagger_offsets
+from .scheduler import (
+    RequestPriority,
+    ScheduledSession,
+    account_key,
+    async_get_request_scheduler,
+    request_priority,
+    scheduler_trace_config,
+)
+from .statistics import StatisticsImporter
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -98,7 +125,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     else:
         _LOGGER.error("No valid credentials provided")
         return False
-    websession = async_get_clientsession(hass)
+    # The entry's own session (on the shared connector, detached again when
+    # the entry unloads) holds requests to the account's budget; its trace
+    # configs pause that budget on a 429, attribute requests and bytes to the
+    # polling coordinator and time every endpoint.
+    scheduler = async_get_request_scheduler(hass, account_key(entry))
+    websession = ScheduledSession(
+        async_create_clientsession(
+            hass,
+            trace_configs=[
+                scheduler_trace_config(scheduler),
+                metrics_trace_config(async_get_endpoint_stats(hass)),
+            ],
+        ),
+        scheduler,
+    )
 
     bhc = await HomeComAlt.create(websession, options, True)
 
@@ -260,19 +301,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             new_data[CONF_BACON_CLIENT_ID] = client_id
             hass.config_entries.async_update_entry(entry, data=new_data)
 
-        bacon_client = BaconMqttClient(client_id, region=bacon_region)
         sub = decode_jwt_sub(bhc.token)
         if not sub:
             raise ConfigEntryAuthFailed("Could not derive user id from token")
-        try:
-            await bacon_client.async_connect(bhc.token, sub)
-        except AuthFailedError as err:
-            raise ConfigEntryAuthFailed from err
-        except (ApiError, ClientError, ClientConnectorError, TimeoutError) as err:
-            raise ConfigEntryNotReady from err
-        entry.async_on_unload(bacon_client.async_disconnect)
-
-        bacon_lock = asyncio.Lock()
+        # One session per account and region, shared with other entries of the
+        # same account. Only the selected devices' shadow and topics channels
+        # are subscribed; the whole users/{sub}/# namespace stays available as
+        # a debugging option.
+        bacon_sessions = async_get_bacon_sessions(hass)
+        bacon_session = bacon_sessions.async_acquire(
+            entry.entry_id,
+            sub,
+            bacon_region,
+            bacon_topic_filters(
+                sub,
+                (device["deviceId"] for device in bacon_devices),
+                subscribe_all=entry.options.get(CONF_BACON_SUBSCRIBE_ALL, False),
+            ),
+            lambda: BaconMqttClient(client_id, region=bacon_region),
+        )
+        entry.async_on_unload(partial(bacon_sessions.async_release, entry.entry_id))
+        bacon_client = bacon_session.client
+        bacon_lock = bacon_session.lock
+        async with bacon_lock:
+            if not bacon_client.is_connected:
+                try:
+                    await bacon_client.async_connect(bhc.token, sub)
+                except AuthFailedError as err:
+                    raise ConfigEntryAuthFailed from err
+                except (
+                    ApiError,
+                    ClientError,
+                    ClientConnectorError,
+                    TimeoutError,
+                ) as err:
+                    raise ConfigEntryNotReady from err
+        bacon_session.supervisor.async_start()
+
         # A single token owner (refresh tokens are single-use). If there are no
         # pointt coordinators, the first bacon coordinator owns the refresh.
         bacon_auth_provider = len(coordinators) == 0
@@ -288,6 +353,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     bhc,
                     bacon_lock,
                     bacon_auth_provider,
+                    bacon_session,
                 )
             )
             bacon_auth_provider = False
@@ -337,8 +403,74 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Apply the configured interval to all coordinators. Changing it later goes
     # through the options flow, which reloads the entry (OptionsFlowWithReload),
     # re-running this setup — so no config-entry update listener is needed.
+    # With adaptive polling the configured interval is the fastest one; the
+    # bacon coordinator is pushed to and keeps its fixed interval.
+    adaptive = entry.options.get(CONF_ADAPTIVE_POLLING, False)
     for coordinator in entry.runtime_data:
         coordinator.update_interval = _get_update_interval(entry)
+        if adaptive and hasattr(coordinator, "adaptive"):
+            coordinator.adaptive = AdaptivePollInterval(coordinator.update_interval)
+        if (cadence := getattr(coordinator, "cadence", None)) is not None:
+            cadence.base = coordinator.update_interval
+
+    # The first refreshes ran together, so the polls would stay in lockstep:
+    # spread them over the interval instead.
+    staggered = [c for c in entry.runtime_data if hasattr(c, "stagger")]
+    for coordinator, offset in zip(
+        staggered,
+        stagger_offsets(len(staggered), _get_update_interval(entry)),
+        strict=True,
+    ):
+        coordinator.stagger(offset)
+
+    # Hourly energy/temperature history of all bacon ACs in one batched query,
+    # imported into long-term statistics (recorder is an after_dependency).
+    bacon_coordinators = [
+        c for c in coordinators if c.device["deviceType"] == "bacon_rac"
+    ]
+    if bacon_coordinators and "recorder" in hass.config.components:
+        history = BaconHistoryImporter(
+            BaconHistoryClient(
+                websession, bacon_region, lambda: entry.data.get(CONF_TOKEN)
+            ),
+            StatisticsImporter(hass, f"bacon_history.{entry.entry_id}"),
+            {
+                c.device["deviceId"]: c.device_info.get("name") or c.device["deviceId"]
+                for c in bacon_coordinators
+            },
+        )
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                history.async_run,
+                BACON_HISTORY_INTERVAL,
+                name="bosch_homecom bacon history",
+            )
+        )
+        entry.async_create_background_task(
+            hass, history.async_run(), "bosch_homecom bacon history"
+        )
+
+    # Daily energy history of the wallbox charge points, imported the same way.
+    commodule_coordinators = [
+        c for c in coordinators if c.device["deviceType"] == "commodule"
+    ]
+    if commodule_coordinators and "recorder" in hass.config.components:
+        energy_history = EnergyHistoryImporter(
+            commodule_coordinators,
+            StatisticsImporter(hass, f"commodule_history.{entry.entry_id}"),
+        )
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                energy_history.async_run,
+                ENERGY_HISTORY_INTERVAL,
+                name="bosch_homecom energy history",
+            )
+        )
+        entry.async_create_background_task(
+            hass, energy_history.async_run(), "bosch_homecom energy history"
+        )
 
     return True
 
@@ -357,13 +489,21 @@ def _find_coordinator_by_device_id(hass: HomeAssistant, device_id: str):
     return None
 
 
-def _find_bacon_client(hass: HomeAssistant) -> BaconMqttClient | None:
+def _find_bacon_client(
+    hass: HomeAssistant, device_id: str | None = None
+) -> BaconMqttClient | None:
     """Return the shared bacon MQTT client, if any bacon device is set up.
 
-    One client per config entry serves every bacon device on it and is subscribed
-    to the whole user namespace, so any bacon coordinator's client can observe
-    every device.
+    One client per account and region serves every bacon device of the entries
+    sharing it. It is only subscribed to the channels of their selected devices
+    (unless the wildcard debugging option is on), so when ``device_id`` is given
+    the client of the coordinator owning that device is preferred.
     """
+    if device_id is not None:
+        coordinator = _find_coordinator_by_device_id(hass, device_id)
+        client = getattr(coordinator, "client", None)
+        if isinstance(client, BaconMqttClient):
+            return client
     for entry in hass.config_entries.async_entries(DOMAIN):
         for c in getattr(entry, "runtime_data", None) or []:
             client = getattr(c, "client", None)
@@ -429,10 +569,11 @@ async def async_setup(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if coordinator is None:
             _LOGGER.error("Coordinator not found for device %s", device_id)
             return {}
-        result = await coordinator.bhc.async_action_universal_get(
-            device_id,
-            call.data.get("path"),
-        )
+        with request_priority(RequestPriority.DIAGNOSTIC):
+            result = await coordinator.bhc.async_action_universal_get(
+                device_id,
+                call.data.get("path"),
+            )
         return result or {}
 
     # Register our service with Home Assistant.
@@ -464,7 +605,8 @@ async def async_setup(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if not isinstance(paths, list) or not paths:
             _LOGGER.error("paths must be a non-empty list of strings")
             return {}
-        result = await coordinator.bhc.async_request_bulk(device_id, paths)
+        with request_priority(RequestPriority.DIAGNOSTIC):
+            result = await coordinator.bhc.async_request_bulk(device_id, paths)
         return result or {}
 
     # Register our service with Home Assistant.
@@ -520,34 +662,45 @@ async def async_setup(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             float(call.data.get("seconds", CAPTURE_RAW_DEFAULT_SECONDS)),
             CAPTURE_RAW_MAX_SECONDS,
         )
-        client = _find_bacon_client(hass)
+        # Clamped to the services.yaml ranges; the UI enforces them, but a
+        # script calling the service does not go through the selector.
+        max_bytes = min(
+            max(
+                int(call.data.get("max_bytes", CAPTURE_RAW_DEFAULT_BYTES)),
+                CAPTURE_RAW_MIN_BYTES,
+            ),
+            CAPTURE_RAW_MAX_BYTES,
+        )
+        per_topic = min(
+            max(
+                int(call.data.get("per_topic", CAPTURE_RAW_DEFAULT_PER_TOPIC)),
+                CAPTURE_RAW_MIN_PER_TOPIC,
+            ),
+            CAPTURE_RAW_MAX_PER_TOPIC,
+        )
+        serial = str(device_id) if device_id else None
+        client = _find_bacon_client(hass, serial)
         if client is None:
             _LOGGER.error("No bacon (MQTT) devices are set up; nothing to capture")
             return {}
 
-        serial = str(device_id) if device_id else None
-        captured: dict[str, dict[str, Any]] = {}
-
-        @callback
-        def _record(message_serial: str | None, path: str, payload: Any) -> None:
-            if serial is not None and message_serial != serial:
-                return
-            captured[f"{message_serial or '-'}/{path}"] = {
-                "payload": payload,
-                "received_at": dt_util.utcnow().isoformat(),
-            }
+        # Bounded by bytes rather than by the window: a 35-minute capture of a
+        # whole account must not grow memory without limit.
+        buffer = RawCaptureBuffer(max_bytes, per_topic, serial)
 
-        client.register_raw_listener(_record)
+        client.register_raw_listener(buffer.record)
         try:
             await asyncio.sleep(seconds)
         finally:
-            client.remove_raw_listener(_record)
+            client.remove_raw_listener(buffer.record)
 
+        captured = buffer.snapshot()
         return {
             "window_seconds": seconds,
             "device_id": serial,
             "topics_seen": sorted(captured),
             "captured": captured,
+            "buffer": buffer.stats(),
         }
 
     hass.services.async_register(
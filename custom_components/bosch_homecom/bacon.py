@@ -0,0 +1,864 @@
+"""Integration-side helpers for the Matter/Bacon (MQTT device-shadow) transport."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
+import json
+import logging
+import random
+from typing import Any
+
+from aiohttp import ClientSession, ClientTimeout
+from aiohttp.client_exceptions import ClientError
+from homeassistant.const import UnitOfEnergy, UnitOfTemperature
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.unit_conversion import EnergyConverter, TemperatureConverter
+from homecom_alt import (
+    ApiError,
+    BaconMqttClient,
+    MqttNotAuthorizedError,
+    NotRespondingError,
+)
+
+from .const import DOMAIN
+from .scheduler import RequestPriority, request_priority
+from .statistics import StatisticSeries, StatisticsImporter, external_statistic_id
+
+_LOGGER = logging.getLogger(__name__)
+
+# Per-device channels the integration consumes: the state/schedule shadows and
+# the push-only topics (sensor, meta, info). Everything else under users/{sub}/
+# — other devices, sharing and claim traffic — is only of interest when
+# debugging, which is what the opt-in wildcard subscription is for.
+BACON_DEVICE_CHANNELS = ("shadows", "topics")
+
+
+def bacon_topic_filters(
+    sub: str, serials: Iterable[str], *, subscribe_all: bool = False
+) -> list[str]:
+    """Return the MQTT topic filters covering ``serials`` on account ``sub``."""
+    if subscribe_all:
+        return [f"users/{sub}/#"]
+    return [
+        f"users/{sub}/devices/{serial}/{channel}/#"
+        for serial in sorted(set(serials))
+        for channel in BACON_DEVICE_CHANNELS
+    ]
+
+
+class _FilteredSubscriber:
+    """The paho client as seen by the on-connect handler, minus its wildcard.
+
+    ``BaconMqttClient._on_connect`` subscribes to ``users/{sub}/#``; through
+    this proxy that subscribe goes to the session's topic filters instead.
+    Everything else is the paho client itself.
+    """
+
+    def __init__(self, mqtt_client: Any, filters: list[str]) -> None:
+        """Wrap ``mqtt_client``, subscribing to ``filters``."""
+        self._mqtt_client = mqtt_client
+        self._filters = filters
+
+    def subscribe(self, topic: Any, *args: Any, **kwargs: Any) -> Any:
+        """Subscribe to the filters rather than ``topic``, if there are any."""
+        if not self._filters:
+            return self._mqtt_client.subscribe(topic, *args, **kwargs)
+        return self._mqtt_client.subscribe([(f, 0) for f in self._filters])
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward everything else to the paho client."""
+        return getattr(self._mqtt_client, name)
+
+
+class _TopicFilterHook:
+    """Stands in for ``BaconMqttClient._on_connect`` to narrow its subscribe."""
+
+    def __init__(self, on_connect: Callable[..., None]) -> None:
+        """Wrap the client's own on-connect handler."""
+        self.on_connect = on_connect
+        self.filters: list[str] = []
+
+    def __call__(self, mqtt_client: Any, *args: Any, **kwargs: Any) -> None:
+        """Run the handler, which subscribes once the broker accepted us."""
+        self.on_connect(_FilteredSubscriber(mqtt_client, self.filters), *args, **kwargs)
+
+
+def apply_bacon_topic_filters(client: BaconMqttClient, filters: list[str]) -> bool:
+    """Subscribe ``client`` to ``filters`` rather than the whole namespace.
+
+    homecom_alt subscribes to ``users/{sub}/#`` in the client's on-connect
+    handler, re-run on every (re)connect as the broker uses clean start. The
+    handler is wrapped once so that subscribe goes to ``filters``. On a live
+    session the change is made straight away — the new filters subscribed,
+    then the dropped ones unsubscribed — so entries joining or leaving a
+    shared session never force a reconnect. Returns False, leaving the
+    wildcard in place, for a client without that handler.
+    """
+    on_connect = getattr(client, "_on_connect", None)
+    if on_connect is None:
+        _LOGGER.debug(
+            "homecom_alt has no bacon on-connect handler; keeping the wildcard"
+            " bacon subscription"
+        )
+        return False
+    if not isinstance(on_connect, _TopicFilterHook):
+        on_connect = client._on_connect = _TopicFilterHook(on_connect)
+    previous, on_connect.filters = on_connect.filters, list(filters)
+    mqtt_client = getattr(client, "_client", None)
+    if not client.is_connected or mqtt_client is None or not previous:
+        return True
+    if added := [f for f in filters if f not in previous]:
+        mqtt_client.subscribe([(f, 0) for f in added])
+    if removed := [f for f in previous if f not in filters]:
+        mqtt_client.unsubscribe(removed)
+    return True
+
+
+class _DisconnectHook:
+    """Stands in for ``BaconMqttClient._on_disconnect`` to report drops."""
+
+    def __init__(self, on_disconnect: Callable[..., None]) -> None:
+        """Wrap the client's own on-disconnect handler."""
+        self.on_disconnect = on_disconnect
+        self.listeners: list[Callable[[], None]] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:
+        """Run the handler, then tell the listeners, on paho's network thread."""
+        self.on_disconnect(*args, **kwargs)
+        for listener in list(self.listeners):
+            listener()
+
+
+def hook_bacon_disconnect(
+    client: BaconMqttClient, listener: Callable[[], None]
+) -> CALLBACK_TYPE | None:
+    """Call ``listener`` from paho's network thread whenever ``client`` drops.
+
+    homecom_alt hands its on-disconnect handler to every paho client it
+    creates, so the handler is wrapped once, like the on-connect one in
+    apply_bacon_topic_filters. Returns a callable removing the listener, or
+    None for a client without that handler.
+    """
+    on_disconnect = getattr(client, "_on_disconnect", None)
+    if on_disconnect is None:
+        _LOGGER.debug("homecom_alt has no bacon on-disconnect handler")
+        return None
+    if not isinstance(on_disconnect, _DisconnectHook):
+        on_disconnect = client._on_disconnect = _DisconnectHook(on_disconnect)
+    hook: _DisconnectHook = on_disconnect
+    hook.listeners.append(listener)
+
+    def _remove() -> None:
+        if listener in hook.listeners:
+            hook.listeners.remove(listener)
+
+    return _remove
+
+
+# The back-off between the supervisor's reconnect attempts: 1, 2, 4 ... seconds,
+# capped, each scaled by a random factor in [0.5, 1] so clients that lost the
+# broker together do not retry in lockstep.
+BACON_BACKOFF_INITIAL = 1.0
+BACON_BACKOFF_MAX = 300.0
+
+
+def bacon_backoff_delay(attempt: int) -> float:
+    """Return the jittered delay in seconds before reconnect ``attempt``."""
+    delay = min(BACON_BACKOFF_MAX, BACON_BACKOFF_INITIAL * 2**attempt)
+    return delay * random.uniform(0.5, 1.0)
+
+
+class BaconConnectionSupervisor:
+    """Notice a dropped bacon session and bring it back with back-off.
+
+    The coordinators only reconnect on their next poll, up to a full update
+    interval after a broker blip. The supervisor hears of the drop from the
+    client's on-disconnect handler instead and retries straight away, with
+    jittered exponential back-off. The connect itself is delegated to a coordinator's
+    connector, which knows how to get a token and retry a refused one. When the
+    session is back, ``signal`` is dispatched so every bacon coordinator of the
+    session refreshes straight away.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, client: BaconMqttClient, lock: asyncio.Lock
+    ) -> None:
+        """Initialize a stopped supervisor for ``client``."""
+        self.hass = hass
+        self.client = client
+        self.lock = lock
+        self.signal = f"{DOMAIN}_bacon_connected_{id(client)}"
+        self.state = "connected" if client.is_connected else "disconnected"
+        self.disconnects = 0
+        self.reconnects = 0
+        self.failed_attempts = 0
+        self.last_connected: datetime | None = None
+        self.last_disconnected: datetime | None = None
+        self._connectors: list[Callable[[], Awaitable[None]]] = []
+        self._unsub_disconnect: CALLBACK_TYPE | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_add_connector(
+        self, connector: Callable[[], Awaitable[None]]
+    ) -> CALLBACK_TYPE:
+        """Register a coroutine function that reconnects the session."""
+        self._connectors.append(connector)
+
+        @callback
+        def _remove() -> None:
+            if connector in self._connectors:
+                self._connectors.remove(connector)
+
+        return _remove
+
+    @callback
+    def async_start(self) -> None:
+        """Start watching the session."""
+        if self.client.is_connected and self.last_connected is None:
+            self.state = "connected"
+            self.last_connected = dt_util.utcnow()
+        if self._unsub_disconnect is None:
+            self._unsub_disconnect = hook_bacon_disconnect(
+                self.client, self._on_disconnect
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching; an intentional disconnect follows."""
+        if self._unsub_disconnect is not None:
+            self._unsub_disconnect()
+            self._unsub_disconnect = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _on_disconnect(self) -> None:
+        # On paho's network thread, after the client queued its own state
+        # change on the loop; the check is queued behind it.
+        self.hass.loop.call_soon_threadsafe(self._async_check)
+
+    @callback
+    def _async_check(self) -> None:
+        if self._task is not None:
+            return
+        if self.lock.locked():
+            # A connect in progress (a coordinator renewing the token) drops
+            # the session on purpose; look again once it is done.
+            self._task = self.hass.async_create_background_task(
+                self._async_check_after_connect(),
+                name=f"{DOMAIN} bacon supervisor",
+            )
+            return
+        if self.client.is_connected:
+            if self.state != "connected":
+                # A coordinator poll got there first.
+                self._async_connected()
+            return
+        if self.state == "connected":
+            self.disconnects += 1
+            self.last_disconnected = dt_util.utcnow()
+            _LOGGER.debug("Bacon MQTT session dropped, reconnecting")
+        self.state = "reconnecting"
+        self._task = self.hass.async_create_background_task(
+            self._async_reconnect(), name=f"{DOMAIN} bacon reconnect"
+        )
+
+    async def _async_check_after_connect(self) -> None:
+        try:
+            async with self.lock:
+                pass
+        finally:
+            self._task = None
+        self._async_check()
+
+    async def _async_reconnect(self) -> None:
+        attempt = 0
+        try:
+            while not self.client.is_connected and self._connectors:
+                await asyncio.sleep(bacon_backoff_delay(attempt))
+                if self.client.is_connected or not self._connectors:
+                    break
+                try:
+                    await self._connectors[0]()
+                except (
+                    ApiError,
+                    ClientError,
+                    MqttNotAuthorizedError,
+                    NotRespondingError,
+                    OSError,
+                    TimeoutError,
+                    UpdateFailed,
+                ) as err:
+                    self.failed_attempts += 1
+                    attempt += 1
+                    _LOGGER.debug("Bacon reconnect attempt %s failed: %s", attempt, err)
+        finally:
+            self._task = None
+        if self.client.is_connected:
+            self._async_connected()
+        else:
+            self.state = "disconnected"
+
+    @callback
+    def _async_connected(self) -> None:
+        self.state = "connected"
+        self.reconnects += 1
+        self.last_connected = dt_util.utcnow()
+        _LOGGER.debug("Bacon MQTT session is back (reconnect %s)", self.reconnects)
+        async_dispatcher_send(self.hass, self.signal)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the connection state and counters."""
+        return {
+            "state": self.state,
+            "connected": bool(self.client.is_connected),
+            "disconnects": self.disconnects,
+            "reconnects": self.reconnects,
+            "failed_attempts": self.failed_attempts,
+            "last_connected": self.last_connected,
+            "last_disconnected": self.last_disconnected,
+        }
+
+
+@dataclass(slots=True)
+class SharedBaconSession:
+    """One bacon MQTT session and the config entries using it.
+
+    ``lock`` serializes every connect on the session, whichever entry's
+    coordinator triggers it. ``filters`` holds each entry's topic filters; the
+    client subscribes to their union. ``listeners`` holds the shadow listeners
+    per serial of the entries currently loaded.
+    """
+
+    client: BaconMqttClient
+    supervisor: BaconConnectionSupervisor
+    lock: asyncio.Lock
+    filters: dict[str, list[str]] = field(default_factory=dict)
+    listeners: dict[str, list[Callable[[dict], None]]] = field(default_factory=dict)
+
+    def topic_filters(self) -> list[str]:
+        """Return the union of the entries' filters.
+
+        An entry with the wildcard debugging option covers everything, so the
+        per-device filters are redundant next to it.
+        """
+        union = {f for filters in self.filters.values() for f in filters}
+        wildcards = {f for f in union if "/devices/" not in f}
+        return sorted(wildcards or union)
+
+    @callback
+    def async_listen(
+        self, serial: str, listener: Callable[[dict], None]
+    ) -> CALLBACK_TYPE:
+        """Pass ``serial``'s shadow updates to ``listener`` until removed.
+
+        BaconMqttClient cannot unregister a listener and the session outlives
+        reloads of the entries on it, so the client gets one dispatcher per
+        serial for good, which calls the listeners registered here.
+        """
+        if serial not in self.listeners:
+            self.listeners[serial] = []
+            self.client.register_listener(serial, partial(self._dispatch, serial))
+        self.listeners[serial].append(listener)
+
+        @callback
+        def _remove() -> None:
+            if listener in self.listeners[serial]:
+                self.listeners[serial].remove(listener)
+
+        return _remove
+
+    @callback
+    def _dispatch(self, serial: str, state: dict) -> None:
+        for listener in list(self.listeners[serial]):
+            listener(state)
+
+
+class BaconSessionRegistry:
+    """Domain-wide bacon MQTT sessions, one per account (``sub``) and region.
+
+    Config entries of the same account — e.g. a Bosch and a Buderus entry, or
+    one entry per site — share a single WebSocket session instead of each
+    opening their own and decoding every message twice. Sessions are reference
+    counted by entry and disconnected when the last entry releases them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty registry."""
+        self.hass = hass
+        self._sessions: dict[tuple[str, str], SharedBaconSession] = {}
+
+    @callback
+    def async_acquire(
+        self,
+        entry_id: str,
+        sub: str,
+        region: str,
+        filters: list[str],
+        create: Callable[[], BaconMqttClient],
+    ) -> SharedBaconSession:
+        """Join (or open) the session of ``sub``/``region`` for an entry.
+
+        The entry's filters are added to a live session's subscriptions in
+        place, so joining never forces a reconnect.
+        """
+        session = self._sessions.get((sub, region))
+        if session is None:
+            client = create()
+            lock = asyncio.Lock()
+            session = self._sessions[(sub, region)] = SharedBaconSession(
+                client, BaconConnectionSupervisor(self.hass, client, lock), lock
+            )
+        session.filters[entry_id] = filters
+        apply_bacon_topic_filters(session.client, session.topic_filters())
+        return session
+
+    async def async_release(self, entry_id: str) -> None:
+        """Drop an entry; disconnect sessions no entry uses any more."""
+        for key, session in list(self._sessions.items()):
+            if session.filters.pop(entry_id, None) is None:
+                continue
+            if session.filters:
+                apply_bacon_topic_filters(session.client, session.topic_filters())
+                continue
+            del self._sessions[key]
+            session.supervisor.async_stop()
+            await session.client.async_disconnect()
+
+    def clients(self) -> list[BaconMqttClient]:
+        """Return every open session's client."""
+        return [session.client for session in self._sessions.values()]
+
+
+BACON_SESSIONS: HassKey[BaconSessionRegistry] = HassKey(f"{DOMAIN}_bacon_sessions")
+
+
+@callback
+def async_get_bacon_sessions(hass: HomeAssistant) -> BaconSessionRegistry:
+    """Return the domain's bacon session registry, creating it on first use."""
+    if BACON_SESSIONS not in hass.data:
+        hass.data[BACON_SESSIONS] = BaconSessionRegistry(hass)
+    return hass.data[BACON_SESSIONS]
+
+
+def _payload_size(payload: Any) -> int:
+    """Estimate the memory/dump cost of a decoded payload as compact JSON."""
+    try:
+        return len(json.dumps(payload, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return len(repr(payload))
+
+
+class RawCaptureBuffer:
+    """Ring buffer of raw bacon MQTT messages bounded by a byte budget.
+
+    Messages are grouped under ``"{serial}/{channel_path}"`` — the same keys as
+    ``BaconMqttClient.raw_snapshot()`` — and at most ``per_topic`` are retained
+    per key. Whenever the estimated size of everything retained exceeds
+    ``max_bytes`` the oldest message across all keys is evicted, so a long
+    capture on a busy account holds a bounded amount of memory. A message larger
+    than the whole budget is never stored; it only counts towards ``dropped``.
+    """
+
+    def __init__(
+        self, max_bytes: int, per_topic: int = 1, serial: str | None = None
+    ) -> None:
+        """Initialize an empty buffer, optionally limited to one device."""
+        self.max_bytes = max_bytes
+        self.per_topic = max(1, per_topic)
+        self.serial = serial
+        self.size = 0
+        self.received = 0
+        self.evicted = 0
+        self.dropped = 0
+        self._seq = 0
+        self._topics: dict[str, deque[tuple[int, int, dict[str, Any]]]] = {}
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: dict[str, Any], max_bytes: int
+    ) -> RawCaptureBuffer:
+        """Bound an existing ``raw_snapshot()`` dict to ``max_bytes``.
+
+        Entries are replayed oldest first (by their ISO ``received_at``), so the
+        budget keeps the most recent ones.
+        """
+        buffer = cls(max_bytes)
+        entries = [
+            (key, entry) for key, entry in snapshot.items() if isinstance(entry, dict)
+        ]
+        entries.sort(key=lambda item: str(item[1].get("received_at") or ""))
+        for key, entry in entries:
+            buffer._store(key, entry)
+        return buffer
+
+    @callback
+    def record(self, serial: str | None, path: str, payload: Any) -> None:
+        """Raw listener for ``BaconMqttClient.register_raw_listener``."""
+        if self.serial is not None and serial != self.serial:
+            return
+        self._store(
+            f"{serial or '-'}/{path}",
+            {"payload": payload, "received_at": dt_util.utcnow().isoformat()},
+        )
+
+    def _store(self, key: str, entry: dict[str, Any]) -> None:
+        self.received += 1
+        size = _payload_size(entry.get("payload"))
+        if size > self.max_bytes:
+            self.dropped += 1
+            return
+
+        entries = self._topics.get(key)
+        if entries is None:
+            entries = self._topics[key] = deque()
+        elif len(entries) >= self.per_topic:
+            self.size -= entries.popleft()[1]
+            self.evicted += 1
+        self._seq += 1
+        entries.append((self._seq, size, entry))
+        self.size += size
+
+        # The message just stored is the newest and fits the budget on its own,
+        # so it is always the last one standing.
+        while self.size > self.max_bytes:
+            oldest = min(self._topics, key=lambda k: self._topics[k][0][0])
+            oldest_entries = self._topics[oldest]
+            self.size -= oldest_entries.popleft()[1]
+            self.evicted += 1
+            if not oldest_entries:
+                del self._topics[oldest]
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the latest message per key, older retained ones under previous.
+
+        With the default ``per_topic=1`` this has exactly the shape of
+        ``BaconMqttClient.raw_snapshot()``.
+        """
+        snapshot: dict[str, dict[str, Any]] = {}
+        for key, entries in self._topics.items():
+            *older, (_, _, latest) = entries
+            item = dict(latest)
+            if older:
+                item["previous"] = [entry for _, _, entry in older]
+            snapshot[key] = item
+        return snapshot
+
+    def stats(self) -> dict[str, int]:
+        """Return counters describing what the budget kept and discarded."""
+        return {
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "messages": sum(len(entries) for entries in self._topics.values()),
+            "received": self.received,
+            "evicted": self.evicted,
+            "dropped": self.dropped,
+        }
+
+
+# --- history (GraphQL) ---
+
+BACON_HISTORY_URL = "https://history.{region}.bacon.bosch-tt-cw.com/graphql"
+BACON_HISTORY_TIMEOUT = ClientTimeout(total=30)
+BACON_HISTORY_INTERVAL = timedelta(hours=1)
+# How far back the first import reaches, and the longest gap a later import
+# catches up on after Home Assistant was down.
+BACON_HISTORY_BACKFILL = timedelta(days=30)
+# How long after an hour ended the cloud may still deliver it. Until then a
+# series without data keeps its cursor, so the hour is asked for again.
+BACON_HISTORY_GRACE = timedelta(hours=6)
+# Safety bound on nextToken pagination of a single query.
+BACON_HISTORY_MAX_PAGES = 50
+
+RAC_HOURLY_CONSUMPTIONS_QUERY = """
+query getRacHourlyExtendedConsumptions(
+  $serialNumbers: [String!]!, $start: AWSTimestamp!, $end: AWSTimestamp!,
+  $currentTimeZoneOffset: Int!, $firstDayOfWeek: Int!, $nextToken: String
+) {
+  cumulateRacEmonRecords(
+    serialNumbers: $serialNumbers, start: $start, end: $end, interval: HOURLY,
+    currentTimeZoneOffset: $currentTimeZoneOffset,
+    firstDayOfWeek: $firstDayOfWeek, nextToken: $nextToken
+  ) {
+    items {
+      timestamp
+      totalElectricalEnergyConsumptionHeat
+      totalElectricalEnergyConsumptionCool
+      totalElectricalEnergyConsumptionDry
+      totalElectricalEnergyConsumptionFan
+    }
+    nextToken
+  }
+}
+"""
+
+RAC_HOURLY_SENSOR_VALUES_QUERY = """
+query getRacHourlySensorValues(
+  $serialNumbers: [String!]!, $start: AWSTimestamp!, $end: AWSTimestamp!,
+  $currentTimeZoneOffset: Int!, $firstDayOfWeek: Int!, $nextToken: String
+) {
+  cumulateRacBaseRecords(
+    serialNumbers: $serialNumbers, start: $start, end: $end, interval: HOURLY,
+    currentTimeZoneOffset: $currentTimeZoneOffset,
+    firstDayOfWeek: $firstDayOfWeek, nextToken: $nextToken
+  ) {
+    items {
+      timestamp
+      roomTemperature
+    }
+    nextToken
+  }
+}
+"""
+
+# Consumption field -> operation mode used in the statistic id.
+RAC_ENERGY_FIELDS = {
+    "totalElectricalEnergyConsumptionHeat": "heat",
+    "totalElectricalEnergyConsumptionCool": "cool",
+    "totalElectricalEnergyConsumptionDry": "dry",
+    "totalElectricalEnergyConsumptionFan": "fan",
+}
+
+
+def _history_timestamp(value: Any) -> datetime | None:
+    """Parse a history timestamp (epoch seconds/milliseconds or ISO string)."""
+    if isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 1e11 else value
+        return dt_util.utc_from_timestamp(seconds)
+    if isinstance(value, str):
+        if value.isdigit():
+            return _history_timestamp(int(value))
+        parsed = dt_util.parse_datetime(value)
+        return dt_util.as_utc(parsed) if parsed else None
+    return None
+
+
+def _history_page(data: Any) -> dict[str, Any]:
+    """Return the ``{items, nextToken}`` connection of a query response."""
+    if isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, dict) and "items" in value:
+                return value
+    return {}
+
+
+class BaconHistoryClient:
+    """Client for the bacon history GraphQL endpoint.
+
+    The ``cumulate*`` resolvers take a list of serial numbers but add their
+    records up into one series, with no serial number on the items, so every
+    query is made for a single device.
+    """
+
+    def __init__(
+        self,
+        websession: ClientSession,
+        region: str,
+        token: Callable[[], str | None],
+    ) -> None:
+        """Initialize the client; ``token`` returns the current access token."""
+        self._websession = websession
+        self._url = BACON_HISTORY_URL.format(region=region)
+        self._token = token
+
+    async def async_query_items(
+        self,
+        operation: str,
+        query: str,
+        serial: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, Any]]:
+        """Run an hourly history query over ``[start, end)``, following nextToken."""
+        variables: dict[str, Any] = {
+            "serialNumbers": [serial],
+            "start": int(start.timestamp()),
+            "end": int(end.timestamp()),
+            # Hourly buckets are kept in UTC; the offset only shifts day/week
+            # boundaries, which the statistics do not use.
+            "currentTimeZoneOffset": 0,
+            "firstDayOfWeek": 1,
+            "nextToken": None,
+        }
+        items: list[dict[str, Any]] = []
+        for _ in range(BACON_HISTORY_MAX_PAGES):
+            page = _history_page(await self._async_post(operation, query, variables))
+            items.extend(item for item in page.get("items") or [] if item)
+            if not page.get("nextToken"):
+                break
+            variables = {**variables, "nextToken": page["nextToken"]}
+        else:
+            _LOGGER.debug(
+                "%s: stopped after %s pages", operation, BACON_HISTORY_MAX_PAGES
+            )
+        return items
+
+    async def _async_post(
+        self, operation: str, query: str, variables: dict[str, Any]
+    ) -> Any:
+        token = self._token()
+        if not token:
+            raise ApiError("No access token for the bacon history API")
+        async with self._websession.post(
+            self._url,
+            json={
+                "operationName": operation,
+                "query": query,
+                "variables": variables,
+            },
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=BACON_HISTORY_TIMEOUT,
+        ) as response:
+            if response.status != 200:
+                raise ApiError(f"{operation} failed with HTTP {response.status}")
+            body = await response.json()
+        if body.get("errors"):
+            raise ApiError(f"{operation} failed: {body['errors']}")
+        return body.get("data")
+
+
+class BaconHistoryImporter:
+    """Hourly import of AC energy per mode and room temperature into statistics.
+
+    Each run asks, per device, for the completed hours after its oldest
+    cursor. A series that had nothing in those hours, such as a mode that was
+    not used, still has its cursor moved up to the newest hour its own query
+    reported, so it does not hold the next window back; hours no query
+    reported are only skipped once BACON_HISTORY_GRACE has passed. The
+    importer's cursors make reruns and restarts idempotent.
+    """
+
+    def __init__(
+        self,
+        client: BaconHistoryClient,
+        statistics: StatisticsImporter,
+        devices: dict[str, str],
+    ) -> None:
+        """Initialize the importer for ``devices`` (serial -> display name)."""
+        self.client = client
+        self.statistics = statistics
+        self.devices = devices
+        self._running = False
+
+    def _series(self, serial: str) -> list[tuple[str | None, StatisticSeries]]:
+        name = self.devices[serial]
+        series: list[tuple[str | None, StatisticSeries]] = [
+            (
+                key,
+                StatisticSeries(
+                    external_statistic_id(serial, f"energy_{mode}"),
+                    f"{name} energy ({mode})",
+                    UnitOfEnergy.KILO_WATT_HOUR,
+                    EnergyConverter.UNIT_CLASS,
+                ),
+            )
+            for key, mode in RAC_ENERGY_FIELDS.items()
+        ]
+        series.append(
+            (
+                None,
+                StatisticSeries(
+                    external_statistic_id(serial, "room_temperature"),
+                    f"{name} room temperature",
+                    UnitOfTemperature.CELSIUS,
+                    TemperatureConverter.UNIT_CLASS,
+                    kind="mean",
+                ),
+            )
+        )
+        return series
+
+    def _window_start(self, serial: str, end: datetime) -> datetime:
+        """Return the hour after the device's oldest cursor, within the backfill."""
+        earliest = end - BACON_HISTORY_BACKFILL
+        starts = []
+        for _, series in self._series(serial):
+            last = self.statistics.last_start(series.statistic_id)
+            starts.append(earliest if last is None else last + BACON_HISTORY_INTERVAL)
+        return max(earliest, min(starts, default=earliest))
+
+    @staticmethod
+    def _covered(items: list[dict[str, Any]], end: datetime) -> datetime:
+        """Return the newest hour before ``end`` a query's items are final up to.
+
+        That is the newest hour the query reported, or the newest one that
+        ended BACON_HISTORY_GRACE ago, whichever is later.
+        """
+        covered = end - BACON_HISTORY_GRACE - BACON_HISTORY_INTERVAL
+        for item in items:
+            start = _history_timestamp(item.get("timestamp"))
+            if start is not None and covered < start < end:
+                covered = start
+        return covered
+
+    @staticmethod
+    def _buckets(
+        items: list[dict[str, Any]], key: str, end: datetime
+    ) -> list[tuple[datetime, float]]:
+        """Return the hourly (start, value) of ``key`` in ``items`` before ``end``."""
+        buckets = []
+        for item in items:
+            start = _history_timestamp(item.get("timestamp"))
+            value = item.get(key)
+            # Only completed hours; the running one is still accumulating.
+            if start is not None and start < end and isinstance(value, (int, float)):
+                buckets.append((start, float(value)))
+        return buckets
+
+    async def async_run(self, now: datetime | None = None) -> None:
+        """Import the hours completed since the last run."""
+        if self._running or not self.devices:
+            return
+        self._running = True
+        try:
+            with request_priority(RequestPriority.BACKGROUND):
+                await self._async_import()
+        except (ApiError, ClientError, TimeoutError, ValueError) as err:
+            # The cursors did not move; the next run fetches the same hours.
+            _LOGGER.debug("Bacon history import failed: %s", err)
+        finally:
+            self._running = False
+
+    async def _async_import(self) -> None:
+        await self.statistics.async_load()
+        end = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        for serial in sorted(self.devices):
+            start = self._window_start(serial, end)
+            if start >= end:
+                continue
+            energy = await self.client.async_query_items(
+                "getRacHourlyExtendedConsumptions",
+                RAC_HOURLY_CONSUMPTIONS_QUERY,
+                serial,
+                start,
+                end,
+            )
+            sensors = await self.client.async_query_items(
+                "getRacHourlySensorValues",
+                RAC_HOURLY_SENSOR_VALUES_QUERY,
+                serial,
+                start,
+                end,
+            )
+            # Each series is covered as far as its own query reported: a late
+            # sensor query does not skip hours because the energy one is in.
+            energy_covered = self._covered(energy, end)
+            sensors_covered = self._covered(sensors, end)
+            for key, series in self._series(serial):
+                if key is not None:
+                    buckets = self._buckets(energy, key, end)
+                    covered = energy_covered
+                else:
+                    buckets = self._buckets(sensors, "roomTemperature", end)
+                    covered = sensors_covered
+                await self.statistics.async_add(series, buckets, covered=covered)
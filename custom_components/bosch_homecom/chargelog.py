@@ -0,0 +1,189 @@
+"""Incremental sync of wallbox charge logs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import EnergyConverter
+
+from .const import CHARGELOG_MAX_SESSIONS, DOMAIN, EVENT_CHARGE_SESSION
+from .statistics import StatisticSeries, StatisticsImporter, external_statistic_id
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+
+def chargelog_sessions(chargelog: Any) -> list[dict[str, Any]]:
+    """Return the sessions in a charge point's log, newest first."""
+    if isinstance(chargelog, dict):
+        chargelog = chargelog.get("sessions") or chargelog.get("values") or []
+    if not isinstance(chargelog, list):
+        return []
+    return [session for session in chargelog if isinstance(session, dict)]
+
+
+def _float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def session_summary(session: dict[str, Any]) -> dict[str, Any]:
+    """Return what is kept of a logged session: times, energy and cost."""
+    cost = session.get("cost") if isinstance(session.get("cost"), dict) else {}
+    return {
+        "begin": session.get("begin"),
+        "end": session.get("end"),
+        "energy": _float(session.get("energy")),
+        "charging_duration": session.get("chargingDuration"),
+        "cost": _float(cost.get("total")),
+        "currency": cost.get("currency"),
+    }
+
+
+class ChargelogSync:
+    """Keep the charge logs of one wallbox, adding only sessions not seen yet.
+
+    The logs come with the coordinator's full reads; nothing is downloaded
+    here. Sessions are keyed by their begin time and persisted, so each sync
+    walks the log from the newest session back to the first one already known. A new session
+    fires EVENT_CHARGE_SESSION; the energy and cost of all sessions are
+    imported into long-term statistics, by the hour the session ended. The
+    first log with sessions read for a charge point is only recorded, without
+    events; an empty or failed read leaves the charge point unknown.
+    """
+
+    def __init__(self, hass: HomeAssistant, device_id: str, name: str) -> None:
+        """Initialize the sync with its own storage file."""
+        self.hass = hass
+        self.device_id = device_id
+        self.name = name
+        self.statistics = StatisticsImporter(hass, f"chargelog.{device_id}")
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.chargelog.{device_id}"
+        )
+        # Charge point id -> session begin -> summary.
+        self._sessions: dict[str, dict[str, dict[str, Any]]] | None = None
+        # Charge point id -> newest session and length of the last log read.
+        self.latest: dict[str, dict[str, Any]] = {}
+        self.logged: dict[str, int] = {}
+        self.last_sync: datetime | None = None
+        self.new_sessions = 0
+
+    async def async_load(self) -> None:
+        """Load the persisted sessions once."""
+        if self._sessions is None:
+            stored = await self._store.async_load() or {}
+            self._sessions = stored.get("sessions") or {}
+
+    def sessions(self, cp_id: str) -> list[dict[str, Any]]:
+        """Return the stored sessions of a charge point, newest first."""
+        known = (self._sessions or {}).get(cp_id) or {}
+        return [known[begin] for begin in sorted(known, reverse=True)]
+
+    async def async_sync(self, chargelogs: dict[str, Any]) -> int:
+        """Add the sessions logged since the last sync; return how many.
+
+        ``chargelogs`` maps charge point ids to their logs as read by a poll,
+        None where the read failed.
+        """
+        await self.async_load()
+        assert self._sessions is not None
+        added = 0
+        changed = False
+        for cp_id, chargelog in chargelogs.items():
+            if not (logged := chargelog_sessions(chargelog)):
+                # Nothing read: a charge point not known yet stays unknown, so
+                # its first real log is recorded rather than announced.
+                continue
+            self.latest[cp_id] = logged[0]
+            self.logged[cp_id] = len(logged)
+            first = cp_id not in self._sessions
+            known = self._sessions.setdefault(cp_id, {})
+            fresh: list[dict[str, Any]] = []
+            for session in logged:
+                begin = session.get("begin")
+                if not begin:
+                    continue
+                if begin in known:
+                    # The log is newest first; the rest is known already.
+                    break
+                fresh.append(session_summary(session))
+            for summary in reversed(fresh):
+                known[summary["begin"]] = summary
+                if not first:
+                    self.hass.bus.async_fire(
+                        EVENT_CHARGE_SESSION,
+                        {"device_id": self.device_id, "charge_point": cp_id} | summary,
+                    )
+            for begin in sorted(known)[:-CHARGELOG_MAX_SESSIONS]:
+                del known[begin]
+            changed = changed or first or bool(fresh)
+            if not first:
+                added += len(fresh)
+            await self._async_import(cp_id)
+        self.last_sync = dt_util.utcnow()
+        self.new_sessions += added
+        if changed:
+            self._store.async_delay_save(
+                lambda: {"sessions": self._sessions or {}}, STORAGE_SAVE_DELAY
+            )
+        if added:
+            _LOGGER.debug("Device %s: %s new charge sessions", self.device_id, added)
+        return added
+
+    async def _async_import(self, cp_id: str) -> None:
+        """Import the energy and cost of the sessions that ended in past hours."""
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        energy: list[tuple[datetime, float]] = []
+        cost: list[tuple[datetime, float]] = []
+        currency = None
+        for summary in self.sessions(cp_id):
+            ended = dt_util.parse_datetime(summary.get("end") or "")
+            if ended is None or dt_util.as_utc(ended) >= hour:
+                # The hour is still running; later sessions may join it.
+                continue
+            if summary["energy"] is not None:
+                energy.append((ended, summary["energy"]))
+            if summary["cost"] is not None and summary.get("currency"):
+                currency = summary["currency"]
+                cost.append((ended, summary["cost"]))
+        await self.statistics.async_add(
+            StatisticSeries(
+                external_statistic_id(self.device_id, f"{cp_id}_charged_energy"),
+                f"{self.name} {cp_id} charged energy",
+                UnitOfEnergy.KILO_WATT_HOUR,
+                EnergyConverter.UNIT_CLASS,
+            ),
+            energy,
+        )
+        if currency is not None:
+            await self.statistics.async_add(
+                StatisticSeries(
+                    external_statistic_id(self.device_id, f"{cp_id}_charging_cost"),
+                    f"{self.name} {cp_id} charging cost",
+                    currency,
+                    None,
+                ),
+                cost,
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Return the stored session counts for diagnostics."""
+        return {
+            "last_sync": self.last_sync.isoformat() if self.last_sync else None,
+            "new_sessions": self.new_sessions,
+            "stored_sessions": {
+                cp_id: len(sessions)
+                for cp_id, sessions in (self._sessions or {}).items()
+            },
+        }
@@ -22,7 +22,7 @@ from homeassistant.components.climate import (
     HVACAction,
     HVACMode,
 )
-from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.const import ATTR_TEMPERATURE, Platform, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -34,6 +34,7 @@ from .coordinator import (
     BoschComModuleCoordinatorRac,
     BoschComModuleCoordinatorRrc2,
 )
+from .structure import async_track_structure
 
 PARALLEL_UPDATES = 1
 
@@ -62,23 +63,27 @@ async def async_setup_entry(
         elif device_type == "bacon_rac":
             entities.append(BoschComBaconRacClimate(coordinator=coordinator))
         elif device_type in ("k40", "k30", "icom"):
-            for ref in coordinator.data.heating_circuits:
-                hc_id = ref["id"].split("/")[-1]
-                entities.append(
-                    BoschComK40Climate(coordinator=coordinator, field=hc_id)
-                )
-        if device_type in ("k40", "k30"):
-            for ref in coordinator.data.zones or []:
-                zone_id = ref["id"].split("/")[-1]
-                entities.append(
-                    BoschComZoneClimate(coordinator=coordinator, field=zone_id)
-                )
+            k40_climates = _build_k40_climates(coordinator)
+            entities.extend(k40_climates)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.CLIMATE,
+                _build_k40_climates,
+                k40_climates,
+                async_add_entities,
+            )
         if device_type == "rrc2":
-            for ref in coordinator.data.zones or []:
-                zone_id = ref["id"].split("/")[-1]
-                entities.append(
-                    BoschComRrc2ZoneClimate(coordinator=coordinator, field=zone_id)
-                )
+            rrc2_climates = _build_rrc2_climates(coordinator)
+            entities.extend(rrc2_climates)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.CLIMATE,
+                _build_rrc2_climates,
+                rrc2_climates,
+                async_add_entities,
+            )
     if entities:
         async_add_entities(entities)
 
@@ -754,6 +759,32 @@ class BoschComRrc2ZoneClimate(CoordinatorEntity, ClimateEntity):
         return entry.get("temperatureHeatingSetpoint") or {}
 
 
+def _build_k40_climates(
+    coordinator: BoschComModuleCoordinatorK40 | BoschComModuleCoordinatorIcom,
+) -> list[ClimateEntity]:
+    """Build the heating circuit and zone climates of a K40/K30/ICOM device."""
+    entities: list[ClimateEntity] = [
+        BoschComK40Climate(coordinator=coordinator, field=ref["id"].split("/")[-1])
+        for ref in coordinator.data.heating_circuits
+    ]
+    if coordinator.data.device.get("deviceType") in ("k40", "k30"):
+        entities.extend(
+            BoschComZoneClimate(coordinator=coordinator, field=ref["id"].split("/")[-1])
+            for ref in coordinator.data.zones or []
+        )
+    return entities
+
+
+def _build_rrc2_climates(
+    coordinator: BoschComModuleCoordinatorRrc2,
+) -> list[ClimateEntity]:
+    """Build the RRC2 zone climates for one device."""
+    return [
+        BoschComRrc2ZoneClimate(coordinator=coordinator, field=ref["id"].split("/")[-1])
+        for ref in coordinator.data.zones or []
+    ]
+
+
 # --- Bacon (Matter-commissioned) RAC over MQTT device-shadow -----------------
 
 BACON_OP_MODE_TO_HVAC: dict[str, HVACMode] = {
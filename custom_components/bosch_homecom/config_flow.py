@@ -31,7 +31,9 @@ from homecom_alt.const import BACON_DEFAULT_REGION, BACON_KNOWN_REGIONS
 import voluptuous as vol
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_BACON_REGION,
+    CONF_BACON_SUBSCRIBE_ALL,
     CONF_BRAND_BUDERUS,
     CONF_DEVICES,
     CONF_REFRESH,
@@ -337,16 +339,24 @@ class BoschHomeComOptionsFlowHandler(config_entries.OptionsFlowWithReload):
         )
         current_brand_buderus = self._entry.options.get(CONF_BRAND_BUDERUS, False)
         current_wb_label = self._entry.options.get(CONF_WB_LABEL, DEFAULT_WB_LABEL)
+        current_subscribe_all = self._entry.options.get(CONF_BACON_SUBSCRIBE_ALL, False)
+        current_adaptive = self._entry.options.get(CONF_ADAPTIVE_POLLING, False)
 
         schema = vol.Schema(
             {
                 vol.Required(CONF_UPDATE_SECONDS, default=current_seconds): vol.All(
                     int, vol.Range(min=MIN_UPDATE_SECONDS, max=MAX_UPDATE_SECONDS)
                 ),
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING, default=current_adaptive
+                ): cv.boolean,
                 vol.Required(
                     CONF_BRAND_BUDERUS, default=current_brand_buderus
                 ): cv.boolean,
                 vol.Optional(CONF_WB_LABEL, default=current_wb_label): cv.string,
+                vol.Optional(
+                    CONF_BACON_SUBSCRIBE_ALL, default=current_subscribe_all
+                ): cv.boolean,
             }
         )
 
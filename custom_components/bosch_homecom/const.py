@@ -13,15 +13,74 @@ DEFAULT_UPDATE_INTERVAL: Final = timedelta(seconds=60)
 MANUFACTURER: Final = "Bosch"
 
 CONF_UPDATE_SECONDS: Final = "update_seconds"
+CONF_ADAPTIVE_POLLING: Final = "adaptive_polling"
+# Adaptive polling (polling.AdaptivePollInterval): how far a quiet device's
+# interval may grow, by how much per unchanged poll, and how long a user's write
+# keeps the configured interval.
+ADAPTIVE_POLL_MAX_INTERVAL: Final = timedelta(minutes=10)
+ADAPTIVE_POLL_RELAX_FACTOR: Final = 1.5
+ADAPTIVE_POLL_WRITE_HOLD: Final = timedelta(minutes=5)
+# The polls of an entry's devices are spread evenly over the update interval;
+# each is also moved by up to this fraction of its slot at random.
+POLL_STAGGER_JITTER: Final = 0.2
+# Circuit breaker (polling.CircuitBreaker): consecutive not-responding polls
+# that open it, and the first and the longest wait before probing again.
+BREAKER_FAILURE_THRESHOLD: Final = 3
+BREAKER_BACKOFF: Final = timedelta(minutes=2)
+BREAKER_MAX_BACKOFF: Final = timedelta(hours=1)
+# RRC2 bulk reads (rrc2.Rrc2BulkReader): resources per POST bulk, within the
+# 30 the pointt API accepts, how often the library's full update re-reads the
+# zone and circuit structure, and how long a resource that answered 404 is
+# left out.
+RRC2_BULK_CHUNK: Final = 30
+RRC2_STRUCTURE_INTERVAL: Final = timedelta(hours=1)
+RRC2_SKIP_TTL: Final = timedelta(days=1)
+# Successful polls in a row a zone, circuit or sub-device must be missing from
+# before structure.async_track_structure removes its entities.
+STRUCTURE_REMOVE_AFTER: Final = 3
+# Wallbox cadence (polling.ChargingCadence): during a charging session only
+# the charge points' telemetry is read, this often; the rest keeps the update
+# interval. Without a session the wallbox is polled at most this often.
+COMMODULE_SESSION_INTERVAL: Final = timedelta(seconds=10)
+COMMODULE_IDLE_INTERVAL: Final = timedelta(minutes=5)
+# wbState values (lower-cased) of a charge point with a car in a session.
+COMMODULE_SESSION_STATES: Final = frozenset(
+    {"charging", "suspendedev", "suspendedevse", "limited", "phaseswitch"}
+)
+# Charge logs (chargelog.ChargelogSync): how many sessions are kept per charge
+# point, and the event fired for each new one.
+CHARGELOG_MAX_SESSIONS: Final = 1000
+EVENT_CHARGE_SESSION: Final = f"{DOMAIN}_charge_session"
 
 # Default window for capture_raw_service. The bacon "topics" channel is push-only
 # and the device's own publish interval is 1800 s, so a shorter default would
 # usually return nothing and read as "the data does not exist".
 CAPTURE_RAW_DEFAULT_SECONDS: Final = 120
 CAPTURE_RAW_MAX_SECONDS: Final = 2100
+# Byte budget and per-topic retention of the capture ring buffer. A capture on a
+# busy account keeps the newest messages within the budget instead of growing
+# for the whole window.
+CAPTURE_RAW_DEFAULT_BYTES: Final = 256 * 1024
+CAPTURE_RAW_MIN_BYTES: Final = 1024
+CAPTURE_RAW_MAX_BYTES: Final = 4 * 1024 * 1024
+CAPTURE_RAW_DEFAULT_PER_TOPIC: Final = 1
+CAPTURE_RAW_MIN_PER_TOPIC: Final = 1
+CAPTURE_RAW_MAX_PER_TOPIC: Final = 50
+# Budget for the raw MQTT section of a diagnostics download.
+DIAGNOSTICS_RAW_MAX_BYTES: Final = 64 * 1024
 CONF_BRAND_BUDERUS: Final = "brand_buderus"
 MIN_UPDATE_SECONDS: Final = 15  # avoids spam
 MAX_UPDATE_SECONDS: Final = 3600  # 1 hour
+# Account-wide request budget (scheduler.RequestScheduler): a sustained rate in
+# requests per second and the burst a setup or a user's writes may use at once.
+# A device's poll takes about 7 requests and its setup about 14, so ten devices
+# polled every 30 s average under 2.5 requests per second; the burst sets up
+# three devices at once and the rest follow at the sustained rate.
+SCHEDULER_RATE: Final = 5.0
+SCHEDULER_BURST: Final = 50
+# Pause after a 429 without a usable Retry-After, and the longest one honoured.
+SCHEDULER_DEFAULT_RETRY_AFTER: Final = 30.0
+SCHEDULER_MAX_RETRY_AFTER: Final = 900.0
 
 MODEL = {
     "rac": "Residential Air Conditioning",
@@ -57,6 +116,9 @@ CONF_REFRESH: Final = "refresh"
 CONF_WB_LABEL: Final = "wb_label"
 CONF_BACON_CLIENT_ID: Final = "bacon_client_id"
 CONF_BACON_REGION: Final = "bacon_region"
+# Debug option: subscribe to the whole users/{sub}/# namespace instead of only
+# the shadow and topics channels of the selected bacon devices.
+CONF_BACON_SUBSCRIBE_ALL: Final = "bacon_subscribe_all"
 # Last-known friendly names (customTitle) per bacon device id, persisted so a
 # reload with an incomplete first shadow doesn't reset the device name.
 CONF_BACON_TITLES: Final = "bacon_titles"
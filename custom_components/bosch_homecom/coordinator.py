@@ -4,12 +4,18 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from datetime import datetime, timedelta
+import dataclasses
+from datetime import date, datetime, timedelta
 import logging
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntry
-from homeassistant.const import CONF_TOKEN
+from homeassistant.const import (
+    CONF_TOKEN,
+    UnitOfEnergy,
+    UnitOfTemperature,
+    UnitOfVolume,
+)
 from homeassistant.core import (
     CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
@@ -19,6 +25,7 @@ from homeassistant.core import (
 from homeassistant.data_entry_flow import UnknownFlow
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
@@ -45,13 +52,31 @@ from homecom_alt import (
 )
 from tenacity import RetryError
 
+from .bacon import SharedBaconSession
+from .chargelog import ChargelogSync
 from .const import (
+    COMMODULE_SESSION_STATES,
     CONF_BACON_TITLES,
     CONF_REFRESH,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     MANUFACTURER,
+    RRC2_STRUCTURE_INTERVAL,
+)
+from .metrics import PollMetrics, async_get_endpoint_stats
+from .performance import HeatPumpPerformance
+from .polling import AdaptivePollInterval, BreakerState, ChargingCadence, CircuitBreaker
+from .recordings import (
+    RECORDING_UNIT_CLASSES,
+    RECORDING_UNITS,
+    Recording,
+    RecordingDays,
+    async_read_recordings,
 )
+from .rrc2 import Rrc2BulkReader
+from .scheduler import RequestPriority, request_priority
+from .statistics import StatisticSeries, StatisticsImporter, external_statistic_id
+from .structure import device_structure
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +118,15 @@ class BoschComModuleCoordinatorBase(DataUpdateCoordinator[T]):
         self.entry = entry
         self.auth_provider = auth_provider
         self.firmware = firmware["value"]
+        self.metrics = PollMetrics()
+        # Set up by async_setup_entry when adaptive polling is enabled.
+        self.adaptive: AdaptivePollInterval | None = None
+        self._phase_offset: timedelta | None = None
+        self.breaker = CircuitBreaker()
+        # Zones, circuits and sub-devices; structure.async_track_structure
+        # follows the count of changes to add and remove their entities.
+        self.structure: frozenset[str] = frozenset()
+        self.structure_changes = 0
 
         self.device_info = DeviceInfo(
             serial_number=self.unique_id,
@@ -104,37 +138,110 @@ class BoschComModuleCoordinatorBase(DataUpdateCoordinator[T]):
 
     async def _async_update_data(self) -> T:
         """Update data via library."""
-        if self.auth_provider:
+        with self.metrics.poll():
+            if self.auth_provider:
+                with self.metrics.phase("token"):
+                    await self._async_refresh_token()
+
+            # The token is refreshed regardless: with auth_provider set, the
+            # other devices of the entry depend on it.
+            if not self.breaker.allow():
+                raise UpdateFailed(
+                    f"Device {self.unique_id} not responding, next try at "
+                    f"{self.breaker.retry_at}"
+                )
             try:
-                await self.bhc.get_token()
-                if self.bhc.token != self.entry.data.get(
-                    CONF_TOKEN
-                ) or self.bhc.refresh_token != self.entry.data.get(CONF_REFRESH):
-                    new_data = dict(self.entry.data)
-                    new_data[CONF_TOKEN] = self.bhc.token
-                    new_data[CONF_REFRESH] = self.bhc.refresh_token
-                    self.hass.config_entries.async_update_entry(
-                        self.entry, data=new_data
-                    )
+                with self.metrics.phase("update"):
+                    data = await self._async_fetch()
+            except (RetryError, NotRespondingError, TimeoutError) as error:
+                self.breaker.record_failure()
+                if self.breaker.state is not BreakerState.CLOSED:
+                    # Failed polls do not notify listeners; the breaker entity
+                    # should still show it opened.
+                    self.async_update_listeners()
+                raise UpdateFailed(error) from error
+            except (ApiError, InvalidSensorDataError) as error:
+                raise UpdateFailed(error) from error
+            self.breaker.record_success()
+
+            device_data = self._build_device_data(data)
+            structure = device_structure(device_data)
+            if structure != self.structure:
+                if self.data is not None:
                     _LOGGER.debug(
-                        "Device_Id: %s, persisted refreshed auth tokens",
+                        "Device %s: zones, circuits or sub-devices changed",
                         self.unique_id,
                     )
-            except AuthFailedError:
-                self.entry.async_start_reauth(self.hass)
-                raise UpdateFailed("Re-authentication required")
+                    self.structure_changes += 1
+                self.structure = structure
+            if self.adaptive is not None:
+                self.update_interval = self.adaptive.observe(
+                    self._activity(device_data)
+                )
+            return device_data
 
+    async def _async_fetch(self) -> T:
+        """Read the device's data from the API."""
+        return await self.bhc.async_update(self.unique_id)
+
+    @callback
+    def stagger(self, offset: timedelta) -> None:
+        """Move the next poll ``offset`` later, to spread the entry's polls."""
+        self._phase_offset = offset
+        if self._unsub_refresh is not None:
+            self._schedule_refresh()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll, once shifted by a pending phase offset."""
+        offset, self._phase_offset = self._phase_offset, None
+        interval = self.update_interval
+        if offset is None or interval is None:
+            super()._schedule_refresh()
+            return
+        self.update_interval = interval + offset
         try:
-            data = await self.bhc.async_update(self.unique_id)
-        except (
-            ApiError,
-            InvalidSensorDataError,
-            RetryError,
-            NotRespondingError,
-        ) as error:
-            raise UpdateFailed(error) from error
+            super()._schedule_refresh()
+        finally:
+            self.update_interval = interval
 
-        return self._build_device_data(data)
+    async def async_request_refresh(self) -> None:
+        """Request a refresh; entities and services do so after each write."""
+        if self.adaptive is not None:
+            self.update_interval = self.adaptive.note_write()
+        await super().async_request_refresh()
+
+    def _activity(self, data: T) -> Any:
+        """Return what tells a poll that the device is active.
+
+        By default the whole device data: any change counts. Coordinators whose
+        data has clear activity signals narrow it down, so slowly drifting
+        temperatures alone do not keep the interval short.
+        """
+        return data
+
+    def _not_found(self, path: str) -> bool:
+        """Return whether the last bulk read of ``path`` answered 404."""
+        return self.bhc._last_endpoint_status.get((self.unique_id, path)) == 404
+
+    async def _async_refresh_token(self) -> None:
+        """Refresh the access token and persist it when it rotated."""
+        try:
+            await self.bhc.get_token()
+            if self.bhc.token != self.entry.data.get(
+                CONF_TOKEN
+            ) or self.bhc.refresh_token != self.entry.data.get(CONF_REFRESH):
+                new_data = dict(self.entry.data)
+                new_data[CONF_TOKEN] = self.bhc.token
+                new_data[CONF_REFRESH] = self.bhc.refresh_token
+                self.hass.config_entries.async_update_entry(self.entry, data=new_data)
+                _LOGGER.debug(
+                    "Device_Id: %s, persisted refreshed auth tokens",
+                    self.unique_id,
+                )
+        except AuthFailedError:
+            self.entry.async_start_reauth(self.hass)
+            raise UpdateFailed("Re-authentication required")
 
     @abstractmethod
     def _build_device_data(self, data: T) -> T:
@@ -230,19 +337,39 @@ class _K40ExtraEndpointsMixin:
 
     EXTRA_KEYS = ("additional_heater", "silent_mode", "dhw_charge_duration")
 
+    # heat_sources nodes that move while the heat source is working.
+    ACTIVITY_KEYS = ("actualHeatDemand", "actualModulation", "starts")
+
     def __init__(self, *args, **kwargs) -> None:
         """Initialize coordinator with the extra-endpoint cache."""
         super().__init__(*args, **kwargs)
         self.extra_data: dict[str, dict | None] = {}
         self.recordings: dict[str, float] = {}
+        self.recordings_previous_day: dict[str, float] = {}
+        self.recording_days = RecordingDays()
+        self.performance = HeatPumpPerformance(
+            self.hass, self.unique_id, self.device_info["name"]
+        )
+        # The last read of each day not sealed yet, whose hours may still count.
+        self._open_recordings: dict[date, dict[str, Recording]] = {}
         self._last_recordings_fetch = None
 
     async def _async_update_data(self):
         """Update via library, then fetch the standalone endpoints."""
-        data = await super()._async_update_data()
-        await self._fetch_extra_endpoints()
-        await self._fetch_recordings()
-        return data
+        with self.metrics.poll():
+            data = await super()._async_update_data()
+            with self.metrics.phase("extra_endpoints"):
+                await self._fetch_extra_endpoints()
+            await self._fetch_recordings()
+            return data
+
+    def _activity(self, data) -> Any:
+        """Return the heat source's demand, modulation, starts and flame."""
+        heat_sources = data.heat_sources or {}
+        return (
+            *((heat_sources.get(key) or {}).get("value") for key in self.ACTIVITY_KEYS),
+            getattr(data, "flame_indication", None),
+        )
 
     async def _fetch_extra_endpoints(self) -> None:
         """Fetch standalone endpoints via the library, caching None on failure."""
@@ -275,11 +402,13 @@ class _K40ExtraEndpointsMixin:
     async def _fetch_recordings(self) -> None:
         """Fetch /recordings/heatSources/* time-series (hourly, rate-limited).
 
-        Runs at most once per RECORDINGS_POLL_INTERVAL. The bulk endpoint
-        accepts up to 30 paths per call — 14 fits comfortably. Each entry
-        of RECORDING_PATHS has its own aggregation mode:
+        Runs at most once per RECORDINGS_POLL_INTERVAL. Each entry of
+        RECORDING_PATHS has its own aggregation mode:
             ``sum`` -> sum of ``y`` (kWh counters)
             ``avg`` -> sum(y) / sum(c) (sensor sample averages)
+        After midnight the previous day is read along until its final hour
+        is in (see RecordingDays); its totals go to ``recordings_previous_day``.
+        The completed hours feed the COP figures in ``performance``.
         """
         now = dt_util.utcnow()
         if (
@@ -288,13 +417,18 @@ class _K40ExtraEndpointsMixin:
         ):
             return
 
-        today = dt_util.now().strftime("%Y-%m-%d")
-        paths = [
-            f"/recordings/heatSources/{suffix}?interval={today}"
-            for suffix in RECORDING_PATHS
-        ]
+        requests = self.recording_days.requests(
+            now, (f"/recordings/heatSources/{suffix}" for suffix in RECORDING_PATHS)
+        )
         try:
-            result = await self.bhc.async_request_bulk(self.unique_id, paths)
+            # Hourly aggregates can wait behind the polls and the user's writes.
+            with (
+                self.metrics.phase("recordings"),
+                request_priority(RequestPriority.BACKGROUND),
+            ):
+                result = await async_read_recordings(
+                    self.bhc, self.unique_id, list(requests.values())
+                )
         except (
             ApiError,
             InvalidSensorDataError,
@@ -317,39 +451,47 @@ class _K40ExtraEndpointsMixin:
         if not result:
             return
 
-        for suffix, meta in RECORDING_PATHS.items():
-            path = f"/recordings/heatSources/{suffix}?interval={today}"
-            payload = result.get(path)
+        parsed: dict[date, dict[str, Recording]] = {}
+        for (day, path), bulk_path in requests.items():
+            meta = RECORDING_PATHS[path.removeprefix("/recordings/heatSources/")]
+            payload = result.get(bulk_path)
+            tail = day != self.recording_days.today
             if not isinstance(payload, dict):
-                # Endpoint not supported on this device (404/403) or unexpected shape.
-                # Keep previous good value if any.
+                # Endpoint not supported on this device (404/403), a failed
+                # read or an unexpected shape. Keep previous good value if any;
+                # only a 404 stops the tail day from being read again.
+                if tail and self._not_found(bulk_path):
+                    self.recording_days.note_not_recorded(path)
                 continue
-            recording = payload.get("recording") or []
-            if not isinstance(recording, list):
+            # Placeholders for hours not populated yet (c <= 0) are dropped
+            # while parsing. Some devices (e.g. Buderus Logatherm WLW166i)
+            # return {"c": 0, "y": 1.0} for every not-yet-populated hour of
+            # the current day; counted, they would inflate both ``sum`` and
+            # ``avg``. Reported by @ombuyse in PR #155.
+            recording = Recording.parse(payload, dt_util.start_of_local_day(day))
+            if tail:
+                self.recording_days.note(path, recording)
+            parsed.setdefault(day, {})[meta["key"]] = recording.hourly()
+            value = recording.aggregate(meta["agg"])
+            if value is not None:
+                target = self.recordings_previous_day if tail else self.recordings
+                target[meta["key"]] = round(value, 2 if meta["agg"] == "avg" else 3)
+        self.recording_days.seal_if_complete(path for _, path in requests)
+
+        # Yesterday's last hours go first; today's wait until it is sealed.
+        # A sealed day also counts the hours left without any electricity.
+        self._open_recordings.update(parsed)
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        days = self.recording_days
+        for day in sorted(self._open_recordings):
+            if day == days.today and days.tail:
                 continue
-            y_sum = 0.0
-            c_sum = 0
-            for item in recording:
-                if not isinstance(item, dict):
-                    continue
-                c = item.get("c")
-                # Skip future / unpopulated hour slots. Some devices (e.g.
-                # Buderus Logatherm WLW166i) return {"c": 0, "y": 1.0} for
-                # every not-yet-populated hour of the current day; without
-                # this guard both ``sum`` and ``avg`` aggregations would
-                # count those placeholders as real samples. Reported by
-                # @ombuyse in PR #155.
-                if not isinstance(c, (int, float)) or c <= 0:
-                    continue
-                y = item.get("y")
-                if isinstance(y, (int, float)):
-                    y_sum += y
-                c_sum += int(c)
-            if meta["agg"] == "avg":
-                if c_sum > 0:
-                    self.recordings[meta["key"]] = round(y_sum / c_sum, 2)
-            else:  # "sum"
-                self.recordings[meta["key"]] = round(y_sum, 3)
+            sealed = day not in (days.today, days.tail)
+            await self.performance.async_add(
+                day, self._open_recordings[day], before=hour, sealed=sealed
+            )
+            if sealed:
+                del self._open_recordings[day]
 
 
 class BoschComModuleCoordinatorK40(
@@ -384,8 +526,146 @@ class BoschComModuleCoordinatorK40(
         return BHCDeviceK40(**kwargs)
 
 
+# Maps path under /recordings/ -> {key, agg, unit} for the wddw2 water heater:
+# water drawn, the burner's gas and electricity and the outlet temperature.
+# Each completed hour is also imported into long-term statistics; the unit is
+# the payload's ``unitOfMeasure`` when known, else the one given here.
+WDDW2_RECORDING_PATHS: dict[str, dict] = {
+    "dhwCircuits/dhw1/sensor/water": {
+        "key": "water_consumption_today",
+        "agg": "sum",
+        "unit": UnitOfVolume.LITERS,
+    },
+    "heatSources/hs1/sensor/gas": {
+        "key": "gas_consumption_today",
+        "agg": "sum",
+        "unit": UnitOfEnergy.KILO_WATT_HOUR,
+    },
+    "heatSources/hs1/sensor/electricity": {
+        "key": "electricity_consumption_today",
+        "agg": "sum",
+        "unit": UnitOfEnergy.KILO_WATT_HOUR,
+    },
+    "dhwCircuits/dhw1/actualTemp": {
+        "key": "dhw_temp_avg_today",
+        "agg": "avg",
+        "unit": UnitOfTemperature.CELSIUS,
+    },
+}
+
+
 class BoschComModuleCoordinatorWddw2(BoschComModuleCoordinatorBase[BHCDeviceWddw2]):
-    """A coordinator to manage the fetching of BoschCom data."""
+    """A coordinator to manage the fetching of BoschCom data.
+
+    Next to the library update, the water, gas, electricity and outlet
+    temperature recordings (WDDW2_RECORDING_PATHS) are read in one bulk
+    request at most once per RECORDINGS_POLL_INTERVAL. Today's totals are
+    cached in ``recordings`` and every completed hour is imported into
+    long-term statistics, incrementally, so hourly usage is available without
+    polling the counters every minute.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize coordinator with the recordings cache."""
+        super().__init__(*args, **kwargs)
+        self.recordings: dict[str, float] = {}
+        self.recordings_previous_day: dict[str, float] = {}
+        self.recording_days = RecordingDays()
+        self._last_recordings_fetch: datetime | None = None
+        self.recordings_statistics = StatisticsImporter(
+            self.hass, f"recordings.{self.unique_id}"
+        )
+
+    async def _async_update_data(self) -> BHCDeviceWddw2:
+        """Update via library, then fetch the recordings when due."""
+        with self.metrics.poll():
+            data = await super()._async_update_data()
+            await self._fetch_recordings()
+            return data
+
+    async def _fetch_recordings(self) -> None:
+        """Fetch today's recordings and import their completed hours.
+
+        After midnight, yesterday is read along until its final hour is in
+        (see RecordingDays); meanwhile today's hours of that path wait to be
+        imported. Today's totals start afresh at the date rollover.
+        """
+        now = dt_util.utcnow()
+        if (
+            self._last_recordings_fetch is not None
+            and now - self._last_recordings_fetch < RECORDINGS_POLL_INTERVAL
+        ):
+            return
+
+        day = self.recording_days.today
+        requests = self.recording_days.requests(
+            now, (f"/recordings/{suffix}" for suffix in WDDW2_RECORDING_PATHS)
+        )
+        if day is not None and self.recording_days.today != day:
+            # The cached totals are yesterday's now.
+            self.recordings.clear()
+        try:
+            with (
+                self.metrics.phase("recordings"),
+                request_priority(RequestPriority.BACKGROUND),
+            ):
+                result = await async_read_recordings(
+                    self.bhc, self.unique_id, list(requests.values())
+                )
+        except (
+            ApiError,
+            InvalidSensorDataError,
+            NotRespondingError,
+            RetryError,
+            TimeoutError,
+        ):
+            # The next regular tick retries; the cached totals stay.
+            _LOGGER.debug(
+                "Device %s: recordings fetch failed, keeping last values",
+                self.unique_id,
+            )
+            return
+        self._last_recordings_fetch = now
+
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        # Each path's tail day comes first, so its last hours are imported
+        # before today's move the statistics cursor past them.
+        for (day, path), bulk_path in requests.items():
+            suffix = path.removeprefix("/recordings/")
+            meta = WDDW2_RECORDING_PATHS[suffix]
+            payload = result.get(bulk_path)
+            tail = day != self.recording_days.today
+            if not isinstance(payload, dict):
+                # Not recorded by this device (404) or not read this time;
+                # keep any previous value.
+                if tail and self._not_found(bulk_path):
+                    self.recording_days.note_not_recorded(path)
+                continue
+            recording = Recording.parse(
+                payload, dt_util.start_of_local_day(day)
+            ).hourly()
+            if tail:
+                self.recording_days.note(path, recording)
+            value = recording.aggregate(meta["agg"])
+            if value is not None:
+                target = self.recordings_previous_day if tail else self.recordings
+                target[meta["key"]] = round(value, 2 if meta["agg"] == "avg" else 3)
+            if not tail and self.recording_days.is_open(path):
+                # Yesterday's final hours are still to come.
+                continue
+            unit = RECORDING_UNITS.get(payload.get("unitOfMeasure"), meta["unit"])
+            # Only completed hours; the running one is still accumulating.
+            await self.recordings_statistics.async_add(
+                StatisticSeries(
+                    external_statistic_id(self.unique_id, suffix.replace("/", "_")),
+                    f"{self.device_info['name']} {meta['key'].removesuffix('_today')}",
+                    unit,
+                    RECORDING_UNIT_CLASSES.get(unit),
+                    kind="mean" if meta["agg"] == "avg" else "sum",
+                ),
+                recording.buckets(meta["agg"], before=hour),
+            )
+        self.recording_days.seal_if_complete(path for _, path in requests)
 
     def _build_device_data(self, data: BHCDeviceWddw2) -> BHCDeviceWddw2:
         """Build WDDW2 device data."""
@@ -443,6 +723,43 @@ class BoschComModuleCoordinatorIcom(
 class BoschComModuleCoordinatorRrc2(BoschComModuleCoordinatorBase[BHCDeviceRrc2]):
     """A coordinator for rrc2 (Remeha Remote Control) gateways."""
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize coordinator."""
+        super().__init__(*args, **kwargs)
+        self.bulk = Rrc2BulkReader(self.hass, self.bhc, self.unique_id)
+        self._structure_read: datetime | None = None
+        self._structure_due = False
+
+    async def _async_fetch(self) -> BHCDeviceRrc2:
+        """Read the gateway, in a few bulk requests between structure reads.
+
+        The library's full update discovers the zones and circuits and reads
+        every resource one by one; it runs on the first poll, every
+        RRC2_STRUCTURE_INTERVAL and when a known resource disappeared. The
+        polls in between re-read the state through the bulk reader: names,
+        icons, lists and assignments only after a write by the user.
+        """
+        now = dt_util.utcnow()
+        if (
+            self.data is None
+            or self._structure_read is None
+            or now - self._structure_read >= RRC2_STRUCTURE_INTERVAL
+            or self.bulk.structure_changed
+        ):
+            data = await self.bhc.async_update(self.unique_id)
+            self._structure_read = now
+            self._structure_due = False
+            await self.bulk.async_seen(data)
+            return data
+        data = await self.bulk.async_read(self.data, structure=self._structure_due)
+        self._structure_due = False
+        return data
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh reading the structure resources too."""
+        self._structure_due = True
+        await super().async_request_refresh()
+
     def _build_device_data(self, data: BHCDeviceRrc2) -> BHCDeviceRrc2:
         """Build rrc2 device data."""
         return BHCDeviceRrc2(
@@ -467,6 +784,79 @@ class BoschComModuleCoordinatorCommodule(
 ):
     """A coordinator to manage the fetching of BoschCom data."""
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize coordinator."""
+        super().__init__(*args, **kwargs)
+        # async_setup_entry sets its base to the configured interval.
+        self.cadence = ChargingCadence(self.update_interval or DEFAULT_UPDATE_INTERVAL)
+        # Fed the charge logs of every full read.
+        self.chargelog = ChargelogSync(
+            self.hass, self.unique_id, self.device_info["name"]
+        )
+
+    async def _async_update_data(self) -> BHCDeviceCommodule:
+        """Update data and follow the charging sessions' cadence."""
+        data = await super()._async_update_data()
+        if self.update_interval is not None:
+            self.update_interval = self.cadence.observe(
+                self._charging(data), self.update_interval
+            )
+        return data
+
+    async def _async_fetch(self) -> BHCDeviceCommodule:
+        """Read everything, or during a session only the telemetry.
+
+        The library's full read includes the charge logs; their new sessions
+        are added from it rather than by downloading the logs again.
+        """
+        full = self.data is None or self.cadence.full_read_due()
+        if full:
+            data = await self.bhc.async_update(self.unique_id)
+            await self.chargelog.async_sync(
+                {
+                    cp["id"].split("/")[-1]: cp.get("chargelog")
+                    for cp in data.charge_points or []
+                    if isinstance(cp, dict) and "id" in cp
+                }
+            )
+        else:
+            data = await self._async_fetch_telemetry(self.data)
+        self.cadence.note_read(full)
+        return data
+
+    async def _async_fetch_telemetry(
+        self, data: BHCDeviceCommodule
+    ) -> BHCDeviceCommodule:
+        """Return ``data`` with the charge points' telemetry read afresh."""
+        paths = {
+            cp["id"]: (cp.get("telemetry") or {}).get("id")
+            or f"/rest/v1/{cp['id'].split('/')[-1]}/telemetry"
+            for cp in data.charge_points or []
+            if isinstance(cp, dict) and "id" in cp
+        }
+        if not paths:
+            return data
+        result = await self.bhc.async_request_bulk(self.unique_id, list(paths.values()))
+        charge_points = []
+        for cp in data.charge_points or []:
+            telemetry = (result or {}).get(paths.get(cp.get("id")))
+            if isinstance(telemetry, dict):
+                cp = {**cp, "telemetry": telemetry}
+            charge_points.append(cp)
+        return dataclasses.replace(data, charge_points=charge_points)
+
+    @staticmethod
+    def _charging(data: BHCDeviceCommodule) -> bool:
+        """Return whether a car is in a session at any charge point."""
+        for cp in data.charge_points or []:
+            raw = cp.get("telemetry") or {}
+            telemetry = raw.get("values", raw)
+            if not isinstance(telemetry, dict):
+                continue
+            if str(telemetry.get("wbState", "")).lower() in COMMODULE_SESSION_STATES:
+                return True
+        return False
+
     def _build_device_data(self, data: BHCDeviceCommodule) -> BHCDeviceCommodule:
         """Build commodule device data."""
         return BHCDeviceCommodule(
@@ -478,6 +868,19 @@ class BoschComModuleCoordinatorCommodule(
             wifi_state=data.wifi_state,
         )
 
+    def _activity(self, data: BHCDeviceCommodule) -> Any:
+        """Return each charge point's state and power."""
+        activity = []
+        for cp in data.charge_points or []:
+            raw = cp.get("telemetry") or {}
+            telemetry = raw.get("values", raw)
+            if not isinstance(telemetry, dict):
+                telemetry = {}
+            activity.append(
+                (cp.get("id"), telemetry.get("wbState"), telemetry.get("actualPower"))
+            )
+        return tuple(activity)
+
 
 # Reconnect this far ahead of the access token's expiry. The MQTT password *is*
 # the access token, so the broker drops the session when it expires. The margin
@@ -495,7 +898,8 @@ class BoschComModuleCoordinatorBaconRac(DataUpdateCoordinator[BHCDeviceBaconRac]
 
     Unlike the pointt (REST) coordinators these devices push their state over an
     MQTT device-shadow. A single :class:`BaconMqttClient` is shared across all
-    bacon devices of the entry; live shadow updates are pushed straight into the
+    bacon devices of the account (see ``BaconSessionRegistry``), even across
+    config entries; live shadow updates are pushed straight into the
     coordinator, while the periodic refresh doubles as a keep-alive/reconnect and
     handles OAuth token rotation.
 
@@ -517,6 +921,7 @@ class BoschComModuleCoordinatorBaconRac(DataUpdateCoordinator[BHCDeviceBaconRac]
         token_manager: HomeComAlt,
         lock: asyncio.Lock,
         auth_provider: bool,
+        session: SharedBaconSession | None = None,
     ) -> None:
         """Initialize the bacon coordinator."""
         super().__init__(
@@ -535,6 +940,7 @@ class BoschComModuleCoordinatorBaconRac(DataUpdateCoordinator[BHCDeviceBaconRac]
         self.device = device
         self.entry = entry
         self.firmware = firmware["value"]
+        self.metrics = PollMetrics()
         self._unsub_reconnect: CALLBACK_TYPE | None = None
         entry.async_on_unload(self._cancel_scheduled_reconnect)
 
@@ -551,7 +957,37 @@ class BoschComModuleCoordinatorBaconRac(DataUpdateCoordinator[BHCDeviceBaconRac]
             manufacturer=MANUFACTURER,
         )
 
-        client.register_listener(self.unique_id, self._handle_push)
+        # A shared session outlives this entry when another entry of the same
+        # account uses it, so the listener goes through the session, which can
+        # drop it again on unload.
+        if session is not None:
+            entry.async_on_unload(
+                session.async_listen(self.unique_id, self._handle_push)
+            )
+        else:
+            client.register_listener(self.unique_id, self._handle_push)
+        # The session supervisor reconnects a dropped session within seconds,
+        # through this coordinator's connect path, and tells every coordinator
+        # on it to refresh once it is back.
+        self.supervisor = supervisor = session.supervisor if session else None
+        if supervisor is not None:
+            entry.async_on_unload(
+                supervisor.async_add_connector(self._ensure_connected)
+            )
+            entry.async_on_unload(
+                async_dispatcher_connect(
+                    hass, supervisor.signal, self._handle_session_restored
+                )
+            )
+
+    @callback
+    def _handle_session_restored(self) -> None:
+        """Refresh now instead of waiting out the update interval."""
+        self.entry.async_create_background_task(
+            self.hass,
+            self.async_request_refresh(),
+            name=f"{DOMAIN} bacon refresh {self.unique_id}",
+        )
 
     @callback
     def _handle_push(self, state: dict) -> None:
@@ -768,9 +1204,18 @@ class BoschComModuleCoordinatorBaconRac(DataUpdateCoordinator[BHCDeviceBaconRac]
 
     async def _async_update_data(self) -> BHCDeviceBaconRac:
         """Refresh via a shadow get (also reconnects if the session dropped)."""
+        with self.metrics.poll():
+            return await self._async_shadow_update()
+
+    async def _async_shadow_update(self) -> BHCDeviceBaconRac:
         try:
-            await self._ensure_connected()
-            state = await self.bhc.async_update()
+            with self.metrics.phase("connect"):
+                await self._ensure_connected()
+            with (
+                self.metrics.phase("update"),
+                async_get_endpoint_stats(self.hass).measure("shadow get"),
+            ):
+                state = await self.bhc.async_update()
         except MqttNotAuthorizedError as err:
             # Never a reauth: the OAuth refresh token is fine, only the MQTT
             # password (the access token) was stale. Let HA retry the poll.
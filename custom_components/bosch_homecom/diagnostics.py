@@ -9,14 +9,18 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_CODE, CONF_PASSWORD, CONF_TOKEN, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_REFRESH
+from .bacon import RawCaptureBuffer
+from .const import CONF_REFRESH, DIAGNOSTICS_RAW_MAX_BYTES
+from .metrics import async_get_endpoint_stats
+from .scheduler import REQUEST_SCHEDULERS, account_key
 
 TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, CONF_CODE, CONF_TOKEN, CONF_REFRESH}
 
-# The bacon MQTT client subscribes to users/{sub}/# — the whole account — so its
-# raw capture also carries other devices and the sharing/claim traffic. Matter
-# onboarding fields are pairing secrets and the network fields identify the home,
-# so none of them may reach a dump a user pastes into an issue.
+# The bacon MQTT client can be switched to users/{sub}/# — the whole account —
+# for debugging, and then its raw capture also carries other devices and the
+# sharing/claim traffic. Matter onboarding fields are pairing secrets and the
+# network fields identify the home, so none of them may reach a dump a user
+# pastes into an issue.
 TO_REDACT_RAW = {
     "mac",
     "manualPairingCode",
@@ -42,24 +46,35 @@ def _mask_serial(serial: str) -> str:
     return f"{serial[:_SERIAL_PREFIX_KEPT]}***"
 
 
+def _redact_raw_entry(entry: dict[str, Any]) -> dict[str, Any]:
+    """Redact one captured message, keeping only payload and timestamp."""
+    payload = entry.get("payload")
+    return {
+        "payload": (
+            async_redact_data(payload, TO_REDACT_RAW)
+            if isinstance(payload, (dict, list))
+            else payload
+        ),
+        "received_at": entry.get("received_at"),
+    }
+
+
 def _redact_raw_snapshot(snapshot: dict[str, Any]) -> dict[str, Any]:
     """Redact a BaconMqttClient.raw_snapshot() for publication.
 
     Keys are ``"{serial}/{channel_path}"``, so the serial is masked in the key as
-    well as inside the payloads.
+    well as inside the payloads. Older messages a RawCaptureBuffer retained
+    under ``previous`` are redacted the same way.
     """
     redacted: dict[str, Any] = {}
     for key, entry in snapshot.items():
         serial, _, path = key.partition("/")
         safe_key = f"{_mask_serial(serial) if serial != '-' else '-'}/{path}"
-        redacted[safe_key] = {
-            "payload": (
-                async_redact_data(entry.get("payload"), TO_REDACT_RAW)
-                if isinstance(entry.get("payload"), (dict, list))
-                else entry.get("payload")
-            ),
-            "received_at": entry.get("received_at"),
-        }
+        redacted[safe_key] = _redact_raw_entry(entry)
+        if entry.get("previous"):
+            redacted[safe_key]["previous"] = [
+                _redact_raw_entry(older) for older in entry["previous"]
+            ]
     return redacted
 
 
@@ -68,15 +83,47 @@ def _bacon_raw_captures(coordinators: Any) -> dict[str, Any]:
 
     One client is shared by every bacon device of the entry, so the snapshot is
     identical across their coordinators — take it from the first that has one.
+    The snapshot is bounded to DIAGNOSTICS_RAW_MAX_BYTES, newest messages kept,
+    so a busy account cannot blow up the download.
     """
     for coordinator in coordinators:
         client = getattr(coordinator, "client", None)
         snapshot = getattr(client, "raw_snapshot", None)
         if callable(snapshot):
-            return _redact_raw_snapshot(snapshot())
+            bounded = RawCaptureBuffer.from_snapshot(
+                snapshot(), DIAGNOSTICS_RAW_MAX_BYTES
+            )
+            return _redact_raw_snapshot(bounded.snapshot())
     return {}
 
 
+def _bacon_connection(coordinators: Any) -> dict[str, Any]:
+    """Return the bacon session supervisor's state and reconnect counters."""
+    for coordinator in coordinators:
+        supervisor = getattr(coordinator, "supervisor", None)
+        if supervisor is not None:
+            return supervisor.stats()
+    return {}
+
+
+def _per_coordinator(
+    coordinators: Any, attr: str, method: str = "stats"
+) -> list[dict[str, Any] | None]:
+    """Return ``coordinator.<attr>.<method>()`` per coordinator, in data order.
+
+    None where the coordinator has no such helper: a fixed interval, no
+    wallbox, no recordings.
+    """
+    return [
+        (
+            getattr(helper, method)()
+            if (helper := getattr(coordinator, attr, None)) is not None
+            else None
+        )
+        for coordinator in coordinators
+    ]
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: ConfigEntry
 ) -> dict[str, Any]:
@@ -152,4 +199,28 @@ async def async_get_config_entry_diagnostics(
         # Everything seen on the bacon wildcard subscription, so a report is
         # actionable without another round trip asking the user to run a service.
         "bacon_raw": _bacon_raw_captures(coordinators),
+        "bacon_connection": _bacon_connection(coordinators),
+        # Timings, request counts and errors of the recent polls, per device.
+        "poll_metrics": _per_coordinator(coordinators, "metrics", "summary"),
+        "adaptive_polling": _per_coordinator(coordinators, "adaptive"),
+        "charging_cadence": _per_coordinator(coordinators, "cadence"),
+        "chargelogs": _per_coordinator(coordinators, "chargelog"),
+        "circuit_breakers": _per_coordinator(coordinators, "breaker"),
+        "performance": _per_coordinator(coordinators, "performance"),
+        "recording_days": _per_coordinator(coordinators, "recording_days"),
+        "rrc2_bulk": _per_coordinator(coordinators, "bulk"),
+        # Latency percentiles and status counts per cloud endpoint, across all
+        # entries, to tell slow or flaky endpoints apart without a capture.
+        "endpoints": async_get_endpoint_stats(hass).summary(),
+        # The account's request budget: tokens left, queue and 429 pauses.
+        "scheduler": (
+            scheduler.stats()
+            if (
+                scheduler := hass.data.get(REQUEST_SCHEDULERS, {}).get(
+                    account_key(config_entry)
+                )
+            )
+            is not None
+            else None
+        ),
     }
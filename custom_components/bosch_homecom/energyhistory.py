@@ -0,0 +1,140 @@
+"""Daily import of wallbox energy history into long-term statistics."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.const import UnitOfEnergy
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import EnergyConverter
+from homecom_alt import ApiError, InvalidSensorDataError, NotRespondingError
+from tenacity import RetryError
+
+from .scheduler import RequestPriority, request_priority
+from .statistics import StatisticSeries, StatisticsImporter, external_statistic_id
+
+_LOGGER = logging.getLogger(__name__)
+
+ENERGY_HISTORY_INTERVAL = timedelta(days=1)
+
+# /rest/v1/<cp>/energyhistory is an array resource in the Pointt history
+# format, as the K40 energy/historyHourly entries: a day ("d", dd-mm-yyyy), the
+# hour of that day ("h", 0-23) and the energy charged in it in kWh:
+#   {"id": "/rest/v1/cp0/energyhistory", "type": "array",
+#    "value": [{"d": "01-03-2026", "h": 7, "energy": 2.4}, ...]}
+# Entries without an hour are day totals; an hourly statistic cannot place
+# them, so they are skipped.
+_DATE_FORMAT = "%d-%m-%Y"
+
+HOUR = timedelta(hours=1)
+
+
+def _entry_start(entry: dict[str, Any]) -> datetime | None:
+    """Return the local start of an hourly entry, None for any other entry."""
+    day, hour = entry.get("d"), entry.get("h")
+    if not isinstance(day, str) or not isinstance(hour, int) or not 0 <= hour < 24:
+        return None
+    try:
+        start = datetime.strptime(day, _DATE_FORMAT)
+    except ValueError:
+        return None
+    return start.replace(hour=hour, tzinfo=dt_util.get_default_time_zone())
+
+
+def energy_history_buckets(payload: Any) -> list[tuple[datetime, float]]:
+    """Return the (start, kWh) hourly entries of an energyhistory resource."""
+    values = payload.get("value") if isinstance(payload, dict) else None
+    buckets: list[tuple[datetime, float]] = []
+    for entry in values if isinstance(values, list) else []:
+        if not isinstance(entry, dict) or (start := _entry_start(entry)) is None:
+            continue
+        try:
+            buckets.append((start, float(entry.get("energy"))))
+        except (TypeError, ValueError):
+            continue
+    return buckets
+
+
+class EnergyHistoryImporter:
+    """Import the energy history of wallbox charge points into statistics.
+
+    Runs once a day: the energyhistory resources of all charge points of a
+    wallbox are read in one bulk request and their completed hours added to
+    one external statistic per charge point. The importer's cursors make
+    reruns and restarts incremental.
+    """
+
+    def __init__(
+        self, coordinators: Sequence[Any], statistics: StatisticsImporter
+    ) -> None:
+        """Initialize the importer for the wallbox ``coordinators``."""
+        self.coordinators = coordinators
+        self.statistics = statistics
+        self._running = False
+
+    def _series(self, coordinator: Any, cp_id: str) -> StatisticSeries:
+        name = coordinator.device_info.get("name") or coordinator.unique_id
+        return StatisticSeries(
+            external_statistic_id(coordinator.unique_id, f"{cp_id}_energy_history"),
+            f"{name} {cp_id} energy",
+            UnitOfEnergy.KILO_WATT_HOUR,
+            EnergyConverter.UNIT_CLASS,
+        )
+
+    async def async_run(self, now: datetime | None = None) -> None:
+        """Import the hours completed since the last run."""
+        if self._running:
+            return
+        self._running = True
+        try:
+            for coordinator in self.coordinators:
+                try:
+                    with request_priority(RequestPriority.BACKGROUND):
+                        await self._async_import(coordinator)
+                except (
+                    ApiError,
+                    InvalidSensorDataError,
+                    NotRespondingError,
+                    RetryError,
+                    TimeoutError,
+                ) as err:
+                    # The cursors did not move; the next run reads it again.
+                    _LOGGER.debug(
+                        "Device %s: energy history import failed: %s",
+                        coordinator.unique_id,
+                        err,
+                    )
+        finally:
+            self._running = False
+
+    async def _async_import(self, coordinator: Any) -> None:
+        charge_points = [
+            cp["id"].split("/")[-1]
+            for cp in (coordinator.data.charge_points if coordinator.data else None)
+            or []
+            if isinstance(cp, dict) and "id" in cp
+        ]
+        if not charge_points:
+            return
+        paths = {cp_id: f"/rest/v1/{cp_id}/energyhistory" for cp_id in charge_points}
+        result = await coordinator.bhc.async_request_bulk(
+            coordinator.unique_id, list(paths.values())
+        )
+        await self.statistics.async_load()
+        now = dt_util.utcnow()
+        for cp_id, path in paths.items():
+            buckets = energy_history_buckets((result or {}).get(path))
+            if not buckets:
+                continue
+            # Only completed hours; the running one still accumulates.
+            await self.statistics.async_add(
+                self._series(coordinator, cp_id),
+                [
+                    (start, value)
+                    for start, value in buckets
+                    if dt_util.as_utc(start) + HOUR <= now
+                ],
+            )
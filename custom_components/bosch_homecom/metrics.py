@@ -0,0 +1,350 @@
+"""Poll timing and request metrics of the coordinators."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceRequestStartParams,
+    TraceResponseChunkReceivedParams,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+from yarl import URL
+
+from .const import DOMAIN
+
+# Polls kept per coordinator; at the default interval about an hour and a half.
+POLL_METRICS_WINDOW = 20
+
+# Upper bounds of the latency histogram buckets, in milliseconds; slower
+# requests land in a final overflow bucket.
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# Distinct endpoints tracked; anything beyond is counted under "other", so a
+# device with many unexpected paths cannot grow the diagnostics without bound.
+MAX_ENDPOINTS = 50
+
+PERCENTILES = (50, 90, 99)
+
+# The metrics of the coordinator whose poll is running in the current task.
+# Every homecom_alt client of an entry shares one session, so a request is
+# attributed to a coordinator through the context it was sent from.
+_CURRENT_POLL: ContextVar[PollMetrics | None] = ContextVar(
+    f"{DOMAIN}_current_poll", default=None
+)
+
+
+@dataclass(slots=True)
+class PollSample:
+    """What one poll of a coordinator took and cost."""
+
+    started: datetime
+    duration: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    requests: int = 0
+    bytes_received: int = 0
+    errors: int = 0
+    failed: bool = False
+
+
+class PollMetrics:
+    """Rolling window of a coordinator's polls.
+
+    ``poll()`` wraps a whole poll and ``phase()`` the steps inside it (token,
+    update, extra endpoints, recordings, ...). HTTP requests, bytes received
+    and transport errors are added by the session's trace config (see
+    ``metrics_trace_config``) while the poll's context is current.
+    """
+
+    def __init__(self, window: int = POLL_METRICS_WINDOW) -> None:
+        """Initialize an empty window."""
+        self.samples: deque[PollSample] = deque(maxlen=window)
+        self._current: PollSample | None = None
+
+    @contextmanager
+    def poll(self) -> Iterator[None]:
+        """Record one poll. A nested call joins the poll already running."""
+        if self._current is not None:
+            yield
+            return
+        sample = PollSample(started=dt_util.utcnow())
+        self._current = sample
+        token = _CURRENT_POLL.set(self)
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            sample.failed = True
+            raise
+        finally:
+            sample.duration = time.perf_counter() - started
+            _CURRENT_POLL.reset(token)
+            self._current = None
+            self.samples.append(sample)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the time spent in the block to phase ``name`` of the poll."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if (sample := self._current) is not None:
+                sample.phases[name] = (
+                    sample.phases.get(name, 0.0) + time.perf_counter() - started
+                )
+
+    def record_request(self, status: int | None) -> None:
+        """Count a finished request; a missing or >= 400 status is an error."""
+        if (sample := self._current) is not None:
+            sample.requests += 1
+            if status is None or status >= 400:
+                sample.errors += 1
+
+    def record_bytes(self, size: int) -> None:
+        """Count received body bytes."""
+        if (sample := self._current) is not None:
+            sample.bytes_received += size
+
+    @property
+    def last(self) -> PollSample | None:
+        """Return the newest completed poll."""
+        return self.samples[-1] if self.samples else None
+
+    def summary(self) -> dict[str, Any]:
+        """Summarize the window for diagnostics and the diagnostic sensors."""
+        samples = list(self.samples)
+        if not samples:
+            return {"polls": 0}
+        count = len(samples)
+        last = samples[-1]
+        phases: dict[str, list[float]] = {}
+        for sample in samples:
+            for name, seconds in sample.phases.items():
+                phases.setdefault(name, []).append(seconds)
+        return {
+            "polls": count,
+            "failed_polls": sum(sample.failed for sample in samples),
+            "last_started": last.started.isoformat(),
+            "duration": {
+                "last": round(last.duration, 3),
+                "mean": round(sum(s.duration for s in samples) / count, 3),
+                "max": round(max(s.duration for s in samples), 3),
+            },
+            "phases": {
+                name: round(sum(values) / len(values), 3)
+                for name, values in phases.items()
+            },
+            "requests": {
+                "last": last.requests,
+                "mean": round(sum(s.requests for s in samples) / count, 1),
+            },
+            "bytes_received": {
+                "last": last.bytes_received,
+                "mean": round(sum(s.bytes_received for s in samples) / count),
+            },
+            "errors": sum(s.errors for s in samples),
+        }
+
+
+class LatencyHistogram:
+    """Fixed-size latency histogram over LATENCY_BUCKETS_MS."""
+
+    __slots__ = ("buckets", "count", "max_ms", "total_ms")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, milliseconds: float) -> None:
+        """Add one observation."""
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        self.count += 1
+        self.total_ms += milliseconds
+        self.max_ms = max(self.max_ms, milliseconds)
+
+    def percentile(self, percent: float) -> float | None:
+        """Estimate a percentile, interpolating linearly inside its bucket."""
+        if not self.count:
+            return None
+        rank = self.count * percent / 100
+        seen = 0
+        for index, in_bucket in enumerate(self.buckets):
+            if in_bucket and seen + in_bucket >= rank:
+                if index == len(LATENCY_BUCKETS_MS):
+                    return self.max_ms
+                lower = LATENCY_BUCKETS_MS[index - 1] if index else 0.0
+                upper = min(LATENCY_BUCKETS_MS[index], self.max_ms)
+                return lower + (upper - lower) * max(0.0, rank - seen) / in_bucket
+            seen += in_bucket
+        return self.max_ms
+
+
+@dataclass(slots=True)
+class EndpointStat:
+    """Latencies and outcomes of one logical endpoint."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    statuses: Counter[str] = field(default_factory=Counter)
+
+
+def endpoint_key(url: URL) -> str:
+    """Group a request URL into a logical endpoint.
+
+    pointt resources are grouped by their top-level node (``/heatSources/*``,
+    ``/recordings/*``), so device and circuit ids do not split them; anything
+    else by host and first path segment.
+    """
+    path = url.path
+    if "/resource/" in path:
+        node = path.split("/resource/", 1)[1].split("/", 1)[0]
+        return f"/{node}/*"
+    if path.rstrip("/").endswith("/bulk"):
+        return "bulk"
+    if path.rstrip("/").endswith("/gateways"):
+        return "gateways"
+    segment = path.strip("/").split("/", 1)[0]
+    return f"{url.host}/{segment}" if segment else str(url.host)
+
+
+class EndpointStats:
+    """Latency histograms and status counters per logical endpoint.
+
+    One instance per Home Assistant instance: the cloud endpoints behave the
+    same for every entry, and pooling the entries gives the histograms more
+    samples.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without endpoints."""
+        self.endpoints: dict[str, EndpointStat] = {}
+
+    def record(self, key: str, seconds: float, status: int | str) -> None:
+        """Record one request of endpoint ``key``."""
+        if key not in self.endpoints and len(self.endpoints) >= MAX_ENDPOINTS:
+            key = "other"
+        stat = self.endpoints.get(key)
+        if stat is None:
+            stat = self.endpoints[key] = EndpointStat()
+        stat.latency.add(seconds * 1000)
+        stat.statuses[str(status)] += 1
+
+    @contextmanager
+    def measure(self, key: str) -> Iterator[None]:
+        """Record the block as one request; an exception is its status."""
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            yield
+        except Exception as err:
+            status = type(err).__name__
+            raise
+        finally:
+            self.record(key, time.perf_counter() - started, status)
+
+    def summary(self) -> dict[str, Any]:
+        """Return count, mean, max and percentiles (ms) and statuses per endpoint."""
+        summary: dict[str, Any] = {}
+        for key, stat in sorted(self.endpoints.items()):
+            latency = stat.latency
+            summary[key] = {
+                "count": latency.count,
+                "mean_ms": round(latency.total_ms / latency.count, 1),
+                "max_ms": round(latency.max_ms, 1),
+                **{
+                    f"p{percent}_ms": round(latency.percentile(percent) or 0.0, 1)
+                    for percent in PERCENTILES
+                },
+                "statuses": dict(stat.statuses),
+                "histogram": {
+                    f"<={bound}": in_bucket
+                    for bound, in_bucket in zip(
+                        (*LATENCY_BUCKETS_MS, "inf"), latency.buckets, strict=True
+                    )
+                    if in_bucket
+                },
+            }
+        return summary
+
+
+ENDPOINT_STATS: HassKey[EndpointStats] = HassKey(f"{DOMAIN}_endpoint_stats")
+
+
+def async_get_endpoint_stats(hass: HomeAssistant) -> EndpointStats:
+    """Return the endpoint statistics of this Home Assistant instance."""
+    stats = hass.data.get(ENDPOINT_STATS)
+    if stats is None:
+        stats = hass.data[ENDPOINT_STATS] = EndpointStats()
+    return stats
+
+
+def metrics_trace_config(endpoints: EndpointStats | None = None) -> TraceConfig:
+    """Return a trace config feeding the current poll's and endpoint metrics."""
+
+    async def on_request_start(
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ) -> None:
+        context.started = time.perf_counter()
+
+    async def on_request_end(
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        if (metrics := _CURRENT_POLL.get()) is not None:
+            metrics.record_request(params.response.status)
+        if endpoints is not None:
+            endpoints.record(
+                endpoint_key(params.url),
+                time.perf_counter() - context.started,
+                params.response.status,
+            )
+
+    async def on_request_exception(
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestExceptionParams,
+    ) -> None:
+        if (metrics := _CURRENT_POLL.get()) is not None:
+            metrics.record_request(None)
+        if endpoints is not None:
+            endpoints.record(
+                endpoint_key(params.url),
+                time.perf_counter() - context.started,
+                type(params.exception).__name__,
+            )
+
+    async def on_response_chunk_received(
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceResponseChunkReceivedParams,
+    ) -> None:
+        if (metrics := _CURRENT_POLL.get()) is not None:
+            metrics.record_bytes(len(params.chunk))
+
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    trace_config.on_response_chunk_received.append(on_response_chunk_received)
+    return trace_config
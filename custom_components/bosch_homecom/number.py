@@ -6,7 +6,12 @@ from typing import Any
 
 from homeassistant import config_entries, core
 from homeassistant.components.number import NumberEntity, NumberMode
-from homeassistant.const import UnitOfElectricCurrent, UnitOfTemperature, UnitOfTime
+from homeassistant.const import (
+    Platform,
+    UnitOfElectricCurrent,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -18,6 +23,7 @@ from .coordinator import (
     BoschComModuleCoordinatorK40,
     BoschComModuleCoordinatorRrc2,
 )
+from .structure import async_track_structure
 
 PARALLEL_UPDATES = 1
 
@@ -65,9 +71,27 @@ async def async_setup_entry(
                     )
                 )
         if coordinator.data.device["deviceType"] == "rrc2":
-            entities.extend(_build_rrc2_numbers(coordinator))
+            rrc2_numbers = _build_rrc2_numbers(coordinator)
+            entities.extend(rrc2_numbers)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.NUMBER,
+                _build_rrc2_numbers,
+                rrc2_numbers,
+                async_add_entities,
+            )
         if coordinator.data.device["deviceType"] == "icom":
-            entities.extend(_build_icom_dhw_numbers(coordinator))
+            icom_numbers = _build_icom_dhw_numbers(coordinator)
+            entities.extend(icom_numbers)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.NUMBER,
+                _build_icom_dhw_numbers,
+                icom_numbers,
+                async_add_entities,
+            )
     # Extra K40/ICOM number entities
     for coordinator in coordinators:
         if isinstance(
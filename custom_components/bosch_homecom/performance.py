@@ -0,0 +1,218 @@
+"""Heat pump efficiency (COP and seasonal COP) from the energy recordings."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .recordings import Recording
+from .statistics import StatisticSeries, StatisticsImporter, external_statistic_id
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+# Domain -> (heat produced, electricity used) keys of coordinator.recordings.
+COP_DOMAINS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "total": (
+        "heat_produced_total",
+        ("energy_compressor_total", "energy_eheater_total"),
+    ),
+    "ch": ("heat_produced_ch", ("energy_compressor_ch", "energy_eheater_ch")),
+    "dhw": ("heat_produced_dhw", ("energy_compressor_dhw", "energy_eheater_dhw")),
+    "cooling": ("heat_produced_cooling", ("energy_compressor_cooling",)),
+    "pool": ("heat_produced_pool", ("energy_compressor_pool", "energy_eheater_pool")),
+}
+COP_PERIODS = ("hour", "today", "season")
+
+# The seasonal COP covers this many days, the newest included.
+SEASON_DAYS = 365
+
+# Below this much electricity (kWh) a COP is mostly rounding noise.
+COP_MIN_ELECTRICITY = 0.01
+
+
+def cop(heat: float, electricity: float) -> float | None:
+    """Return heat / electricity, None when too little electricity was used."""
+    if electricity < COP_MIN_ELECTRICITY:
+        return None
+    return round(heat / electricity, 2)
+
+
+def recorded_domains(keys: Iterable[str]) -> list[str]:
+    """Return the COP domains whose heat and some electricity are recorded."""
+    keys = set(keys)
+    return [
+        domain
+        for domain, (heat_key, electricity_keys) in COP_DOMAINS.items()
+        if heat_key in keys and not keys.isdisjoint(electricity_keys)
+    ]
+
+
+class HeatPumpPerformance:
+    """Running COP of each domain over the last hour, the day and the season.
+
+    Fed the hourly recordings of one day at a time. Each hour is counted once
+    per domain, when it is over and its heat and every electricity bucket are
+    in, or once its day is sealed (a heater that did not run may leave none):
+    it adds to the day's and the season's running sums, so an update costs
+    O(new hours). Days dropping out of the season are subtracted again. The
+    daily sums and the hours counted are persisted, so the seasonal figure
+    survives restarts; each counted hour's COP also goes into long-term
+    statistics.
+    """
+
+    def __init__(self, hass: HomeAssistant, device_id: str, name: str) -> None:
+        """Initialize the tracker with its own storage file."""
+        self.device_id = device_id
+        self.name = name
+        self.statistics = StatisticsImporter(hass, f"performance.{device_id}")
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.performance.{device_id}"
+        )
+        # Domain -> day -> [heat, electricity] in kWh.
+        self._days: dict[str, dict[date, list[float]]] | None = None
+        # Domain -> day -> hour slots already counted, for the last two days.
+        self._counted: dict[str, dict[date, set[int]]] = {}
+        # Domain -> [heat, electricity] over the season.
+        self._season: dict[str, list[float]] = {}
+        self._last_hour: dict[str, float | None] = {}
+        self.today: date | None = None
+
+    async def async_load(self) -> None:
+        """Load the persisted daily sums once and total up the season."""
+        if self._days is not None:
+            return
+        stored = await self._store.async_load() or {}
+        self._days = {
+            domain: {date.fromisoformat(day): sums for day, sums in days.items()}
+            for domain, days in (stored.get("days") or {}).items()
+        }
+        self._counted = {
+            domain: {date.fromisoformat(day): set(slots) for day, slots in days.items()}
+            for domain, days in (stored.get("counted") or {}).items()
+        }
+        self._season = {
+            domain: [
+                sum(sums[0] for sums in days.values()),
+                sum(sums[1] for sums in days.values()),
+            ]
+            for domain, days in self._days.items()
+        }
+
+    def cop(self, domain: str, period: str) -> float | None:
+        """Return the COP of ``domain`` over ``period`` (see COP_PERIODS)."""
+        if period == "hour":
+            return self._last_hour.get(domain)
+        if period == "today":
+            sums = ((self._days or {}).get(domain) or {}).get(self.today)
+        else:
+            sums = self._season.get(domain)
+        return cop(*sums) if sums else None
+
+    async def async_add(
+        self,
+        day: date,
+        recordings: dict[str, Recording],
+        before: datetime,
+        sealed: bool = False,
+    ) -> int:
+        """Count the hours of ``day`` that ended by ``before``; return how many.
+
+        A past hour counts once any of its electricity is in; a bucket missing
+        from another electricity recording is zero, since an electric heater
+        that did not run leaves none. Until ``day`` is ``sealed`` an hour
+        without any electricity bucket waits, as Bosch fills them late.
+        """
+        await self.async_load()
+        assert self._days is not None
+        if self.today is None or day > self.today:
+            self.today = day
+        added = 0
+        for domain, (heat_key, electricity_keys) in COP_DOMAINS.items():
+            heat = recordings.get(heat_key)
+            electricity = [
+                dict(zip(recording.slots, recording.values, strict=True))
+                for key in electricity_keys
+                if (recording := recordings.get(key)) is not None
+            ]
+            if heat is None or not electricity:
+                continue
+            counted = self._counted.setdefault(domain, {}).setdefault(day, set())
+            hours: list[tuple[datetime, float | None]] = []
+            sums = self._days.setdefault(domain, {}).setdefault(day, [0.0, 0.0])
+            season = self._season.setdefault(domain, [0.0, 0.0])
+            for slot, heat_kwh in zip(heat.slots, heat.values, strict=True):
+                start = heat.start + heat.step * slot
+                if slot in counted or start >= before:
+                    continue
+                if not sealed and not any(slot in buckets for buckets in electricity):
+                    continue
+                electricity_kwh = sum(buckets.get(slot, 0.0) for buckets in electricity)
+                counted.add(slot)
+                sums[0] += heat_kwh
+                sums[1] += electricity_kwh
+                season[0] += heat_kwh
+                season[1] += electricity_kwh
+                hours.append((start, cop(heat_kwh, electricity_kwh)))
+            if not hours:
+                continue
+            added += len(hours)
+            self._last_hour[domain] = max(hours)[1]
+            await self.statistics.async_add(
+                StatisticSeries(
+                    external_statistic_id(self.device_id, f"cop_{domain}"),
+                    f"{self.name} COP {domain}",
+                    None,
+                    None,
+                    kind="mean",
+                ),
+                [(start, value) for start, value in hours if value is not None],
+            )
+        if added:
+            _LOGGER.debug("Device %s: %s hours counted for COP", self.device_id, added)
+            self._prune()
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+        return added
+
+    def _prune(self) -> None:
+        """Drop the days that left the season, subtracting them again."""
+        assert self._days is not None and self.today is not None
+        first = self.today - timedelta(days=SEASON_DAYS - 1)
+        for domain, days in self._days.items():
+            for day in [day for day in days if day < first]:
+                heat, electricity = days.pop(day)
+                self._season[domain][0] -= heat
+                self._season[domain][1] -= electricity
+        yesterday = self.today - timedelta(days=1)
+        for days in self._counted.values():
+            for day in [day for day in days if day < yesterday]:
+                del days[day]
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "days": {
+                domain: {day.isoformat(): sums for day, sums in days.items()}
+                for domain, days in (self._days or {}).items()
+            },
+            "counted": {
+                domain: {day.isoformat(): sorted(slots) for day, slots in days.items()}
+                for domain, days in self._counted.items()
+            },
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Return each domain's COP over every period for diagnostics."""
+        return {
+            domain: {period: self.cop(domain, period) for period in COP_PERIODS}
+            | {"season_days": len((self._days or {}).get(domain) or {})}
+            for domain in COP_DOMAINS
+            if domain in self._season
+        }
@@ -0,0 +1,253 @@
+"""Poll scheduling policies of the pointt coordinators."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from enum import StrEnum
+import random
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ADAPTIVE_POLL_MAX_INTERVAL,
+    ADAPTIVE_POLL_RELAX_FACTOR,
+    ADAPTIVE_POLL_WRITE_HOLD,
+    BREAKER_BACKOFF,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_BACKOFF,
+    COMMODULE_IDLE_INTERVAL,
+    COMMODULE_SESSION_INTERVAL,
+    POLL_STAGGER_JITTER,
+)
+
+_UNSEEN = object()
+
+
+def stagger_offsets(
+    count: int,
+    interval: timedelta,
+    jitter: float = POLL_STAGGER_JITTER,
+    rng: random.Random | None = None,
+) -> list[timedelta]:
+    """Return phase offsets spreading ``count`` polls evenly over ``interval``.
+
+    Poll ``i`` gets slot ``i`` of ``count`` equal slots, moved later by up to
+    ``jitter`` of a slot, so the order holds but entries set up together do not
+    fall into step.
+    """
+    if count <= 0:
+        return []
+    uniform = (rng or random).uniform
+    slot = interval / count
+    return [slot * (index + uniform(0, jitter)) for index in range(count)]
+
+
+class AdaptivePollInterval:
+    """Poll interval that follows how active a device is.
+
+    The configured interval is the fastest one. Each poll reports a fingerprint
+    of the device's activity (heat demand, modulation, charge point state,
+    ...): when it changed the interval snaps back to the configured one, when
+    it did not the interval grows by ADAPTIVE_POLL_RELAX_FACTOR up to
+    ADAPTIVE_POLL_MAX_INTERVAL. A write by the user keeps the configured
+    interval for ADAPTIVE_POLL_WRITE_HOLD, so its effects show up promptly.
+    """
+
+    def __init__(
+        self,
+        base: timedelta,
+        maximum: timedelta = ADAPTIVE_POLL_MAX_INTERVAL,
+        factor: float = ADAPTIVE_POLL_RELAX_FACTOR,
+        hold: timedelta = ADAPTIVE_POLL_WRITE_HOLD,
+    ) -> None:
+        """Initialize at the configured interval."""
+        self.base = base
+        self.maximum = max(base, maximum)
+        self.factor = factor
+        self.hold = hold
+        self.interval = base
+        self.changed = 0
+        self.stable = 0
+        self._fingerprint: Any = _UNSEEN
+        self._fast_until: datetime | None = None
+
+    def observe(self, fingerprint: Any) -> timedelta:
+        """Take a poll's activity fingerprint and return the next interval."""
+        if fingerprint != self._fingerprint:
+            self.changed += 1
+            self.interval = self.base
+        elif self._fast_until is not None and dt_util.utcnow() < self._fast_until:
+            self.stable += 1
+            self.interval = self.base
+        else:
+            self.stable += 1
+            self.interval = min(self.maximum, self.interval * self.factor)
+        self._fingerprint = fingerprint
+        return self.interval
+
+    def note_write(self) -> timedelta:
+        """Stay at the configured interval for a while after a user's write."""
+        self._fast_until = dt_util.utcnow() + self.hold
+        self.interval = self.base
+        return self.interval
+
+    def stats(self) -> dict[str, Any]:
+        """Return the interval and the activity counters for diagnostics."""
+        return {
+            "interval": self.interval.total_seconds(),
+            "base": self.base.total_seconds(),
+            "maximum": self.maximum.total_seconds(),
+            "changed_polls": self.changed,
+            "stable_polls": self.stable,
+        }
+
+
+class BreakerState(StrEnum):
+    """State of a device's circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop polling a device that does not respond.
+
+    An offline gateway makes every poll go through homecom_alt's retries before
+    failing. After ``threshold`` consecutive polls failed that way the breaker
+    opens and polls are failed at once, without a request. Once the back-off
+    has passed it is half open: the next poll is a probe. A successful poll
+    closes the breaker; a failed probe opens it again for twice the back-off,
+    up to ``max_backoff``.
+    """
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_FAILURE_THRESHOLD,
+        backoff: timedelta = BREAKER_BACKOFF,
+        max_backoff: timedelta = BREAKER_MAX_BACKOFF,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.threshold = threshold
+        self.base_backoff = backoff
+        self.max_backoff = max_backoff
+        self.backoff = backoff
+        self.failures = 0
+        self.trips = 0
+        self.opened_at: datetime | None = None
+        self.retry_at: datetime | None = None
+
+    @property
+    def state(self) -> BreakerState:
+        """Return the current state."""
+        if self.retry_at is None:
+            return BreakerState.CLOSED
+        if dt_util.utcnow() < self.retry_at:
+            return BreakerState.OPEN
+        return BreakerState.HALF_OPEN
+
+    def allow(self) -> bool:
+        """Return whether a poll may go out now."""
+        return self.state is not BreakerState.OPEN
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.backoff = self.base_backoff
+        self.opened_at = self.retry_at = None
+
+    def record_failure(self) -> None:
+        """Count a poll the device did not answer; open at the threshold."""
+        self.failures += 1
+        now = dt_util.utcnow()
+        if self.retry_at is not None:
+            # The probe failed.
+            self.backoff = min(self.backoff * 2, self.max_backoff)
+        elif self.failures >= self.threshold:
+            self.trips += 1
+            self.opened_at = now
+        else:
+            return
+        self.retry_at = now + self.backoff
+
+    def stats(self) -> dict[str, Any]:
+        """Return the state and counters for diagnostics and the entity."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "backoff": self.backoff.total_seconds(),
+            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
+            "retry_at": self.retry_at.isoformat() if self.retry_at else None,
+        }
+
+
+class ChargingCadence:
+    """Poll cadence of a wallbox that follows its charging sessions.
+
+    During a session the charge points' telemetry (state, power, phases) is
+    read every COMMODULE_SESSION_INTERVAL and everything else keeps the
+    configured interval. Without a session nothing changes quickly, so the
+    wallbox is polled at most every COMMODULE_IDLE_INTERVAL.
+    """
+
+    def __init__(
+        self,
+        base: timedelta,
+        session: timedelta = COMMODULE_SESSION_INTERVAL,
+        idle: timedelta = COMMODULE_IDLE_INTERVAL,
+    ) -> None:
+        """Initialize outside a session."""
+        self.base = base
+        self.session = session
+        self.idle = idle
+        self.charging = False
+        self.sessions = 0
+        self.telemetry_reads = 0
+        self.full_reads = 0
+        self._full_read: datetime | None = None
+        # Interval in use when the current session started.
+        self._resting: timedelta | None = None
+
+    def full_read_due(self) -> bool:
+        """Return whether the next poll reads everything, not just telemetry."""
+        return (
+            not self.charging
+            or self._full_read is None
+            or dt_util.utcnow() - self._full_read >= self.base
+        )
+
+    def note_read(self, full: bool) -> None:
+        """Count a poll; ``full`` when it read everything."""
+        if full:
+            self.full_reads += 1
+            self._full_read = dt_util.utcnow()
+        else:
+            self.telemetry_reads += 1
+
+    def observe(self, charging: bool, interval: timedelta) -> timedelta:
+        """Take whether a session is on and return the next poll interval.
+
+        ``interval`` is the one the coordinator would use otherwise. When a
+        session ends, the interval in use before it started is restored.
+        """
+        if charging:
+            if not self.charging:
+                self.sessions += 1
+                self._resting = interval
+            self.charging = True
+            return min(self.session, interval)
+        if self.charging:
+            interval = self._resting or self.base
+        self.charging = False
+        return max(self.idle, interval)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the session state and read counters for diagnostics."""
+        return {
+            "charging": self.charging,
+            "sessions": self.sessions,
+            "telemetry_reads": self.telemetry_reads,
+            "full_reads": self.full_reads,
+        }
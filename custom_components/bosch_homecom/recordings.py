@@ -0,0 +1,269 @@
+"""Parsing and aggregation of /recordings/* time-series."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from itertools import compress
+from operator import truediv
+from typing import Any
+
+from homeassistant.const import UnitOfEnergy, UnitOfTemperature, UnitOfVolume
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import (
+    EnergyConverter,
+    TemperatureConverter,
+    VolumeConverter,
+)
+
+HOUR = timedelta(hours=1)
+QUARTER_HOUR = timedelta(minutes=15)
+
+# Paths per bulk request the pointt API accepts.
+RECORDINGS_BULK_LIMIT = 30
+
+# How long after midnight the previous day is read for its final buckets, at
+# most; Bosch fills a day's last hour 1-2 hours late.
+RECORDINGS_TAIL_WINDOW = timedelta(hours=6)
+
+# Bosch ``unitOfMeasure`` -> HA unit, and the statistics unit class of each.
+RECORDING_UNITS = {
+    "l": UnitOfVolume.LITERS,
+    "m3": UnitOfVolume.CUBIC_METERS,
+    "kWh": UnitOfEnergy.KILO_WATT_HOUR,
+    "C": UnitOfTemperature.CELSIUS,
+}
+RECORDING_UNIT_CLASSES = {
+    UnitOfVolume.LITERS: VolumeConverter.UNIT_CLASS,
+    UnitOfVolume.CUBIC_METERS: VolumeConverter.UNIT_CLASS,
+    UnitOfEnergy.KILO_WATT_HOUR: EnergyConverter.UNIT_CLASS,
+    UnitOfTemperature.CELSIUS: TemperatureConverter.UNIT_CLASS,
+}
+
+
+def local_day_length(start: datetime) -> timedelta:
+    """Return the length of the local day ``start`` falls on: 23, 24 or 25 h."""
+    day = dt_util.as_local(start).date()
+    return dt_util.as_utc(
+        dt_util.start_of_local_day(day + timedelta(days=1))
+    ) - dt_util.as_utc(dt_util.start_of_local_day(day))
+
+
+def recording_step(payload: dict[str, Any], slots: int, start: datetime) -> timedelta:
+    """Return the bucket length of a yRecording of the day starting at ``start``.
+
+    An ISO 8601 ``sampleRate`` in the payload wins. Without one, a day with
+    more slots than its local length has hours (23 to 25) is in quarter hours,
+    as EMON3 records, and any other in hours.
+    """
+    if isinstance(rate := payload.get("sampleRate"), str) and (
+        step := dt_util.parse_duration(rate)
+    ):
+        return step
+    return QUARTER_HOUR if slots > local_day_length(start) // HOUR else HOUR
+
+
+@dataclass(frozen=True, slots=True)
+class Recording:
+    """The populated buckets of one yRecording, as compact typed arrays.
+
+    Bosch returns one ``{"y", "c"}`` slot per bucket of the requested day:
+    ``y`` is the bucket's amount (kWh, litres) or, for sampled sensors, the sum
+    of its ``c`` samples. Slots with ``c <= 0`` are placeholders for buckets
+    not populated yet and are dropped while parsing, so ``slots`` holds the
+    position of each kept bucket and ``size`` the number of slots. Parsing,
+    hourly() and buckets() go through the buckets one by one in Python; the
+    sums, minima and maxima of aggregate() run over the arrays in C.
+    """
+
+    start: datetime
+    step: timedelta
+    size: int
+    slots: array
+    values: array
+    counts: array
+
+    @classmethod
+    def parse(
+        cls, payload: Any, start: datetime, step: timedelta | None = None
+    ) -> Recording:
+        """Parse a yRecording whose first slot starts at ``start``.
+
+        Without ``step`` it is taken from the payload (see recording_step).
+        """
+        if not isinstance(payload, dict):
+            payload = {}
+        recording = payload.get("recording")
+        if not isinstance(recording, list):
+            recording = []
+        slots, values, counts = array("I"), array("d"), array("d")
+        for index, item in enumerate(recording):
+            if not isinstance(item, dict):
+                continue
+            y, c = item.get("y"), item.get("c")
+            if isinstance(c, (int, float)) and c > 0 and isinstance(y, (int, float)):
+                slots.append(index)
+                values.append(y)
+                counts.append(c)
+        if step is None:
+            step = recording_step(payload, len(recording), start)
+        return cls(dt_util.as_utc(start), step, len(recording), slots, values, counts)
+
+    def __len__(self) -> int:
+        """Return the number of populated buckets."""
+        return len(self.slots)
+
+    @property
+    def complete(self) -> bool:
+        """Return whether the day's final bucket is populated, so it is whole.
+
+        The final bucket is the last ``step`` of the local day, whatever number
+        of slots Bosch sent.
+        """
+        expected = local_day_length(self.start) // self.step
+        return bool(self.slots) and self.slots[-1] == expected - 1
+
+    def means(self) -> array:
+        """Return each bucket's sample mean, ``y / c``."""
+        return array("d", map(truediv, self.values, self.counts))
+
+    def aggregate(self, agg: str) -> float | None:
+        """Return the ``sum``, ``avg``, ``min``, ``max`` or ``last`` of the day.
+
+        ``sum`` adds the amounts and is 0 without buckets. The others are over
+        the sample means, with ``avg`` weighted by the sample counts; they are
+        None without buckets.
+        """
+        if agg == "sum":
+            return sum(self.values)
+        if not self.slots:
+            return None
+        if agg == "avg":
+            return sum(self.values) / sum(self.counts)
+        if agg == "min":
+            return min(self.means())
+        if agg == "max":
+            return max(self.means())
+        if agg == "last":
+            return self.values[-1] / self.counts[-1]
+        raise ValueError(f"Unknown aggregation {agg}")
+
+    def hourly(self) -> Recording:
+        """Return the recording with its sub-hour buckets merged per hour."""
+        per_hour = HOUR // self.step
+        if per_hour <= 1:
+            return self
+        slots, values, counts = array("I"), array("d"), array("d")
+        for slot, y, c in zip(self.slots, self.values, self.counts, strict=True):
+            hour = slot // per_hour
+            if slots and slots[-1] == hour:
+                values[-1] += y
+                counts[-1] += c
+            else:
+                slots.append(hour)
+                values.append(y)
+                counts.append(c)
+        return Recording(
+            self.start, HOUR, -(-self.size // per_hour), slots, values, counts
+        )
+
+    def buckets(
+        self, agg: str = "sum", before: datetime | None = None
+    ) -> list[tuple[datetime, float]]:
+        """Return (start, value) per bucket, optionally those before ``before``.
+
+        The value is the amount for ``sum`` recordings, else the sample mean.
+        """
+        starts = [self.start + self.step * slot for slot in self.slots]
+        values = self.values if agg == "sum" else self.means()
+        if before is None:
+            return list(zip(starts, values, strict=True))
+        keep = [start < before for start in starts]
+        return list(zip(compress(starts, keep), compress(values, keep), strict=True))
+
+
+def recording_path(path: str, day: date) -> str:
+    """Return the bulk path reading one day of the recording at ``path``."""
+    return f"{path}?interval={day.isoformat()}"
+
+
+async def async_read_recordings(
+    bhc: Any, device_id: str, paths: list[str]
+) -> dict[str, Any]:
+    """Read ``paths`` in bulk requests of at most RECORDINGS_BULK_LIMIT."""
+    result: dict[str, Any] = {}
+    for index in range(0, len(paths), RECORDINGS_BULK_LIMIT):
+        chunk = paths[index : index + RECORDINGS_BULK_LIMIT]
+        result.update(await bhc.async_request_bulk(device_id, chunk) or {})
+    return result
+
+
+class RecordingDays:
+    """The days of a device's recordings still to read.
+
+    Today is read on every fetch. At the rollover the day that ended becomes
+    the tail: its paths go along in the same bulk request until their final
+    bucket is populated, or at most RECORDINGS_TAIL_WINDOW after midnight.
+    Then the day is sealed and never read again, so daily totals keep their
+    last hours at no cost to the regular polls.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no day read yet."""
+        self.today: date | None = None
+        self.tail: date | None = None
+        self.sealed: date | None = None
+        # Paths whose tail day was read whole.
+        self._complete: set[str] = set()
+
+    def requests(
+        self, now: datetime, paths: Iterable[str]
+    ) -> dict[tuple[date, str], str]:
+        """Return the bulk path of each (day, path) to read at ``now``."""
+        today = dt_util.as_local(now).date()
+        if self.today is not None and today > self.today:
+            self.tail, self._complete = self.today, set()
+        self.today = today
+        if (
+            self.tail is not None
+            and now - dt_util.start_of_local_day(today) >= RECORDINGS_TAIL_WINDOW
+        ):
+            self.sealed, self.tail = self.tail, None
+        requests = {}
+        for path in paths:
+            if self.is_open(path):
+                requests[self.tail, path] = recording_path(path, self.tail)
+            requests[today, path] = recording_path(path, today)
+        return requests
+
+    def is_open(self, path: str) -> bool:
+        """Return whether the tail day of ``path`` is still to be read."""
+        return self.tail is not None and path not in self._complete
+
+    def note(self, path: str, recording: Recording) -> None:
+        """Record a read of the tail day of ``path``."""
+        if recording.complete:
+            self._complete.add(path)
+
+    def note_not_recorded(self, path: str) -> None:
+        """Record that ``path`` answered 404: there is no tail day to wait for.
+
+        Any other missing answer leaves the tail open, to be read again.
+        """
+        self._complete.add(path)
+
+    def seal_if_complete(self, paths: Iterable[str]) -> None:
+        """Seal the tail day once every path read it whole."""
+        if self.tail is not None and not any(map(self.is_open, paths)):
+            self.sealed, self.tail = self.tail, None
+
+    def stats(self) -> dict[str, Any]:
+        """Return the open and sealed days for diagnostics."""
+        return {
+            "today": self.today.isoformat() if self.today else None,
+            "tail": self.tail.isoformat() if self.tail else None,
+            "sealed": self.sealed.isoformat() if self.sealed else None,
+            "tail_complete": sorted(self._complete),
+        }
@@ -0,0 +1,285 @@
+"""Bulk reads of RRC2 (Remeha Remote Control) resources."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import dataclasses
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homecom_alt import BHCDeviceRrc2, HomeComRrc2
+
+from .const import DOMAIN, RRC2_BULK_CHUNK, RRC2_SKIP_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+# Fields of BHCDeviceRrc2 holding resources. device, firmware and notifications
+# are not resources of the gateway and are carried over as they are.
+RESOURCE_FIELDS = (
+    "zones",
+    "heating_circuits",
+    "dhw_circuits",
+    "heat_sources",
+    "away_mode",
+    "outdoor_temp",
+    "indoor_humidity",
+    "devices",
+    "gateway_info",
+    "system_location",
+)
+
+# Fields and resources describing how the installation is set up rather than
+# its state: lists, names, icons, program and zone assignments, identities.
+# They change when the installation is reconfigured, which the structure read
+# or a user's write picks up; the fast polls leave them out.
+STRUCTURE_FIELDS = frozenset({"gateway_info", "system_location"})
+STRUCTURE_KEYS = frozenset(
+    {
+        "assignedHC",
+        "clockProgram",
+        "icon",
+        "info",
+        "list",
+        "name",
+        "productName",
+        "sgtin",
+        "type",
+        "uuid",
+        "versionFirmware",
+        "zone",
+    }
+)
+
+
+def is_structure(field: str, path: str) -> bool:
+    """Return whether the resource at ``path`` of ``field`` is structure."""
+    return (
+        field in STRUCTURE_FIELDS
+        or "/programs/" in path
+        or path.rsplit("/", 1)[-1] in STRUCTURE_KEYS
+    )
+
+
+def is_resource(node: Any) -> bool:
+    """Return whether ``node`` is a resource as the pointt API returns it.
+
+    Resources carry their own path as ``id`` and a ``value`` (or ``values``
+    for arrays); references to circuits carry an ``id`` but no value.
+    """
+    return (
+        isinstance(node, dict)
+        and isinstance(node.get("id"), str)
+        and node["id"].startswith("/")
+        and ("value" in node or "values" in node)
+    )
+
+
+def resource_paths(value: Any) -> list[str]:
+    """Return the paths of all resources inside ``value``, in order."""
+    if is_resource(value):
+        return [value["id"]]
+    if isinstance(value, dict):
+        return [path for item in value.values() for path in resource_paths(item)]
+    if isinstance(value, list):
+        return [path for item in value for path in resource_paths(item)]
+    return []
+
+
+def replace_resources(value: Any, fresh: dict[str, Any], missing: set[str]) -> Any:
+    """Return ``value`` with resources swapped for their fresh payloads.
+
+    Missing resources become None; resources not read this time stay as they
+    are.
+    """
+    if is_resource(value):
+        path = value["id"]
+        if path in missing:
+            return None
+        return fresh.get(path, value)
+    if isinstance(value, dict):
+        return {
+            key: replace_resources(item, fresh, missing) for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [replace_resources(item, fresh, missing) for item in value]
+    return value
+
+
+class Rrc2SkipCache:
+    """Paths of one gateway that answered 404, persisted across restarts.
+
+    The Bosch app skips a resource whose cached status is 404. Entries expire
+    after RRC2_SKIP_TTL, so a resource that appears after a firmware update or
+    a change of the heating system is picked up again.
+    """
+
+    def __init__(self, hass: HomeAssistant, device_id: str) -> None:
+        """Initialize the cache with its own storage file."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.rrc2_skip.{device_id}"
+        )
+        self._paths: dict[str, datetime] | None = None
+
+    async def async_load(self) -> None:
+        """Load the persisted paths once."""
+        if self._paths is not None:
+            return
+        stored = await self._store.async_load() or {}
+        self._paths = {}
+        for path, since in (stored.get("paths") or {}).items():
+            if (parsed := dt_util.parse_datetime(since)) is not None:
+                self._paths[path] = parsed
+
+    def skips(self, path: str) -> bool:
+        """Return whether ``path`` answered 404 recently enough to be left out."""
+        since = (self._paths or {}).get(path)
+        return since is not None and dt_util.utcnow() - since < RRC2_SKIP_TTL
+
+    def add(self, paths: Iterable[str]) -> None:
+        """Remember ``paths`` as missing from now on."""
+        self._update(paths, dt_util.utcnow())
+
+    def discard(self, paths: Iterable[str]) -> None:
+        """Forget ``paths``; they were seen answering."""
+        self._update(paths, None)
+
+    def __len__(self) -> int:
+        """Return the number of remembered paths."""
+        return len(self._paths or {})
+
+    def _update(self, paths: Iterable[str], since: datetime | None) -> None:
+        if self._paths is None:
+            self._paths = {}
+        changed = False
+        for path in paths:
+            if since is not None:
+                self._paths[path] = since
+                changed = True
+            elif self._paths.pop(path, None) is not None:
+                changed = True
+        if changed:
+            self._store.async_delay_save(self._data, STORAGE_SAVE_DELAY)
+
+    def _data(self) -> dict[str, Any]:
+        return {
+            "paths": {
+                path: since.isoformat() for path, since in (self._paths or {}).items()
+            }
+        }
+
+
+class Rrc2BulkReader:
+    """Re-read the resources of an RRC2 gateway through POST bulk.
+
+    The library's full update finds the zones, circuits and sub-devices and
+    reads every resource one request at a time. Afterwards this reads the same
+    resources again in chunks of RRC2_BULK_CHUNK, all chunks at once, leaving
+    out the resources the gateway answered 404 for and, unless asked for, the
+    structure resources. Only a 404 marks a resource missing; one left out for
+    any other reason keeps its previous value.
+    """
+
+    def __init__(self, hass: HomeAssistant, bhc: HomeComRrc2, device_id: str) -> None:
+        """Initialize the reader."""
+        self.bhc = bhc
+        self.device_id = device_id
+        self.skip = Rrc2SkipCache(hass, device_id)
+        self.requests = 0
+        self.paths = 0
+        self.structure_paths = 0
+        # Paths answered since the last structure read. One of them going
+        # missing means a zone or device was removed.
+        self._answered: set[str] = set()
+        self.structure_changed = False
+
+    async def async_seen(self, data: BHCDeviceRrc2) -> None:
+        """Take note of the resources a full update returned."""
+        await self.skip.async_load()
+        self._answered.clear()
+        self.structure_changed = False
+        self.skip.discard(
+            path
+            for field in RESOURCE_FIELDS
+            for path in resource_paths(getattr(data, field, None))
+        )
+
+    async def async_read(
+        self, data: BHCDeviceRrc2, *, structure: bool = False
+    ) -> BHCDeviceRrc2:
+        """Return ``data`` with its state read afresh.
+
+        With ``structure`` the structure resources are read as well.
+        """
+        await self.skip.async_load()
+        wanted: dict[str, None] = {}
+        structure_paths = 0
+        for field in RESOURCE_FIELDS:
+            for path in resource_paths(getattr(data, field, None)):
+                if self.skip.skips(path) or path in wanted:
+                    continue
+                if is_structure(field, path):
+                    if not structure:
+                        continue
+                    structure_paths += 1
+                wanted[path] = None
+        self.structure_paths = structure_paths
+        paths = list(wanted)
+        chunks = [
+            paths[start : start + RRC2_BULK_CHUNK]
+            for start in range(0, len(paths), RRC2_BULK_CHUNK)
+        ]
+        results = await asyncio.gather(
+            *(self.bhc.async_request_bulk(self.device_id, chunk) for chunk in chunks)
+        )
+        self.requests += len(chunks)
+        self.paths = len(paths)
+
+        # The library notes the status of each path a bulk answer left out.
+        statuses = self.bhc._last_endpoint_status
+        fresh: dict[str, Any] = {}
+        missing: set[str] = set()
+        for chunk, result in zip(chunks, results, strict=True):
+            for path in chunk:
+                if isinstance(payload := (result or {}).get(path), dict):
+                    fresh[path] = payload
+                elif statuses.get((self.device_id, path)) == 404:
+                    missing.add(path)
+                # Anything else is a failed read rather than a resource the
+                # gateway does not have: the previous value stays.
+        if missing & self._answered:
+            self.structure_changed = True
+        self._answered.update(fresh)
+        if missing:
+            _LOGGER.debug(
+                "Device %s: %s resources not found, skipping them",
+                self.device_id,
+                len(missing),
+            )
+            self.skip.add(missing)
+
+        return dataclasses.replace(
+            data,
+            **{
+                field: replace_resources(getattr(data, field), fresh, missing)
+                for field in RESOURCE_FIELDS
+                if hasattr(data, field)
+            },
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return the request counters and skipped paths for diagnostics."""
+        return {
+            "bulk_requests": self.requests,
+            "paths_per_poll": self.paths,
+            "structure_paths": self.structure_paths,
+            "structure_changed": self.structure_changed,
+            "skipped_paths": len(self.skip),
+        }
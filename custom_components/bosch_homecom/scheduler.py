@@ -0,0 +1,313 @@
+"""Account-wide request budget for the Bosch cloud APIs."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Coroutine, Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+import heapq
+import itertools
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientResponse, ClientSession, TraceConfig, TraceRequestEndParams
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_TOKEN
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+from homecom_alt import decode_jwt_sub
+from yarl import URL
+
+from .const import (
+    DOMAIN,
+    SCHEDULER_BURST,
+    SCHEDULER_DEFAULT_RETRY_AFTER,
+    SCHEDULER_MAX_RETRY_AFTER,
+    SCHEDULER_RATE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Who is waiting on a request; lower values are served first."""
+
+    WRITE = 0
+    POLL = 1
+    BACKGROUND = 2
+    DIAGNOSTIC = 3
+
+
+# Methods that change device state: always a user action, never a poll.
+WRITE_METHODS = frozenset({"PUT", "PATCH", "DELETE"})
+
+# Token refreshes are never held back: every other request depends on them.
+_UNMETERED_HOSTS = frozenset({"singlekey-id.com"})
+
+_PRIORITY: ContextVar[RequestPriority] = ContextVar(
+    f"{DOMAIN}_request_priority", default=RequestPriority.POLL
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Send the requests made inside the block with ``priority``."""
+    token = _PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+def parse_retry_after(value: str | None) -> float:
+    """Return the seconds a Retry-After header asks for, within bounds."""
+    if not value:
+        return SCHEDULER_DEFAULT_RETRY_AFTER
+    try:
+        seconds = float(value)
+    except ValueError:
+        # The other form allowed is an HTTP date.
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return SCHEDULER_DEFAULT_RETRY_AFTER
+        seconds = (dt_util.as_utc(when) - dt_util.utcnow()).total_seconds()
+    return min(max(seconds, 0.0), SCHEDULER_MAX_RETRY_AFTER)
+
+
+class RequestScheduler:
+    """Token bucket shared by every request of one account.
+
+    Requests take a token before they are sent (see ScheduledSession). While
+    tokens last they go out at once; when the bucket is empty they queue and
+    are released in priority order as it refills, so a user's write overtakes
+    the polls and the polls overtake recordings, backfills and diagnostics. A
+    429 pauses the whole account for the Retry-After the cloud asked for.
+    """
+
+    def __init__(self, rate: float | None = None, burst: int | None = None) -> None:
+        """Initialize a full bucket; ``rate`` is in requests per second."""
+        self.rate = rate or SCHEDULER_RATE
+        self.burst = burst or SCHEDULER_BURST
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._release: asyncio.TimerHandle | None = None
+        self.throttled = 0
+        self.waited: Counter[str] = Counter()
+        self.wait_seconds: Counter[str] = Counter()
+
+    def _refill(self, now: float) -> None:
+        # After a 429 the refill only starts once the pause is over.
+        if now <= self._refilled:
+            return
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._refilled) * self.rate
+        )
+        self._refilled = now
+
+    def _try_take(self, now: float) -> bool:
+        if now < self._paused_until:
+            return False
+        self._refill(now)
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        """Wait for a token; the queue is served in priority order."""
+        now = time.monotonic()
+        if not self._queue and self._try_take(now):
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), future))
+        self._schedule_release(now)
+        try:
+            await future
+        finally:
+            if not future.done():
+                # Cancelled while queued; the stale entry is skipped on release.
+                future.cancel()
+            self.waited[priority.name.lower()] += 1
+            self.wait_seconds[priority.name.lower()] += time.monotonic() - now
+
+    def _schedule_release(self, now: float) -> None:
+        if self._release is not None or not self._queue:
+            return
+        if now < self._paused_until:
+            delay = self._paused_until - now
+        else:
+            self._refill(now)
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+        self._release = asyncio.get_running_loop().call_later(delay, self._run_release)
+
+    def _run_release(self) -> None:
+        self._release = None
+        now = time.monotonic()
+        while self._queue:
+            if self._queue[0][2].done():
+                heapq.heappop(self._queue)
+                continue
+            if not self._try_take(now):
+                break
+            heapq.heappop(self._queue)[2].set_result(None)
+        self._schedule_release(now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request back for ``seconds`` after a 429."""
+        self.throttled += 1
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        # The cloud is counting already: do not burst the moment it reopens.
+        self._tokens = 0.0
+        self._refilled = self._paused_until
+        if self._release is not None:
+            self._release.cancel()
+            self._release = None
+        self._schedule_release(now)
+        _LOGGER.debug("Rate limited by the cloud, pausing requests for %ss", seconds)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the budget, queue and throttling counters for diagnostics."""
+        now = time.monotonic()
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(
+                min(
+                    float(self.burst),
+                    self._tokens + max(0.0, now - self._refilled) * self.rate,
+                ),
+                1,
+            ),
+            "queued": sum(not entry[2].done() for entry in self._queue),
+            "paused_for": round(max(0.0, self._paused_until - now), 1),
+            "throttled": self.throttled,
+            "waited": dict(self.waited),
+            "wait_seconds": {
+                name: round(seconds, 3) for name, seconds in self.wait_seconds.items()
+            },
+        }
+
+
+REQUEST_SCHEDULERS: HassKey[dict[str, RequestScheduler]] = HassKey(
+    f"{DOMAIN}_request_schedulers"
+)
+
+
+def account_key(entry: ConfigEntry) -> str:
+    """Return the account an entry belongs to: the token's subject."""
+    account = decode_jwt_sub(entry.data.get(CONF_TOKEN))
+    return account or entry.unique_id or entry.entry_id
+
+
+def async_get_request_scheduler(hass: HomeAssistant, account: str) -> RequestScheduler:
+    """Return the scheduler of ``account``, shared by all of its entries."""
+    schedulers = hass.data.setdefault(REQUEST_SCHEDULERS, {})
+    if (scheduler := schedulers.get(account)) is None:
+        scheduler = schedulers[account] = RequestScheduler()
+    return scheduler
+
+
+class _ScheduledRequest:
+    """A request waiting for its token; awaited, or used with ``async with``."""
+
+    def __init__(self, response: Coroutine[Any, Any, ClientResponse]) -> None:
+        """Wrap the coroutine returning the response."""
+        self._response = response
+        self._resp: ClientResponse | None = None
+
+    def __await__(self) -> Generator[Any, None, ClientResponse]:
+        """Return the response."""
+        return self._response.__await__()
+
+    async def __aenter__(self) -> ClientResponse:
+        """Return the response, released again on exit."""
+        self._resp = await self._response
+        return self._resp
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Release the connection of the response."""
+        if self._resp is not None:
+            self._resp.release()
+
+
+class ScheduledSession:
+    """A client session whose requests wait for the account's budget.
+
+    Handed to homecom_alt and the bacon clients in place of the session: they
+    only send through request() and its verb shortcuts, everything else goes to
+    the session itself. The token is taken before the request reaches aiohttp,
+    so the time spent queued neither runs down the request's timeout nor
+    counts as endpoint latency.
+    """
+
+    def __init__(self, session: ClientSession, scheduler: RequestScheduler) -> None:
+        """Initialize the wrapper around ``session``."""
+        self._session = session
+        self._scheduler = scheduler
+
+    def request(self, method: str, url: Any, **kwargs: Any) -> _ScheduledRequest:
+        """Send a request once the budget allows it."""
+        return _ScheduledRequest(self._request(method, url, **kwargs))
+
+    async def _request(self, method: str, url: Any, **kwargs: Any) -> ClientResponse:
+        if URL(str(url)).host not in _UNMETERED_HOSTS:
+            await self._scheduler.acquire(
+                RequestPriority.WRITE
+                if method.upper() in WRITE_METHODS
+                else _PRIORITY.get()
+            )
+        return await self._session.request(method, url, **kwargs)
+
+    def get(self, url: Any, **kwargs: Any) -> _ScheduledRequest:
+        """Send a GET request once the budget allows it."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: Any, **kwargs: Any) -> _ScheduledRequest:
+        """Send a POST request once the budget allows it."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: Any, **kwargs: Any) -> _ScheduledRequest:
+        """Send a PUT request once the budget allows it."""
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: Any, **kwargs: Any) -> _ScheduledRequest:
+        """Send a PATCH request once the budget allows it."""
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: Any, **kwargs: Any) -> _ScheduledRequest:
+        """Send a DELETE request once the budget allows it."""
+        return self.request("DELETE", url, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped session."""
+        return getattr(self._session, name)
+
+
+def scheduler_trace_config(scheduler: RequestScheduler) -> TraceConfig:
+    """Return a trace config pausing the budget when the cloud answers 429."""
+
+    async def on_request_end(
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        if params.response.status == 429:
+            scheduler.pause(
+                parse_retry_after(params.response.headers.get("Retry-After"))
+            )
+
+    trace_config = TraceConfig()
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
@@ -4,6 +4,7 @@ from datetime import timedelta
 
 from homeassistant import config_entries, core
 from homeassistant.components.select import SelectEntity
+from homeassistant.const import Platform
 from homeassistant.core import callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -15,6 +16,7 @@ from .coordinator import (
     BoschComModuleCoordinatorRac,
     BoschComModuleCoordinatorRrc2,
 )
+from .structure import async_track_structure
 
 SCAN_INTERVAL = timedelta(minutes=1440)
 
@@ -75,99 +77,16 @@ async def async_setup_entry(
                         allowedValues=pool["additionalHeaterMode"]["allowedValues"],
                     )
                 )
-            for entry in coordinator.data.dhw_circuits:
-                dhw_id = entry["id"].split("/")[-1]
-                if (
-                    entry.get("operationMode")
-                    and "allowedValues" in entry["operationMode"]
-                ):
-                    entities.append(
-                        BoschComSelectDhwOperationMode(
-                            coordinator=coordinator,
-                            field=dhw_id,
-                            allowedValues=entry["operationMode"]["allowedValues"],
-                        )
-                    )
-                if (
-                    entry.get("currentTemperatureLevel")
-                    and "allowedValues" in entry["currentTemperatureLevel"]
-                ):
-                    entities.append(
-                        BoschComSelectDhwCurrentTemp(
-                            coordinator=coordinator,
-                            field=dhw_id,
-                            allowedValues=entry["currentTemperatureLevel"][
-                                "allowedValues"
-                            ],
-                        )
-                    )
-            for entry in coordinator.data.heating_circuits:
-                hc_id = entry["id"].split("/")[-1]
-                if (
-                    entry.get("operationMode")
-                    and "allowedValues" in entry["operationMode"]
-                ):
-                    entities.append(
-                        BoschComSelectHcOperationMode(
-                            coordinator=coordinator,
-                            field=hc_id,
-                            allowedValues=entry["operationMode"]["allowedValues"],
-                        )
-                    )
-                if (
-                    entry.get("currentSuWiMode")
-                    and "allowedValues" in entry["currentSuWiMode"]
-                ):
-                    entities.append(
-                        BoschComSelectHcSuwiMode(
-                            coordinator=coordinator,
-                            field=hc_id,
-                            allowedValues=entry["currentSuWiMode"]["allowedValues"],
-                        )
-                    )
-                if (
-                    entry.get("heatCoolMode")
-                    and "allowedValues" in entry["heatCoolMode"]
-                ):
-                    entities.append(
-                        BoschComSelectHcHeatcoolMode(
-                            coordinator=coordinator,
-                            field=hc_id,
-                            allowedValues=entry["heatCoolMode"]["allowedValues"],
-                        )
-                    )
-                if (
-                    entry.get("coolingOperationMode")
-                    and "allowedValues" in entry["coolingOperationMode"]
-                ):
-                    entities.append(
-                        BoschComSelectHcCoolingOperationMode(
-                            coordinator=coordinator,
-                            field=hc_id,
-                            allowedValues=entry["coolingOperationMode"][
-                                "allowedValues"
-                            ],
-                        )
-                    )
-                if (
-                    entry.get("nightSwitchMode")
-                    and "allowedValues" in entry["nightSwitchMode"]
-                ):
-                    entities.append(
-                        BoschComSelectHcNightSwitchMode(
-                            coordinator=coordinator,
-                            field=hc_id,
-                            allowedValues=entry["nightSwitchMode"]["allowedValues"],
-                        )
-                    )
-                if entry.get("control") and "allowedValues" in entry["control"]:
-                    entities.append(
-                        BoschComSelectHcControl(
-                            coordinator=coordinator,
-                            field=hc_id,
-                            allowedValues=entry["control"]["allowedValues"],
-                        )
-                    )
+            circuit_selects = _build_k40_circuit_selects(coordinator)
+            entities.extend(circuit_selects)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.SELECT,
+                _build_k40_circuit_selects,
+                circuit_selects,
+                async_add_entities,
+            )
             for entry in coordinator.data.ventilation:
                 zone_id = entry["id"].split("/")[-1]
                 if (
@@ -200,7 +119,16 @@ async def async_setup_entry(
                     )
                 )
         if coordinator.data.device["deviceType"] == "rrc2":
-            entities.extend(_build_rrc2_selects(coordinator))
+            rrc2_selects = _build_rrc2_selects(coordinator)
+            entities.extend(rrc2_selects)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.SELECT,
+                _build_rrc2_selects,
+                rrc2_selects,
+                async_add_entities,
+            )
         if coordinator.data.device["deviceType"] == "commodule":
             for cp in coordinator.data.charge_points or []:
                 cp_id = cp["id"].split("/")[-1]
@@ -1209,6 +1137,88 @@ class BoschComRrc2CircuitSelect(CoordinatorEntity, SelectEntity):
         await self.coordinator.async_request_refresh()
 
 
+def _build_k40_circuit_selects(
+    coordinator: BoschComModuleCoordinatorK40 | BoschComModuleCoordinatorIcom,
+) -> list[SelectEntity]:
+    """Build the DHW and heating circuit selects of a K40/K30/ICOM device."""
+    entities: list[SelectEntity] = []
+    for entry in coordinator.data.dhw_circuits:
+        dhw_id = entry["id"].split("/")[-1]
+        if entry.get("operationMode") and "allowedValues" in entry["operationMode"]:
+            entities.append(
+                BoschComSelectDhwOperationMode(
+                    coordinator=coordinator,
+                    field=dhw_id,
+                    allowedValues=entry["operationMode"]["allowedValues"],
+                )
+            )
+        if (
+            entry.get("currentTemperatureLevel")
+            and "allowedValues" in entry["currentTemperatureLevel"]
+        ):
+            entities.append(
+                BoschComSelectDhwCurrentTemp(
+                    coordinator=coordinator,
+                    field=dhw_id,
+                    allowedValues=entry["currentTemperatureLevel"]["allowedValues"],
+                )
+            )
+    for entry in coordinator.data.heating_circuits:
+        hc_id = entry["id"].split("/")[-1]
+        if entry.get("operationMode") and "allowedValues" in entry["operationMode"]:
+            entities.append(
+                BoschComSelectHcOperationMode(
+                    coordinator=coordinator,
+                    field=hc_id,
+                    allowedValues=entry["operationMode"]["allowedValues"],
+                )
+            )
+        if entry.get("currentSuWiMode") and "allowedValues" in entry["currentSuWiMode"]:
+            entities.append(
+                BoschComSelectHcSuwiMode(
+                    coordinator=coordinator,
+                    field=hc_id,
+                    allowedValues=entry["currentSuWiMode"]["allowedValues"],
+                )
+            )
+        if entry.get("heatCoolMode") and "allowedValues" in entry["heatCoolMode"]:
+            entities.append(
+                BoschComSelectHcHeatcoolMode(
+                    coordinator=coordinator,
+                    field=hc_id,
+                    allowedValues=entry["heatCoolMode"]["allowedValues"],
+                )
+            )
+        if (
+            entry.get("coolingOperationMode")
+            and "allowedValues" in entry["coolingOperationMode"]
+        ):
+            entities.append(
+                BoschComSelectHcCoolingOperationMode(
+                    coordinator=coordinator,
+                    field=hc_id,
+                    allowedValues=entry["coolingOperationMode"]["allowedValues"],
+                )
+            )
+        if entry.get("nightSwitchMode") and "allowedValues" in entry["nightSwitchMode"]:
+            entities.append(
+                BoschComSelectHcNightSwitchMode(
+                    coordinator=coordinator,
+                    field=hc_id,
+                    allowedValues=entry["nightSwitchMode"]["allowedValues"],
+                )
+            )
+        if entry.get("control") and "allowedValues" in entry["control"]:
+            entities.append(
+                BoschComSelectHcControl(
+                    coordinator=coordinator,
+                    field=hc_id,
+                    allowedValues=entry["control"]["allowedValues"],
+                )
+            )
+    return entities
+
+
 def _build_rrc2_selects(
     coordinator: BoschComModuleCoordinatorRrc2,
 ) -> list[SelectEntity]:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import partial
 import json
 import logging
 import re
@@ -19,6 +20,7 @@ from homeassistant.components.sensor import (
 from homeassistant.const import (
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    Platform,
     UnitOfEnergy,
     UnitOfPower,
     UnitOfPressure,
@@ -41,6 +43,9 @@ from .coordinator import (
     BoschComModuleCoordinatorRrc2,
     BoschComModuleCoordinatorWddw2,
 )
+from .performance import COP_PERIODS, recorded_domains
+from .polling import BreakerState
+from .structure import async_track_structure
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,15 +62,6 @@ async def async_setup_entry(
     coordinators = config_entry.runtime_data
     entities: list[SensorEntity] = []
 
-    def _resolve_path(path: list[str], dhw_id: str | None) -> list[str]:
-        """Return a path with {dhw_id} placeholders replaced, if any."""
-        if dhw_id is None:
-            return path
-        resolved = []
-        for p in path:
-            resolved.append(p.format(dhw_id=dhw_id) if "{" in p else p)
-        return resolved
-
     for coordinator in coordinators:
         device_type = coordinator.data.device.get("deviceType")
 
@@ -107,14 +103,17 @@ async def async_setup_entry(
 
         # ---- K40/K30/ICOM (shared subset: dhw, ventilation, heating, hs) ----
         if device_type in ("k40", "k30", "icom"):
-            # DHW circuits
-            for ref in coordinator.data.dhw_circuits:
-                dhw_id = ref["id"].split("/")[-1]
-                entities.append(
-                    BoschComSensorDhw(
-                        coordinator=coordinator, config_entry=config_entry, field=dhw_id
-                    )
-                )
+            # DHW and heating circuits, thermostats
+            circuit_sensors = _build_k40_circuit_sensors(coordinator, config_entry)
+            entities.extend(circuit_sensors)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.SENSOR,
+                partial(_build_k40_circuit_sensors, config_entry=config_entry),
+                circuit_sensors,
+                async_add_entities,
+            )
             # Ventilation
             for ref in coordinator.data.ventilation:
                 zone_id = ref["id"].split("/")[-1]
@@ -125,14 +124,6 @@ async def async_setup_entry(
                         field=zone_id,
                     )
                 )
-            # Heating circuits
-            for ref in coordinator.data.heating_circuits:
-                hc_id = ref["id"].split("/")[-1]
-                entities.append(
-                    BoschComSensorHc(
-                        coordinator=coordinator, config_entry=config_entry, field=hc_id
-                    )
-                )
             # Heat source
             entities.append(
                 BoschComSensorHs(
@@ -197,106 +188,40 @@ async def async_setup_entry(
                     )
                 )
 
-            # Thermostat device sensors
-            for dev in coordinator.data.devices or []:
-                dev_id = dev["id"].split("/")[-1]
-                if dev.get("roomtemperature"):
-                    entities.append(
-                        BoschComThermostatRoomTempSensor(
-                            coordinator, config_entry, dev_id
-                        )
-                    )
-                if dev.get("actualHumidity"):
-                    entities.append(
-                        BoschComThermostatHumiditySensor(
-                            coordinator, config_entry, dev_id
-                        )
-                    )
-                if dev.get("currentRoomSetpoint"):
-                    entities.append(
-                        BoschComThermostatSetpointSensor(
-                            coordinator, config_entry, dev_id
-                        )
-                    )
-                if dev.get("battery"):
-                    entities.append(
-                        BoschComThermostatBatterySensor(
-                            coordinator, config_entry, dev_id
-                        )
-                    )
-                if dev.get("signal"):
-                    entities.append(
-                        BoschComThermostatSignalSensor(
-                            coordinator, config_entry, dev_id
-                        )
-                    )
-
         # ---- ICOM diagnostic extras (healthStatus, brand, hs return/starts) ----
         if device_type == "icom":
             entities.extend(_build_icom_extra_sensors(coordinator))
 
         # ---- RRC2 (zone / hc / dhw / heat sources / system / gateway) ----
         if device_type == "rrc2":
-            for sensor in _build_rrc2_sensors(coordinator, config_entry):
-                entities.append(sensor)
+            rrc2_sensors = _build_rrc2_sensors(coordinator, config_entry)
+            entities.extend(rrc2_sensors)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.SENSOR,
+                partial(_build_rrc2_sensors, config_entry=config_entry),
+                rrc2_sensors,
+                async_add_entities,
+            )
 
         # ---- WDDW2 (existing DHW sensor + NEW generic + NEW derived) ----
         elif device_type == "wddw2":
-            # Existing per-circuit DHW sensor
-            for ref in coordinator.data.dhw_circuits:
-                dhw_id = ref["id"].split("/")[-1]
-                if re.fullmatch(r"dhw\d", dhw_id):
-                    entities.append(
-                        BoschComSensorDhwWddw2(
-                            coordinator=coordinator,
-                            config_entry=config_entry,
-                            field=dhw_id,
-                        )
-                    )
+            # Per-circuit DHW sensors, generic ones from descriptors
+            dhw_sensors = _build_wddw2_dhw_sensors(coordinator, config_entry)
+            entities.extend(dhw_sensors)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.SENSOR,
+                partial(_build_wddw2_dhw_sensors, config_entry=config_entry),
+                dhw_sensors,
+                async_add_entities,
+            )
 
             # Issue #129: surface heat-source + water totals (top-level paths).
             entities.extend(_build_wddw2_totals_sensors(coordinator))
 
-            # NEW: generic sensors from descriptors (BOSCH_SENSOR_DESCRIPTORS["wddw2"])
-            wddw2_desc = BOSCH_SENSOR_DESCRIPTORS.get("wddw2", [])
-            if wddw2_desc:
-                # If descriptors are per-circuit, try to expand per each dhwX
-                dhw_ids = [
-                    ref["id"].split("/")[-1]
-                    for ref in coordinator.data.dhw_circuits
-                    if re.fullmatch(r"dhw\d", ref["id"].split("/")[-1])
-                ] or [
-                    None
-                ]  # fallback to single set if not per circuit
-
-                for desc in wddw2_desc:
-                    for dhw_id in dhw_ids:
-                        path = desc.get("path", [])
-                        resolved_path = _resolve_path(path, dhw_id)
-                        unique_suffix = (
-                            f"{(dhw_id or 'dhw')}-{desc['key']}"
-                            if dhw_id
-                            else f"dhw-{desc['key']}"
-                        )
-                        try:
-                            entities.append(
-                                BoschComGenericSensor(
-                                    coordinator=coordinator,
-                                    name=desc["name"],
-                                    unique_suffix=unique_suffix,
-                                    path=resolved_path,
-                                    unit=desc.get("unit"),
-                                    device_class=desc.get("device_class"),
-                                    state_class=desc.get("state_class"),
-                                    translation_key=desc.get("translation_key"),
-                                    entity_category=desc.get("entity_category"),
-                                )
-                            )
-                        except Exception:  # keep onboarding even if one fails
-                            _LOGGER.debug(
-                                "Failed to add generic sensor %s", unique_suffix
-                            )
-
             # NEW: derived sensors (single set; adjust to per-circuit if precisares)
             try:
                 entities.append(
@@ -550,6 +475,29 @@ async def async_setup_entry(
                     )
                 )
 
+            # Efficiency derived from the recordings (coordinator.performance),
+            # for the domains the first read found recorded.
+            for domain in recorded_domains(
+                [*coordinator.recordings, *coordinator.recordings_previous_day]
+            ):
+                entities.extend(
+                    BoschComCopSensor(coordinator, domain, period)
+                    for period in COP_PERIODS
+                )
+
+    # Poll timing and request counts, for tuning the update interval.
+    for coordinator in coordinators:
+        if getattr(coordinator, "metrics", None) is not None:
+            entities.extend(
+                [
+                    BoschComPollDurationSensor(coordinator, config_entry),
+                    BoschComPollRequestsSensor(coordinator, config_entry),
+                    BoschComPollErrorsSensor(coordinator, config_entry),
+                ]
+            )
+        if getattr(coordinator, "breaker", None) is not None:
+            entities.append(BoschComCircuitBreakerSensor(coordinator, config_entry))
+
     if entities:
         async_add_entities(entities)
 
@@ -2359,19 +2307,9 @@ class BoschComCommoduleChargelogSensor(_CommoduleSensorBase):
         self._attr_suggested_object_id = f"{cp_id}_chargelog"
         self._attr_device_class = SensorDeviceClass.TIMESTAMP
 
-    def _get_sessions(self):
-        """Get charge sessions list (newest first)."""
-        cp = self._get_cp()
-        if cp is None:
-            return []
-        chargelog = cp.get("chargelog")
-        if isinstance(chargelog, list):
-            return chargelog
-        if isinstance(chargelog, dict):
-            sessions = chargelog.get("sessions") or chargelog.get("values") or []
-            if isinstance(sessions, list):
-                return sessions
-        return []
+    def _get_last_session(self) -> dict | None:
+        """Get the newest session of the last charge log read."""
+        return self.coordinator.chargelog.latest.get(self._cp_id)
 
     @property
     def native_value(self):
@@ -2381,11 +2319,8 @@ class BoschComCommoduleChargelogSensor(_CommoduleSensorBase):
         whenever a new session is logged, even if two consecutive sessions
         deliver the same amount of energy.
         """
-        sessions = self._get_sessions()
-        if not sessions:
-            return None
-        last = sessions[0]
-        if not isinstance(last, dict):
+        last = self._get_last_session()
+        if last is None:
             return None
         begin = last.get("begin")
         if not begin:
@@ -2398,11 +2333,8 @@ class BoschComCommoduleChargelogSensor(_CommoduleSensorBase):
     @property
     def extra_state_attributes(self):
         """Return last session details as flat attributes."""
-        sessions = self._get_sessions()
-        if not sessions:
-            return {}
-        last = sessions[0]
-        if not isinstance(last, dict):
+        last = self._get_last_session()
+        if last is None:
             return {}
         attrs = {}
         energy = last.get("energy")
@@ -2435,7 +2367,7 @@ class BoschComCommoduleChargelogSensor(_CommoduleSensorBase):
         if isinstance(auth, dict):
             attrs["auth_source"] = auth.get("source")
             attrs["auth_label"] = auth.get("label")
-        attrs["session_count"] = len(sessions)
+        attrs["session_count"] = self.coordinator.chargelog.logged.get(self._cp_id)
         return attrs
 
 
@@ -2523,6 +2455,56 @@ class BoschComRrc2Sensor(CoordinatorEntity, SensorEntity):
         return self._read_value()
 
 
+def _build_k40_circuit_sensors(
+    coordinator: BoschComModuleCoordinatorK40 | BoschComModuleCoordinatorIcom,
+    config_entry: config_entries.ConfigEntry,
+) -> list[SensorEntity]:
+    """Build the DHW circuit, heating circuit and thermostat sensors."""
+    entities: list[SensorEntity] = [
+        BoschComSensorDhw(
+            coordinator=coordinator,
+            config_entry=config_entry,
+            field=ref["id"].split("/")[-1],
+        )
+        for ref in coordinator.data.dhw_circuits
+    ]
+    entities.extend(
+        BoschComSensorHc(
+            coordinator=coordinator,
+            config_entry=config_entry,
+            field=ref["id"].split("/")[-1],
+        )
+        for ref in coordinator.data.heating_circuits
+    )
+    # icom does not expose thermostat devices
+    if coordinator.data.device.get("deviceType") not in ("k40", "k30"):
+        return entities
+
+    for dev in coordinator.data.devices or []:
+        dev_id = dev["id"].split("/")[-1]
+        if dev.get("roomtemperature"):
+            entities.append(
+                BoschComThermostatRoomTempSensor(coordinator, config_entry, dev_id)
+            )
+        if dev.get("actualHumidity"):
+            entities.append(
+                BoschComThermostatHumiditySensor(coordinator, config_entry, dev_id)
+            )
+        if dev.get("currentRoomSetpoint"):
+            entities.append(
+                BoschComThermostatSetpointSensor(coordinator, config_entry, dev_id)
+            )
+        if dev.get("battery"):
+            entities.append(
+                BoschComThermostatBatterySensor(coordinator, config_entry, dev_id)
+            )
+        if dev.get("signal"):
+            entities.append(
+                BoschComThermostatSignalSensor(coordinator, config_entry, dev_id)
+            )
+    return entities
+
+
 def _build_rrc2_sensors(
     coordinator: BoschComModuleCoordinatorRrc2,
     config_entry: config_entries.ConfigEntry,
@@ -3191,6 +3173,63 @@ class BoschComWddw2TotalsSensor(CoordinatorEntity, SensorEntity):
         return node.get("value")
 
 
+def _resolve_path(path: list[str], dhw_id: str | None) -> list[str]:
+    """Return a path with {dhw_id} placeholders replaced, if any."""
+    if dhw_id is None:
+        return path
+    resolved = []
+    for p in path:
+        resolved.append(p.format(dhw_id=dhw_id) if "{" in p else p)
+    return resolved
+
+
+def _build_wddw2_dhw_sensors(
+    coordinator: BoschComModuleCoordinatorWddw2,
+    config_entry: config_entries.ConfigEntry,
+) -> list[SensorEntity]:
+    """Build the per-circuit WDDW2 DHW sensors and the descriptor sensors."""
+    dhw_ids = [
+        ref["id"].split("/")[-1]
+        for ref in coordinator.data.dhw_circuits
+        if re.fullmatch(r"dhw\d", ref["id"].split("/")[-1])
+    ]
+    entities: list[SensorEntity] = [
+        BoschComSensorDhwWddw2(
+            coordinator=coordinator,
+            config_entry=config_entry,
+            field=dhw_id,
+        )
+        for dhw_id in dhw_ids
+    ]
+
+    # Generic sensors from descriptors (BOSCH_SENSOR_DESCRIPTORS["wddw2"]),
+    # expanded per dhwX; a single set if the device lists no circuit.
+    for desc in BOSCH_SENSOR_DESCRIPTORS.get("wddw2", []):
+        for dhw_id in dhw_ids or [None]:
+            path = desc.get("path", [])
+            resolved_path = _resolve_path(path, dhw_id)
+            unique_suffix = (
+                f"{dhw_id}-{desc['key']}" if dhw_id else f"dhw-{desc['key']}"
+            )
+            try:
+                entities.append(
+                    BoschComGenericSensor(
+                        coordinator=coordinator,
+                        name=desc["name"],
+                        unique_suffix=unique_suffix,
+                        path=resolved_path,
+                        unit=desc.get("unit"),
+                        device_class=desc.get("device_class"),
+                        state_class=desc.get("state_class"),
+                        translation_key=desc.get("translation_key"),
+                        entity_category=desc.get("entity_category"),
+                    )
+                )
+            except Exception:  # keep onboarding even if one fails
+                _LOGGER.debug("Failed to add generic sensor %s", unique_suffix)
+    return entities
+
+
 def _build_wddw2_totals_sensors(
     coordinator: BoschComModuleCoordinatorWddw2,
 ) -> list[SensorEntity]:
@@ -3440,6 +3479,38 @@ class BoschComK40StartCountsSensor(CoordinatorEntity, SensorEntity):
         self.async_write_ha_state()
 
 
+class BoschComCopSensor(CoordinatorEntity, SensorEntity):
+    """COP of one heat pump domain over the last hour, today or the season.
+
+    Heat produced over electricity used, from the hours counted so far (see
+    performance.HeatPumpPerformance). Unknown until an hour with enough
+    electricity use was counted. The last-hour figure is disabled by default.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 2
+    _attr_icon = "mdi:heat-pump-outline"
+
+    def __init__(
+        self, coordinator: BoschComModuleCoordinatorK40, domain: str, period: str
+    ) -> None:
+        """Initialize COP sensor."""
+        super().__init__(coordinator)
+        self._domain = domain
+        self._period = period
+        self._attr_translation_key = f"cop_{period}_{domain}"
+        self._attr_device_info = coordinator.device_info
+        self._attr_unique_id = f"{coordinator.unique_id}-cop-{period}-{domain}"
+        self._attr_entity_registry_enabled_default = period != "hour"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the COP from the coordinator's running sums."""
+        return self.coordinator.performance.cop(self._domain, self._period)
+
+
 class BoschComK40RecordingSensor(CoordinatorEntity, SensorEntity):
     """Today's-so-far value derived from a /recordings/heatSources/* time-series.
 
@@ -3486,6 +3557,12 @@ class BoschComK40RecordingSensor(CoordinatorEntity, SensorEntity):
         """Return today's-so-far value from the coordinator cache."""
         return self.coordinator.recordings.get(self._key)
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return yesterday's final value, once its last hour was read."""
+        previous = self.coordinator.recordings_previous_day.get(self._key)
+        return {"previous_day": previous} if previous is not None else None
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data."""
@@ -3583,3 +3660,160 @@ class BoschComBaconSignalStrength(BoschComSensorBase):
         info = (getattr(data, "info", None) if data else None) or {}
         quality = (info.get("network") or {}).get("signalQuality")
         return {"signal_quality": quality} if quality else {}
+
+
+# --- Poll metrics (see metrics.PollMetrics) ----------------------------------
+
+
+class _PollMetricsSensorBase(BoschComSensorBase):
+    """Diagnostic view on a coordinator's rolling poll metrics.
+
+    Stays available when a poll fails: failed polls are what these report on.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator,
+        config_entry: config_entries.ConfigEntry,
+        key: str,
+        icon: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(
+            coordinator=coordinator,
+            config_entry=config_entry,
+            unique_id=f"{coordinator.unique_id}-{key.replace('_', '-')}",
+            icon=icon,
+        )
+        self._attr_translation_key = key
+
+    @property
+    def available(self) -> bool:
+        """Return True; the metrics exist whether or not the poll succeeded."""
+        return True
+
+    @property
+    def _summary(self) -> dict[str, Any]:
+        return self.coordinator.metrics.summary()
+
+
+class BoschComPollDurationSensor(_PollMetricsSensorBase):
+    """Duration of the last poll, with window statistics and phase means."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+
+    def __init__(self, coordinator, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, config_entry, "poll_duration", "mdi:timer")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the duration of the last poll."""
+        last = self.coordinator.metrics.last
+        return round(last.duration, 3) if last else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Expose the window's mean and max and the mean of each phase."""
+        summary = self._summary
+        if not summary["polls"]:
+            return {}
+        return {
+            "polls": summary["polls"],
+            "mean": summary["duration"]["mean"],
+            "max": summary["duration"]["max"],
+            "phases": summary["phases"],
+        }
+
+
+class BoschComPollRequestsSensor(_PollMetricsSensorBase):
+    """HTTP requests the last poll made, with bytes received."""
+
+    def __init__(self, coordinator, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(
+            coordinator, config_entry, "poll_requests", "mdi:swap-vertical"
+        )
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the number of requests of the last poll."""
+        last = self.coordinator.metrics.last
+        return last.requests if last else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Expose the window's mean request count and the bytes received."""
+        summary = self._summary
+        if not summary["polls"]:
+            return {}
+        return {
+            "mean": summary["requests"]["mean"],
+            "bytes_received": summary["bytes_received"]["last"],
+            "bytes_received_mean": summary["bytes_received"]["mean"],
+        }
+
+
+class BoschComPollErrorsSensor(_PollMetricsSensorBase):
+    """Failed requests within the rolling window of polls."""
+
+    def __init__(self, coordinator, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, config_entry, "poll_errors", "mdi:alert-circle")
+
+    @property
+    def native_value(self) -> int:
+        """Return the failed requests of the window."""
+        return self._summary.get("errors", 0)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Expose how many polls of the window failed as a whole."""
+        summary = self._summary
+        return {
+            "polls": summary["polls"],
+            "failed_polls": summary.get("failed_polls", 0),
+        }
+
+
+class BoschComCircuitBreakerSensor(BoschComSensorBase):
+    """State of the circuit breaker that stops polling an unresponsive device."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [state.value for state in BreakerState]
+    _attr_translation_key = "circuit_breaker"
+
+    def __init__(self, coordinator, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(
+            coordinator=coordinator,
+            config_entry=config_entry,
+            unique_id=f"{coordinator.unique_id}-circuit-breaker",
+            icon="mdi:electric-switch",
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True; the breaker matters most while the device is down."""
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """Return closed, open or half_open."""
+        return self.coordinator.breaker.state.value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Expose the failure count, trips and next probe."""
+        stats = self.coordinator.breaker.stats()
+        stats.pop("state")
+        return stats
@@ -0,0 +1,151 @@
+"""Incremental import of cloud history into Home Assistant long-term statistics."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Coalesce cursor writes; an import that is lost to a crash is simply re-added
+# from the cloud on the next run.
+STORAGE_SAVE_DELAY = 10
+
+
+def external_statistic_id(device_id: str, key: str) -> str:
+    """Return the external statistic id for one series of a device."""
+    return f"{DOMAIN}:{slugify(f'{device_id}_{key}')}"
+
+
+@dataclass(frozen=True, slots=True)
+class StatisticSeries:
+    """One external statistic fed from hourly cloud buckets.
+
+    ``kind`` is ``"sum"`` for per-bucket amounts (kWh, litres) that accumulate
+    into a running sum, or ``"mean"`` for sampled values such as temperatures.
+    """
+
+    statistic_id: str
+    name: str
+    unit: str | None
+    unit_class: str | None
+    kind: str = "sum"
+
+
+class StatisticsImporter:
+    """Append hourly buckets to external statistics, each bucket exactly once.
+
+    The start of the newest imported bucket and the running sum of every series
+    are persisted, so a rerun only adds buckets after that cursor and sums carry
+    on where the previous import stopped, across restarts.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the importer with its own storage file."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.statistics.{key}"
+        )
+        self._state: dict[str, dict[str, Any]] | None = None
+
+    async def async_load(self) -> None:
+        """Load the persisted cursors once."""
+        if self._state is None:
+            self._state = await self._store.async_load() or {}
+
+    def last_start(self, statistic_id: str) -> datetime | None:
+        """Return the start of the newest bucket imported for a series."""
+        last = ((self._state or {}).get(statistic_id) or {}).get("last")
+        return dt_util.parse_datetime(last) if last else None
+
+    async def async_add(
+        self,
+        series: StatisticSeries,
+        buckets: Iterable[tuple[datetime, float]],
+        *,
+        covered: datetime | None = None,
+    ) -> int:
+        """Import ``buckets`` newer than the series' cursor; return how many.
+
+        ``covered`` is the start of the newest hour the buckets were read up
+        to. The cursor moves there even when there is no bucket to import, so
+        a series without data is not asked for the same hours again.
+        """
+        if "recorder" not in self.hass.config.components:
+            return 0
+        await self.async_load()
+        assert self._state is not None
+        state = self._state.setdefault(series.statistic_id, {})
+        last = self.last_start(series.statistic_id)
+
+        # Buckets are hour-aligned; amounts landing in the same hour add up.
+        merged: dict[datetime, float] = {}
+        for start, value in buckets:
+            hour = dt_util.as_utc(start).replace(minute=0, second=0, microsecond=0)
+            if last is not None and hour <= last:
+                continue
+            if series.kind == "sum":
+                merged[hour] = merged.get(hour, 0.0) + value
+            else:
+                merged[hour] = value
+        if covered is not None:
+            covered = dt_util.as_utc(covered)
+        if not merged:
+            if covered is not None and (last is None or covered > last):
+                state["last"] = covered.isoformat()
+                self._store.async_delay_save(
+                    lambda: self._state or {}, STORAGE_SAVE_DELAY
+                )
+            return 0
+
+        total = float(state.get("sum", 0.0))
+        rows: list[StatisticData] = []
+        for hour in sorted(merged):
+            value = merged[hour]
+            if series.kind == "sum":
+                total += value
+                rows.append(StatisticData(start=hour, state=value, sum=total))
+            else:
+                rows.append(StatisticData(start=hour, mean=value, min=value, max=value))
+
+        async_add_external_statistics(self.hass, _metadata(series), rows)
+        newest = rows[-1]["start"]
+        if covered is not None and covered > newest:
+            newest = covered
+        state["last"] = newest.isoformat()
+        state["sum"] = total
+        self._store.async_delay_save(lambda: self._state or {}, STORAGE_SAVE_DELAY)
+        _LOGGER.debug("Imported %s buckets into %s", len(rows), series.statistic_id)
+        return len(rows)
+
+
+def _metadata(series: StatisticSeries) -> StatisticMetaData:
+    return StatisticMetaData(
+        mean_type=(
+            StatisticMeanType.ARITHMETIC
+            if series.kind == "mean"
+            else StatisticMeanType.NONE
+        ),
+        has_sum=series.kind == "sum",
+        name=series.name,
+        source=DOMAIN,
+        statistic_id=series.statistic_id,
+        unit_class=series.unit_class,
+        unit_of_measurement=series.unit,
+    )
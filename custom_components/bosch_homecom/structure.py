@@ -0,0 +1,102 @@
+"""Entities that follow the zones, circuits and sub-devices of a device."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, STRUCTURE_REMOVE_AFTER
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fields of the device data listing circuits that entities are created for.
+STRUCTURE_FIELDS = ("zones", "heating_circuits", "dhw_circuits", "devices")
+
+
+def device_structure(data: Any) -> frozenset[str]:
+    """Return the ids of the zones, circuits and sub-devices in ``data``."""
+    return frozenset(
+        ref["id"]
+        for field in STRUCTURE_FIELDS
+        for ref in getattr(data, field, None) or []
+        if isinstance(ref, dict) and isinstance(ref.get("id"), str)
+    )
+
+
+@callback
+def async_track_structure(
+    entry: ConfigEntry,
+    coordinator: Any,
+    platform: Platform,
+    build: Callable[[Any], Iterable[Entity]],
+    entities: Iterable[Entity],
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add and remove the entities ``build`` makes as the structure changes.
+
+    ``entities`` are the ones ``build`` made at setup. Each time the
+    coordinator reports a changed structure, ``build`` runs again: entities
+    with a new unique id are added at once, without reloading the entry.
+    Failed polls and reads without any zone, circuit or sub-device are
+    ignored, and an entity no longer built is removed from the entity
+    registry only once it has been missing for STRUCTURE_REMOVE_AFTER
+    successful polls in a row, so one incomplete answer does not retire it.
+    """
+    known = {entity.unique_id for entity in entities if entity.unique_id}
+    # Unique ids no longer built -> successful polls in a row they were missing.
+    missing: dict[str, int] = {}
+    seen = coordinator.structure_changes
+
+    @callback
+    def _async_structure_changed() -> None:
+        nonlocal seen
+        if (
+            (coordinator.structure_changes == seen and not missing)
+            or not coordinator.last_update_success
+            or coordinator.data is None
+            or not coordinator.structure
+        ):
+            return
+        seen = coordinator.structure_changes
+        built = {
+            entity.unique_id: entity
+            for entity in build(coordinator)
+            if entity.unique_id
+        }
+        if not built:
+            return
+        if added := [
+            entity for unique_id, entity in built.items() if unique_id not in known
+        ]:
+            _LOGGER.debug(
+                "Device %s: adding %s %s entities",
+                coordinator.unique_id,
+                len(added),
+                platform,
+            )
+            async_add_entities(added)
+        known.update(built)
+        registry = er.async_get(coordinator.hass)
+        for unique_id in built:
+            missing.pop(unique_id, None)
+        for unique_id in known - built.keys():
+            missing[unique_id] = missing.get(unique_id, 0) + 1
+            if missing[unique_id] < STRUCTURE_REMOVE_AFTER:
+                continue
+            del missing[unique_id]
+            known.discard(unique_id)
+            if entity_id := registry.async_get_entity_id(platform, DOMAIN, unique_id):
+                _LOGGER.debug(
+                    "Device %s: removing %s", coordinator.unique_id, entity_id
+                )
+                registry.async_remove(entity_id)
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_structure_changed))
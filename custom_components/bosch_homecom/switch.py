@@ -4,6 +4,7 @@ from typing import Any
 
 from homeassistant import config_entries, core
 from homeassistant.components.switch import SwitchEntity
+from homeassistant.const import Platform
 from homeassistant.core import callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -15,6 +16,7 @@ from .coordinator import (
     BoschComModuleCoordinatorRrc2,
     BoschComModuleCoordinatorWddw2,
 )
+from .structure import async_track_structure
 
 PARALLEL_UPDATES = 1
 
@@ -67,17 +69,28 @@ async def async_setup_entry(
                 )
     for coordinator in coordinators:
         if coordinator.data.device["deviceType"] == "rrc2":
-            entities.extend(_build_rrc2_switches(coordinator))
+            rrc2_switches = _build_rrc2_switches(coordinator)
+            entities.extend(rrc2_switches)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.SWITCH,
+                _build_rrc2_switches,
+                rrc2_switches,
+                async_add_entities,
+            )
     for coordinator in coordinators:
         if coordinator.data.device["deviceType"] == "wddw2":
-            for ref in coordinator.data.dhw_circuits or []:
-                dhw_id = ref["id"].split("/")[-1]
-                if _value(ref.get("safetyTemperature")) is not None:
-                    entities.append(
-                        BoschComWddw2SafetyTempSwitch(
-                            coordinator=coordinator, field=dhw_id
-                        )
-                    )
+            dhw_switches = _build_wddw2_dhw_switches(coordinator)
+            entities.extend(dhw_switches)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.SWITCH,
+                _build_wddw2_dhw_switches,
+                dhw_switches,
+                async_add_entities,
+            )
             if _value(coordinator.data.holiday_mode) is not None:
                 entities.append(BoschComWddw2HolidayModeSwitch(coordinator=coordinator))
     async_add_entities(entities)
@@ -632,3 +645,16 @@ class BoschComK40PoolEnabledSwitch(CoordinatorEntity, SwitchEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self.async_write_ha_state()
+
+
+def _build_wddw2_dhw_switches(
+    coordinator: BoschComModuleCoordinatorWddw2,
+) -> list[SwitchEntity]:
+    """Build the per-circuit WDDW2 safety temperature switches."""
+    return [
+        BoschComWddw2SafetyTempSwitch(
+            coordinator=coordinator, field=ref["id"].split("/")[-1]
+        )
+        for ref in coordinator.data.dhw_circuits or []
+        if _value(ref.get("safetyTemperature")) is not None
+    ]
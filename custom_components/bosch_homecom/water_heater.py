@@ -11,7 +11,7 @@ from homeassistant.components.water_heater import (
     WaterHeaterEntity,
     WaterHeaterEntityFeature,
 )
-from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.const import ATTR_TEMPERATURE, Platform, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -19,6 +19,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import BoschComModuleCoordinatorK40, BoschComModuleCoordinatorWddw2
+from .structure import async_track_structure
 
 
 def _parse_temp_unit(unit_str: str | None) -> str:
@@ -40,13 +41,18 @@ async def async_setup_entry(
 
     for coordinator in coordinators:
         if coordinator.data.device["deviceType"] == "wddw2":
-            for ref in coordinator.data.dhw_circuits:
-                dhw_id = ref["id"].split("/")[-1]
-                if re.fullmatch(r"dhw\d", dhw_id):
-                    _migrate_unique_id(entity_registry, coordinator.unique_id, dhw_id)
-                    entities.append(
-                        BoschComWddw2WaterHeater(coordinator=coordinator, field=dhw_id)
-                    )
+            for dhw_id in _wddw2_dhw_ids(coordinator):
+                _migrate_unique_id(entity_registry, coordinator.unique_id, dhw_id)
+            water_heaters = _build_wddw2_water_heaters(coordinator)
+            entities.extend(water_heaters)
+            async_track_structure(
+                config_entry,
+                coordinator,
+                Platform.WATER_HEATER,
+                _build_wddw2_water_heaters,
+                water_heaters,
+                async_add_entities,
+            )
         elif coordinator.data.device.get("deviceType") in ("k40", "k30"):
             _migrate_unique_id(entity_registry, coordinator.unique_id, "waterheater")
             entities.append(
@@ -55,6 +61,25 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+def _wddw2_dhw_ids(coordinator: BoschComModuleCoordinatorWddw2) -> list[str]:
+    """Return the ids of the WDDW2 DHW circuits, e.g. ``dhw1``."""
+    return [
+        dhw_id
+        for ref in coordinator.data.dhw_circuits
+        if re.fullmatch(r"dhw\d", dhw_id := ref["id"].split("/")[-1])
+    ]
+
+
+def _build_wddw2_water_heaters(
+    coordinator: BoschComModuleCoordinatorWddw2,
+) -> list[WaterHeaterEntity]:
+    """Build the per-circuit WDDW2 water heaters for one device."""
+    return [
+        BoschComWddw2WaterHeater(coordinator=coordinator, field=dhw_id)
+        for dhw_id in _wddw2_dhw_ids(coordinator)
+    ]
+
+
 @callback
 def _migrate_unique_id(
     entity_registry: er.EntityRegistry, device_unique_id: str, field: str
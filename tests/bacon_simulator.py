@@ -0,0 +1,477 @@
+"""Local stand-in for the bacon MQTT device-shadow broker.
+
+homecom_alt owns the MQTT 5 / WebSocket wire protocol, so the broker is emulated
+one level up — topics and JSON payloads with device-shadow semantics — behind
+the client surface the integration consumes: ``SimulatedBaconClient`` in place
+of ``BaconMqttClient`` and ``SimulatedBaconRac`` in place of
+``HomeComBaconRac``.
+
+* ``users/{sub}/devices/{serial}/shadows/state/get`` answers on ``get/accepted``
+* ``.../shadows/state/update`` answers on ``update/accepted`` or, for unknown
+  fields and wrongly typed values, ``update/rejected``
+* ``.../topics/{sensor,info,meta}`` are push-only, driven by ``push_topic`` or
+  by ``start_traffic`` at a configurable message rate across the whole fleet
+* a session is refused (``MqttNotAuthorizedError``) for an expired token or
+  while ``refuse_connects`` is positive, and dropped when its token expires or
+  ``drop_sessions`` is called
+
+    broker = ShadowBroker()
+    serials = broker.add_fleet(200)
+    client = SimulatedBaconClient(broker)
+    await client.async_connect(make_token(), "sim-user")
+    broker.start_traffic(per_device_rate=0.5)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+from homecom_alt import MqttNotAuthorizedError, decode_jwt_exp
+
+SIM_SUB = "sim-user"
+
+# Writable shadow fields and the value types the simulated AC accepts.
+WRITABLE_FIELDS: dict[str, tuple[type, ...]] = {
+    "powerEnabled": (bool,),
+    "opMode": (str,),
+    "tempSetpoint": (int, float),
+    "fanSpeed": (str,),
+    "vSwingEnabled": (bool,),
+    "hSwingEnabled": (bool,),
+}
+
+
+def topic_matches(topic_filter: str, topic: str) -> bool:
+    """Return whether ``topic`` matches an MQTT filter with ``+``/``#``."""
+    filter_parts = topic_filter.split("/")
+    topic_parts = topic.split("/")
+    for index, part in enumerate(filter_parts):
+        if part == "#":
+            return True
+        if index >= len(topic_parts):
+            return False
+        if part not in ("+", topic_parts[index]):
+            return False
+    return len(filter_parts) == len(topic_parts)
+
+
+def _device_topic(sub: str, serial: str, path: str) -> str:
+    return f"users/{sub}/devices/{serial}/{path}"
+
+
+@dataclass(slots=True)
+class SimulatedAc:
+    """One AC's shadow and its last pushed topics."""
+
+    serial: str
+    sub: str
+    reported: dict[str, Any]
+    desired: dict[str, Any] = field(default_factory=dict)
+    version: int = 1
+    room_temperature: float = 24.0
+
+
+@dataclass(slots=True)
+class BrokerStats:
+    """What the broker has seen."""
+
+    connects: int = 0
+    refused: int = 0
+    dropped: int = 0
+    published: int = 0
+    delivered: int = 0
+    rejected: int = 0
+
+
+class ShadowBroker:
+    """In-process shadow broker for fleets of simulated ACs."""
+
+    def __init__(self, *, latency: float = 0.0) -> None:
+        """Initialize an empty broker; ``latency`` delays every delivery."""
+        self.latency = latency
+        self.devices: dict[str, SimulatedAc] = {}
+        self.refuse_connects = 0
+        self.stats = BrokerStats()
+        self._sessions: dict[SimulatedBaconClient, list[str]] = {}
+        self._expiry: dict[SimulatedBaconClient, asyncio.TimerHandle] = {}
+        self._traffic: asyncio.Task[None] | None = None
+
+    def add_fleet(
+        self, count: int, sub: str = SIM_SUB, prefix: str = "86DM"
+    ) -> list[str]:
+        """Add ``count`` ACs and return their serials."""
+        serials = []
+        for n in range(len(self.devices), len(self.devices) + count):
+            serial = f"{prefix}-{n:05d}"
+            self.devices[serial] = SimulatedAc(
+                serial,
+                sub,
+                {
+                    "powerEnabled": False,
+                    "opMode": "cool",
+                    "tempSetpoint": 23,
+                    "fanSpeed": "auto",
+                    "vSwingEnabled": False,
+                    "hSwingEnabled": False,
+                    "customTitle": f"AC {n}",
+                },
+            )
+            serials.append(serial)
+        return serials
+
+    # --- sessions ---
+
+    def connect(self, client: SimulatedBaconClient, token: str, sub: str) -> None:
+        """Open a session, or refuse it the way the broker's CONNACK does."""
+        self.stats.connects += 1
+        expires_at = decode_jwt_exp(token)
+        if self.refuse_connects > 0 or expires_at is None:
+            self.refuse_connects = max(0, self.refuse_connects - 1)
+            self.stats.refused += 1
+            raise MqttNotAuthorizedError("CONNACK: not authorized")
+        if expires_at <= dt_util.utcnow():
+            self.stats.refused += 1
+            raise MqttNotAuthorizedError("CONNACK: not authorized (token expired)")
+        self.disconnect(client)
+        filters = self._sessions[client] = []
+        client._client = SimulatedMqttSession(filters)
+        client._on_connect(client._client, None, None, 0)
+        loop = asyncio.get_running_loop()
+        self._expiry[client] = loop.call_later(
+            (expires_at - dt_util.utcnow()).total_seconds(), self._drop, client
+        )
+        client.is_connected = True
+        client.token_expires_at = expires_at
+
+    def disconnect(self, client: SimulatedBaconClient) -> None:
+        """Close a session."""
+        self._sessions.pop(client, None)
+        client._client = None
+        if (handle := self._expiry.pop(client, None)) is not None:
+            handle.cancel()
+        client.is_connected = False
+
+    def _drop(self, client: SimulatedBaconClient) -> None:
+        self.stats.dropped += 1
+        self.disconnect(client)
+
+    def drop_sessions(self) -> None:
+        """Drop every session, as a broker blip or token expiry would."""
+        for client in list(self._sessions):
+            self._drop(client)
+
+    # --- messages ---
+
+    def publish(self, topic: str, payload: dict[str, Any]) -> None:
+        """Handle a message a client published."""
+        self.stats.published += 1
+        parts = topic.split("/")
+        if len(parts) < 5 or parts[2] != "devices" or parts[3] not in self.devices:
+            return
+        device = self.devices[parts[3]]
+        channel = "/".join(parts[4:])
+        if channel == "shadows/state/get":
+            self._send(
+                device,
+                "shadows/state/get/accepted",
+                {
+                    "state": {
+                        "reported": dict(device.reported),
+                        "desired": dict(device.desired),
+                    },
+                    "version": device.version,
+                },
+            )
+        elif channel == "shadows/state/update":
+            self._update(device, (payload.get("state") or {}).get("desired") or {})
+
+    def _update(self, device: SimulatedAc, desired: dict[str, Any]) -> None:
+        invalid = [
+            key
+            for key, value in desired.items()
+            if key not in WRITABLE_FIELDS or not isinstance(value, WRITABLE_FIELDS[key])
+        ]
+        if invalid or not desired:
+            self.stats.rejected += 1
+            self._send(
+                device,
+                "shadows/state/update/rejected",
+                {"code": 400, "message": f"Invalid fields: {sorted(invalid)}"},
+            )
+            return
+        # The device applies a desired change at once and reports it back.
+        device.desired.update(desired)
+        device.reported.update(desired)
+        device.version += 1
+        self._send(
+            device,
+            "shadows/state/update/accepted",
+            {
+                "state": {"desired": desired, "reported": desired},
+                "version": device.version,
+            },
+        )
+
+    def set_reported(self, serial: str, **changes: Any) -> float:
+        """Change a device's state locally (remote, buttons); return send time."""
+        device = self.devices[serial]
+        device.reported.update(changes)
+        device.version += 1
+        return self._send(
+            device,
+            "shadows/state/update/accepted",
+            {"state": {"reported": changes}, "version": device.version},
+        )
+
+    def push_topic(self, serial: str, channel: str, payload: dict[str, Any]) -> float:
+        """Publish on a device's push-only topics channel; return send time."""
+        return self._send(self.devices[serial], f"topics/{channel}", payload)
+
+    def _send(self, device: SimulatedAc, path: str, payload: dict[str, Any]) -> float:
+        sent = time.monotonic()
+        topic = _device_topic(device.sub, device.serial, path)
+        loop = asyncio.get_running_loop()
+        for client, filters in self._sessions.items():
+            if any(topic_matches(f, topic) for f in filters):
+                self.stats.delivered += 1
+                if self.latency:
+                    loop.call_later(self.latency, client.deliver, topic, payload)
+                else:
+                    loop.call_soon(client.deliver, topic, payload)
+        return sent
+
+    def start_traffic(self, per_device_rate: float) -> None:
+        """Push topics/sensor readings for every AC at ``per_device_rate`` Hz.
+
+        Messages are spread evenly over time, round robin across the fleet.
+        """
+        self.stop_traffic()
+        self._traffic = asyncio.get_running_loop().create_task(
+            self._run_traffic(per_device_rate)
+        )
+
+    def stop_traffic(self) -> None:
+        """Stop the background traffic."""
+        if self._traffic is not None:
+            self._traffic.cancel()
+            self._traffic = None
+
+    async def _run_traffic(self, per_device_rate: float) -> None:
+        interval = 1 / (per_device_rate * max(1, len(self.devices)))
+        while True:
+            for device in list(self.devices.values()):
+                device.room_temperature = round(device.room_temperature + 0.1, 1)
+                self.push_topic(
+                    device.serial,
+                    "sensor",
+                    {"roomTemperature": device.room_temperature},
+                )
+                await asyncio.sleep(interval)
+
+
+class SimulatedMqttSession:
+    """The paho client of a simulated session, down to its subscriptions."""
+
+    def __init__(self, filters: list[str]) -> None:
+        """Initialize over the broker's filter list for the session."""
+        self.filters = filters
+
+    def subscribe(self, topic: str | list[tuple[str, int]], qos: int = 0) -> None:
+        """Add a topic filter, or a list of (filter, qos) as paho takes them."""
+        topics = [topic] if isinstance(topic, str) else [t for t, _ in topic]
+        self.filters.extend(t for t in topics if t not in self.filters)
+
+    def unsubscribe(self, topic: str | list[str]) -> None:
+        """Drop a topic filter or a list of them."""
+        topics = [topic] if isinstance(topic, str) else topic
+        self.filters[:] = [f for f in self.filters if f not in topics]
+
+
+class SimulatedBaconClient:
+    """The ``BaconMqttClient`` surface the integration uses, on a ShadowBroker."""
+
+    def __init__(
+        self, broker: ShadowBroker, client_id: str = "sim", region: str = "euc1"
+    ) -> None:
+        """Initialize a disconnected client."""
+        self.broker = broker
+        self.client_id = client_id
+        self.region = region
+        self.is_connected = False
+        self.token_expires_at = None
+        self.sub: str | None = None
+        self.topics: dict[str, dict[str, Any]] = {}
+        self._listeners: dict[str, list[Callable[[dict], None]]] = {}
+        self._raw_listeners: list[Callable[[str | None, str, Any], None]] = []
+        self._raw: dict[str, dict[str, Any]] = {}
+        self._waiters: dict[str, list[asyncio.Future[dict[str, Any]]]] = {}
+        self._client: SimulatedMqttSession | None = None
+
+    async def async_connect(self, token: str, sub: str) -> None:
+        """Open a session with ``token`` as the password."""
+        self.sub = sub
+        self.broker.connect(self, token, sub)
+
+    async def async_disconnect(self) -> None:
+        """Close the session."""
+        self.broker.disconnect(self)
+
+    def _on_connect(
+        self,
+        client: SimulatedMqttSession,
+        userdata: Any,
+        flags: Any,
+        reason_code: Any,
+        properties: Any = None,
+    ) -> None:
+        # Subscribes like BaconMqttClient does, so topic filters apply as live.
+        client.subscribe(f"users/{self.sub}/#")
+
+    def register_listener(self, serial: str, listener: Callable[[dict], None]) -> None:
+        """Call ``listener(state)`` for every shadow or topics message of serial."""
+        self._listeners.setdefault(serial, []).append(listener)
+
+    def register_raw_listener(
+        self, listener: Callable[[str | None, str, Any], None]
+    ) -> None:
+        """Call ``listener(serial, path, payload)`` for every message."""
+        self._raw_listeners.append(listener)
+
+    def remove_raw_listener(
+        self, listener: Callable[[str | None, str, Any], None]
+    ) -> None:
+        """Unregister a raw listener."""
+        if listener in self._raw_listeners:
+            self._raw_listeners.remove(listener)
+
+    def raw_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the latest message per ``{serial}/{path}``."""
+        return dict(self._raw)
+
+    async def async_request(
+        self, serial: str, path: str, payload: dict[str, Any], *, timeout: float = 5
+    ) -> dict[str, Any]:
+        """Publish on a shadow topic and wait for its accepted/rejected answer."""
+        if not self.is_connected or self.sub is None:
+            raise MqttNotAuthorizedError("Not connected")
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._waiters.setdefault(f"{serial}/{path}", []).append(future)
+        self.broker.publish(_device_topic(self.sub, serial, path), payload)
+        return await asyncio.wait_for(future, timeout)
+
+    def deliver(self, topic: str, payload: dict[str, Any]) -> None:
+        """Receive a message from the broker."""
+        if not self.is_connected:
+            return
+        parts = topic.split("/")
+        serial, path = parts[3], "/".join(parts[4:])
+        self._raw[f"{serial}/{path}"] = {
+            "payload": payload,
+            "received_at": dt_util.utcnow().isoformat(),
+        }
+        for raw_listener in list(self._raw_listeners):
+            raw_listener(serial, path, payload)
+
+        request, _, outcome = path.rpartition("/")
+        if outcome in ("accepted", "rejected"):
+            for future in self._waiters.pop(f"{serial}/{request}", []):
+                if not future.done():
+                    future.set_result({"outcome": outcome, **payload})
+        if outcome == "rejected":
+            return
+        if path.startswith("topics/"):
+            self.topics.setdefault(serial, {})[path.split("/", 1)[1]] = payload
+            state: dict[str, Any] = {}
+        else:
+            state = payload.get("state") or {}
+        for listener in list(self._listeners.get(serial, [])):
+            listener(state)
+
+
+class SimulatedBaconRac:
+    """The ``HomeComBaconRac`` surface the bacon coordinator and climate use."""
+
+    def __init__(self, client: SimulatedBaconClient, serial: str) -> None:
+        """Initialize the device wrapper."""
+        self.client = client
+        self.serial = serial
+
+    @property
+    def sensor(self) -> dict[str, Any] | None:
+        """Return the last topics/sensor payload."""
+        return self.client.topics.get(self.serial, {}).get("sensor")
+
+    @property
+    def metadata(self) -> dict[str, Any] | None:
+        """Return the last topics/meta payload."""
+        return self.client.topics.get(self.serial, {}).get("meta")
+
+    @property
+    def info(self) -> dict[str, Any] | None:
+        """Return the last topics/info payload."""
+        return self.client.topics.get(self.serial, {}).get("info")
+
+    async def async_update(self) -> dict[str, Any]:
+        """Fetch the shadow."""
+        answer = await self.client.async_request(self.serial, "shadows/state/get", {})
+        return answer.get("state") or {}
+
+    async def _async_desire(self, desired: dict[str, Any]) -> None:
+        answer = await self.client.async_request(
+            self.serial, "shadows/state/update", {"state": {"desired": desired}}
+        )
+        if answer["outcome"] == "rejected":
+            raise ValueError(answer.get("message"))
+
+    async def async_set_power(self, on: bool, mode: str | None = None) -> None:
+        """Switch on (optionally into ``mode``) or off."""
+        desired: dict[str, Any] = {"powerEnabled": on}
+        if mode is not None:
+            desired["opMode"] = mode
+        await self._async_desire(desired)
+
+    async def async_set_temperature(self, temperature: float) -> None:
+        """Set the target temperature."""
+        await self._async_desire({"tempSetpoint": temperature})
+
+    async def async_set_fan(self, fan: str) -> None:
+        """Set the fan speed."""
+        await self._async_desire({"fanSpeed": fan})
+
+    async def async_set_swing(
+        self, vertical: bool | None = None, horizontal: bool | None = None
+    ) -> None:
+        """Set the louvers."""
+        desired: dict[str, Any] = {}
+        if vertical is not None:
+            desired["vSwingEnabled"] = vertical
+        if horizontal is not None:
+            desired["hSwingEnabled"] = horizontal
+        await self._async_desire(desired)
+
+
+async def measure_loop_lag(
+    duration: float, interval: float = 0.005
+) -> dict[str, float]:
+    """Return how late ``interval`` sleeps wake up over ``duration`` seconds.
+
+    A busy event loop (many pushes decoded and dispatched) shows up as lag.
+    """
+    lags = []
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        started = time.monotonic()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.monotonic() - started - interval))
+    return {
+        "samples": float(len(lags)),
+        "mean": sum(lags) / len(lags) if lags else 0.0,
+        "max": max(lags, default=0.0),
+    }
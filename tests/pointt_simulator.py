@@ -0,0 +1,632 @@
+"""Local stand-in for the Bosch pointt REST API, for load and latency tests.
+
+Serves generated device trees for rac, k40, icom, rrc2, wddw2 and commodule over
+HTTP, including ``gateways/``, ``gateways/{id}/resource/...``, ``bulk`` and the
+token endpoint, with configurable latency, injected 404/500 errors and timeouts,
+and token-bucket rate limiting (429 + Retry-After).
+
+    config = SimulatorConfig(latency=0.05, error_500=0.01, rate_limit=20)
+    async with PointtSimulator(device_fleet(10), config) as sim:
+        session = sim.client_session()  # rewrites cloud URLs to the simulator
+        ...
+        sim.stats.requests, sim.stats.by_status
+
+Every path under a device's leaves also resolves as a ``refEnum`` listing its
+children, the way the real API answers for intermediate nodes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import json
+import math
+import random
+import re
+import time
+from typing import Any
+
+from aiohttp import ClientSession, TraceConfig, web
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+RESOURCE_RE = re.compile(r"/gateways/(?P<gateway>[^/]+)/resource(?P<path>/.*)$")
+GATEWAY_RE = re.compile(r"/gateways/(?P<gateway>[^/]+)/?$")
+
+DEVICE_TYPES = ("rac", "k40", "icom", "rrc2", "wddw2", "commodule")
+
+
+def make_token(sub: str = "sim-user", lifetime: int = 24 * 3600) -> str:
+    """Return an unsigned JWT the client accepts as a still-valid access token."""
+
+    def _b64(data: dict[str, Any]) -> str:
+        raw = json.dumps(data, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    claims = {"sub": sub, "exp": int(time.time()) + lifetime}
+    return f"{_b64({'alg': 'none', 'typ': 'JWT'})}.{_b64(claims)}.sig"
+
+
+def _float(
+    path: str, value: float, unit: str = "C", writeable: int = 0, **extra: Any
+) -> dict[str, Any]:
+    return {
+        "id": path,
+        "type": "floatValue",
+        "writeable": writeable,
+        "recordable": 0,
+        "value": value,
+        "unitOfMeasure": unit,
+        **extra,
+    }
+
+
+def _string(
+    path: str,
+    value: str,
+    allowed: list[str] | None = None,
+    writeable: int = 0,
+) -> dict[str, Any]:
+    leaf: dict[str, Any] = {
+        "id": path,
+        "type": "stringValue",
+        "writeable": writeable,
+        "recordable": 0,
+        "value": value,
+    }
+    if allowed is not None:
+        leaf["allowedValues"] = allowed
+    return leaf
+
+
+def _common_tree(firmware: str) -> dict[str, dict[str, Any]]:
+    return {
+        "/gateway/versionFirmware": _string("/gateway/versionFirmware", firmware),
+        "/gateway/uuid": _string("/gateway/uuid", "sim"),
+        "/notifications": {"id": "/notifications", "type": "errorList", "values": []},
+    }
+
+
+def _rac_tree() -> dict[str, dict[str, Any]]:
+    standard = [
+        _string(
+            "/airConditioning/operationMode",
+            "cool",
+            ["auto", "heat", "cool", "dry", "fanOnly"],
+            1,
+        ),
+        _string("/airConditioning/acControl", "on", ["on", "off"], 1),
+        _string(
+            "/airConditioning/fanSpeed",
+            "auto",
+            ["auto", "quiet", "low", "mid", "high"],
+            1,
+        ),
+        _string(
+            "/airConditioning/airFlowHorizontal",
+            "center",
+            ["center", "left", "right", "swing"],
+            1,
+        ),
+        _string(
+            "/airConditioning/airFlowVertical",
+            "auto",
+            ["auto", "angle1", "angle2", "angle3", "angle4", "swing"],
+            1,
+        ),
+        _float(
+            "/airConditioning/temperatureSetpoint",
+            24.0,
+            writeable=1,
+            minValue=16.0,
+            maxValue=30.0,
+        ),
+        _float("/airConditioning/roomTemperature", 25.5),
+    ]
+    advanced = [
+        _string("/airConditioning/airPurificationMode", "off", ["on", "off"], 1),
+        _string("/airConditioning/fullPowerMode", "off", ["on", "off"], 1),
+        _string("/airConditioning/ecoMode", "off", ["on", "off"], 1),
+    ]
+    return {
+        **_common_tree("04.05.00"),
+        "/airConditioning/standardFunctions": {
+            "id": "/airConditioning/standardFunctions",
+            "type": "refEnum",
+            "references": standard,
+        },
+        "/airConditioning/advancedFunctions": {
+            "id": "/airConditioning/advancedFunctions",
+            "type": "refEnum",
+            "references": advanced,
+        },
+        "/airConditioning/switchPrograms/enabled": _string(
+            "/airConditioning/switchPrograms/enabled", "off", ["on", "off"], 1
+        ),
+        "/airConditioning/switchPrograms/activeProgram": _string(
+            "/airConditioning/switchPrograms/activeProgram", "program1"
+        ),
+    }
+
+
+def _heating_tree(firmware: str) -> dict[str, dict[str, Any]]:
+    """Leaves shared by the pointt heating controllers (k40, icom)."""
+    tree = _common_tree(firmware)
+    for hc in ("hc1", "hc2"):
+        base = f"/heatingCircuits/{hc}"
+        tree |= {
+            f"{base}/operationMode": _string(
+                f"{base}/operationMode", "auto", ["manual", "auto"], 1
+            ),
+            f"{base}/currentRoomSetpoint": _float(f"{base}/currentRoomSetpoint", 21.0),
+            f"{base}/manualRoomSetpoint": _float(
+                f"{base}/manualRoomSetpoint", 21.0, writeable=1
+            ),
+            f"{base}/roomtemperature": _float(f"{base}/roomtemperature", 20.5),
+            f"{base}/currentSuWiMode": _string(f"{base}/currentSuWiMode", "forced"),
+            f"{base}/actualSupplyTemperature": _float(
+                f"{base}/actualSupplyTemperature", 34.0
+            ),
+        }
+    base = "/dhwCircuits/dhw1"
+    tree |= {
+        f"{base}/operationMode": _string(
+            f"{base}/operationMode", "eco", ["off", "eco", "high", "ownprogram"], 1
+        ),
+        f"{base}/actualTemp": _float(f"{base}/actualTemp", 48.0),
+        f"{base}/currentSetpoint": _float(f"{base}/currentSetpoint", 50.0),
+        f"{base}/charge": _string(f"{base}/charge", "stop", ["start", "stop"], 1),
+        "/heatSources/hs1/type": _string("/heatSources/hs1/type", "heatPump"),
+        "/heatSources/actualSupplyTemperature": _float(
+            "/heatSources/actualSupplyTemperature", 35.0
+        ),
+        "/heatSources/returnTemperature": _float(
+            "/heatSources/returnTemperature", 30.0
+        ),
+        "/heatSources/numberOfStarts": _float(
+            "/heatSources/numberOfStarts", 1234, unit=""
+        ),
+        "/system/sensors/temperatures/outdoor_t1": _float(
+            "/system/sensors/temperatures/outdoor_t1", 7.5
+        ),
+        "/system/holidayModes/hm1/startStop": _string(
+            "/system/holidayModes/hm1/startStop", "off"
+        ),
+    }
+    return tree
+
+
+def _k40_tree() -> dict[str, dict[str, Any]]:
+    tree = _heating_tree("05.02.01")
+    tree |= {
+        "/heatSources/emon/totalConsumption": _float(
+            "/heatSources/emon/totalConsumption", 5123.4, unit="kWh"
+        ),
+        "/ventilation/zone1/exhaustFanLevel": _string(
+            "/ventilation/zone1/exhaustFanLevel", "level2"
+        ),
+        "/ventilation/zone1/operationMode": _string(
+            "/ventilation/zone1/operationMode", "auto"
+        ),
+    }
+    return tree
+
+
+def _icom_tree() -> dict[str, dict[str, Any]]:
+    tree = _heating_tree("03.01.00")
+    tree |= {
+        "/heatSources/info": _string("/heatSources/info", "ok"),
+        "/heatSources/systemPressure": _float(
+            "/heatSources/systemPressure", 1.6, unit="bar"
+        ),
+        "/heatSources/actualModulation": _float(
+            "/heatSources/actualModulation", 42, unit="%"
+        ),
+    }
+    return tree
+
+
+def _rrc2_tree() -> dict[str, dict[str, Any]]:
+    tree = _common_tree("02.00.04")
+    tree["/zones/list"] = {
+        "id": "/zones/list",
+        "type": "arrayData",
+        "values": [{"id": 1, "name": "Living"}, {"id": 2, "name": "Bedroom"}],
+    }
+    for zone, name in (("zn1", "Living"), ("zn2", "Bedroom")):
+        base = f"/zones/{zone}"
+        tree |= {
+            f"{base}/name": _string(f"{base}/name", name, writeable=1),
+            f"{base}/temperatureActual": _float(f"{base}/temperatureActual", 20.8),
+            f"{base}/temperatureHeatingSetpoint": _float(
+                f"{base}/temperatureHeatingSetpoint", 21.0
+            ),
+            f"{base}/userMode": _string(
+                f"{base}/userMode", "clock", ["manual", "clock"], 1
+            ),
+            f"{base}/manualTemperatureHeating": _float(
+                f"{base}/manualTemperatureHeating", 21.0, writeable=1
+            ),
+        }
+    tree |= {
+        "/dhwCircuits/dhw1/actualTemp": _float("/dhwCircuits/dhw1/actualTemp", 52.0),
+        "/dhwCircuits/dhw1/operationMode": _string(
+            "/dhwCircuits/dhw1/operationMode", "on", ["on", "off"], 1
+        ),
+        "/system/awayMode/enabled": _string(
+            "/system/awayMode/enabled", "false", ["true", "false"], 1
+        ),
+        "/heatSources/type": _string("/heatSources/type", "gasBoiler"),
+    }
+    return tree
+
+
+def _wddw2_tree() -> dict[str, dict[str, Any]]:
+    base = "/dhwCircuits/dhw1"
+    return {
+        **_common_tree("01.10.00"),
+        f"{base}/operationMode": _string(
+            f"{base}/operationMode", "manual", ["manual", "eco", "auto"], 1
+        ),
+        f"{base}/currentSetpoint": _float(f"{base}/currentSetpoint", 45.0, writeable=1),
+        f"{base}/outletTemperature": _float(f"{base}/outletTemperature", 44.0),
+        f"{base}/inletTemperature": _float(f"{base}/inletTemperature", 12.0),
+        f"{base}/sensor/airBoxTemperature": _float(
+            f"{base}/sensor/airBoxTemperature", 25.0
+        ),
+        f"{base}/sensor/waterFlow": _float(f"{base}/sensor/waterFlow", 0.0, unit="l"),
+        "/heatSources/hs1/numberOfStarts": _float(
+            "/heatSources/hs1/numberOfStarts", 2048, unit=""
+        ),
+        "/heatSources/gasTotalConsumption": _float(
+            "/heatSources/gasTotalConsumption", 812.5, unit="m3"
+        ),
+        "/system/appliance/enabled": _string("/system/appliance/enabled", "true"),
+    }
+
+
+def _commodule_tree() -> dict[str, dict[str, Any]]:
+    base = "/rest/v1/cp0"
+    return {
+        **_common_tree("1.2.3"),
+        "/gateway/wifi/state": _string("/gateway/wifi/state", "connected"),
+        f"{base}/info": {
+            "id": f"{base}/info",
+            "type": "object",
+            "value": {"fwVersion": "1.2.3", "brand": "Bosch", "relaisAvailable": True},
+        },
+        f"{base}/telemetry": {
+            "id": f"{base}/telemetry",
+            "type": "object",
+            "value": {
+                "wbState": "charging",
+                "power": 11000,
+                "energy": 3.2,
+                "temperature": 31.0,
+                "phases": [16.0, 16.0, 16.0],
+            },
+        },
+        f"{base}/conf": {
+            "id": f"{base}/conf",
+            "type": "object",
+            "value": {
+                "locked": False,
+                "auth": False,
+                "chargingStrategy": "fast",
+                "price": 0.3,
+            },
+        },
+        f"{base}/chargelog": {"id": f"{base}/chargelog", "type": "array", "value": []},
+        f"{base}/energyhistory": {
+            "id": f"{base}/energyhistory",
+            "type": "array",
+            "value": [],
+        },
+    }
+
+
+DEVICE_TREES = {
+    "rac": _rac_tree,
+    "k40": _k40_tree,
+    "icom": _icom_tree,
+    "rrc2": _rrc2_tree,
+    "wddw2": _wddw2_tree,
+    "commodule": _commodule_tree,
+}
+
+
+@dataclass(slots=True)
+class SimulatedDevice:
+    """One gateway and its resource tree."""
+
+    device_id: str
+    device_type: str
+    resources: dict[str, dict[str, Any]]
+
+    @classmethod
+    def of_type(cls, device_id: str, device_type: str) -> SimulatedDevice:
+        """Create a device with the default tree of ``device_type``."""
+        return cls(device_id, device_type, DEVICE_TREES[device_type]())
+
+    def resolve(self, path: str) -> dict[str, Any] | None:
+        """Return a leaf, a synthesized refEnum for an inner node, or None."""
+        path = path.rstrip("/") or "/"
+        if path in self.resources:
+            return self.resources[path]
+        prefix = "" if path == "/" else path
+        children = sorted(
+            {
+                f"{prefix}/{leaf[len(prefix) + 1 :].split('/', 1)[0]}"
+                for leaf in self.resources
+                if leaf.startswith(f"{prefix}/")
+            }
+        )
+        if not children:
+            return None
+        return {
+            "id": path,
+            "type": "refEnum",
+            "references": [{"id": child, "uri": child} for child in children],
+        }
+
+
+def device_fleet(
+    count: int, types: Iterable[str] = DEVICE_TYPES
+) -> list[SimulatedDevice]:
+    """Return ``count`` devices cycling through ``types``."""
+    types = list(types)
+    return [
+        SimulatedDevice.of_type(f"{100000000 + n}", types[n % len(types)])
+        for n in range(count)
+    ]
+
+
+@dataclass(slots=True)
+class SimulatorConfig:
+    """Knobs for the simulated cloud's behaviour.
+
+    ``latency`` (+ up to ``jitter``) seconds are added to every request. The
+    error rates are probabilities per request; a timeout holds the request for
+    ``timeout_delay`` seconds and then answers 504. ``rate_limit`` requests per
+    second with a bucket of ``burst`` are allowed before 429s.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_404: float = 0.0
+    error_500: float = 0.0
+    timeout_rate: float = 0.0
+    timeout_delay: float = 30.0
+    rate_limit: float | None = None
+    burst: int = 10
+    seed: int = 0
+
+
+@dataclass(slots=True)
+class SimulatorStats:
+    """What the simulator has served."""
+
+    requests: int = 0
+    bulk_resources: int = 0
+    by_status: Counter[int] = field(default_factory=Counter)
+    by_path: Counter[str] = field(default_factory=Counter)
+
+    def reset(self) -> None:
+        """Zero all counters, e.g. between setup and a measured poll."""
+        self.requests = self.bulk_resources = 0
+        self.by_status.clear()
+        self.by_path.clear()
+
+
+class SimulatorSession:
+    """Client session sending every request to the simulator.
+
+    Wraps a real ``ClientSession`` and rewrites the scheme and host of each URL,
+    so homecom_alt's hard-coded cloud endpoints reach the local server unchanged
+    otherwise.
+    """
+
+    def __init__(self, session: ClientSession, base: URL) -> None:
+        """Initialize the wrapper."""
+        self._session = session
+        self._base = base
+
+    def _rewrite(self, url: Any) -> URL:
+        url = URL(str(url))
+        return self._base.with_path(url.path).with_query(url.query)
+
+    def request(self, method: str, url: Any, **kwargs: Any) -> Any:
+        """Send a request to the simulator."""
+        return self._session.request(method, self._rewrite(url), **kwargs)
+
+    def get(self, url: Any, **kwargs: Any) -> Any:
+        """Send a GET request to the simulator."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: Any, **kwargs: Any) -> Any:
+        """Send a POST request to the simulator."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: Any, **kwargs: Any) -> Any:
+        """Send a PUT request to the simulator."""
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: Any, **kwargs: Any) -> Any:
+        """Send a DELETE request to the simulator."""
+        return self.request("DELETE", url, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped session."""
+        return getattr(self._session, name)
+
+
+class PointtSimulator:
+    """The pointt API on a local port."""
+
+    def __init__(
+        self,
+        devices: list[SimulatedDevice],
+        config: SimulatorConfig | None = None,
+    ) -> None:
+        """Initialize the simulator; the server starts on ``async with``."""
+        self.devices = {device.device_id: device for device in devices}
+        self.config = config or SimulatorConfig()
+        self.stats = SimulatorStats()
+        self._rng = random.Random(self.config.seed)
+        self._tokens = float(self.config.burst)
+        self._refilled = time.monotonic()
+        self._server: TestServer | None = None
+        self._sessions: list[ClientSession] = []
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._app = app
+
+    async def __aenter__(self) -> PointtSimulator:
+        """Start the server."""
+        self._server = TestServer(self._app)
+        await self._server.start_server()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server and close the client sessions."""
+        for session in self._sessions:
+            await session.close()
+        if self._server is not None:
+            await self._server.close()
+
+    @property
+    def base_url(self) -> URL:
+        """Return the server's root URL."""
+        assert self._server is not None
+        return self._server.make_url("/")
+
+    def client_session(
+        self, trace_configs: list[TraceConfig] | None = None
+    ) -> SimulatorSession:
+        """Return a new session that sends all requests to this simulator."""
+        session = ClientSession(trace_configs=trace_configs)
+        self._sessions.append(session)
+        return SimulatorSession(session, self.base_url)
+
+    def create_clientsession(self, hass: Any, **kwargs: Any) -> SimulatorSession:
+        """Stand in for ``async_create_clientsession``, keeping trace configs."""
+        return self.client_session(kwargs.get("trace_configs"))
+
+    def _rate_limited(self) -> float | None:
+        """Take a token from the bucket; return the retry delay when empty."""
+        rate = self.config.rate_limit
+        if rate is None:
+            return None
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.config.burst), self._tokens + (now - self._refilled) * rate
+        )
+        self._refilled = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / rate
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        response = await self._respond(request)
+        self.stats.requests += 1
+        self.stats.by_status[response.status] += 1
+        return response
+
+    async def _respond(self, request: web.Request) -> web.StreamResponse:
+        path = request.path
+        self.stats.by_path[path] += 1
+        config = self.config
+        if (retry := self._rate_limited()) is not None:
+            return web.json_response(
+                {"error": "Too Many Requests"},
+                status=429,
+                headers={"Retry-After": str(math.ceil(retry))},
+            )
+        delay = config.latency + self._rng.uniform(0, config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self._rng.random()
+        if roll < config.timeout_rate:
+            await asyncio.sleep(config.timeout_delay)
+            return web.json_response({"error": "Gateway Timeout"}, status=504)
+        roll -= config.timeout_rate
+        if roll < config.error_500:
+            return web.json_response({"error": "Internal Server Error"}, status=500)
+        roll -= config.error_500
+        if roll < config.error_404:
+            return web.json_response({"error": "Not Found"}, status=404)
+
+        if path.endswith("/token"):
+            return web.json_response(
+                {
+                    "access_token": make_token(),
+                    "refresh_token": "sim-refresh",
+                    "expires_in": 3600,
+                    "token_type": "Bearer",
+                }
+            )
+        if path.endswith("/bulk") and request.method == "POST":
+            return web.json_response(self._bulk(await request.json()))
+        if path.rstrip("/").endswith("/gateways"):
+            return web.json_response(
+                [
+                    {"deviceId": device.device_id, "deviceType": device.device_type}
+                    for device in self.devices.values()
+                ]
+            )
+        if match := RESOURCE_RE.search(path):
+            device = self.devices.get(match["gateway"])
+            if device is None:
+                return web.json_response({"error": "Not Found"}, status=404)
+            if request.method in ("PUT", "POST"):
+                return self._write(device, match["path"], await request.json())
+            payload = device.resolve(match["path"])
+            if payload is None:
+                return web.json_response({"error": "Not Found"}, status=404)
+            return web.json_response(payload)
+        if (match := GATEWAY_RE.search(path)) and match["gateway"] in self.devices:
+            device = self.devices[match["gateway"]]
+            return web.json_response(
+                {"deviceId": device.device_id, "deviceType": device.device_type}
+            )
+        return web.json_response({"error": "Not Found"}, status=404)
+
+    def _write(
+        self, device: SimulatedDevice, path: str, body: Any
+    ) -> web.StreamResponse:
+        leaf = device.resources.get(path)
+        if leaf is None or not isinstance(body, dict) or "value" not in body:
+            return web.json_response({"error": "Bad Request"}, status=400)
+        if not leaf.get("writeable"):
+            return web.json_response({"error": "Forbidden"}, status=403)
+        leaf["value"] = body["value"]
+        return web.Response(status=204)
+
+    def _bulk(self, body: Any) -> list[dict[str, Any]]:
+        """Answer ``[{"gatewayId", "resourcePaths": [...]}]`` per resource."""
+        answer = []
+        for request in body if isinstance(body, list) else []:
+            device = self.devices.get(str(request.get("gatewayId")))
+            results = []
+            for path in request.get("resourcePaths") or []:
+                self.stats.bulk_resources += 1
+                payload = device.resolve(path) if device is not None else None
+                results.append(
+                    {
+                        "resourcePath": path,
+                        "serverStatus": 200,
+                        "gatewayResponse": (
+                            {"status": 200, "payload": payload}
+                            if payload is not None
+                            else {"status": 404, "payload": None}
+                        ),
+                    }
+                )
+            answer.append(
+                {"gatewayId": request.get("gatewayId"), "resourcePaths": results}
+            )
+        return answer
@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from homeassistant.components.climate import ClimateEntityFeature
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from homecom_alt import ApiError
 import pytest
 
+from custom_components.bosch_homecom.bacon import (
+    BACON_HISTORY_GRACE,
+    BaconConnectionSupervisor,
+    BaconHistoryClient,
+    BaconHistoryImporter,
+    BaconSessionRegistry,
+    RawCaptureBuffer,
+    apply_bacon_topic_filters,
+    bacon_backoff_delay,
+    bacon_topic_filters,
+)
 from custom_components.bosch_homecom.binary_sensor import (
     BoschComBaconFeatureSensor,
     BoschComBaconOnlineSensor,
@@ -333,3 +351,504 @@ def test_entities_survive_missing_data(data_none):
         ).native_value
         is None
     )
+
+
+# --- raw capture ring buffer --------------------------------------------------
+
+
+def test_raw_capture_keeps_latest_per_topic_by_default():
+    """per_topic=1 keeps the raw_snapshot() shape: the latest message per key."""
+    buffer = RawCaptureBuffer(max_bytes=10_000)
+    buffer.record("86DM-1", "topics/sensor", {"roomTemperature": 22})
+    buffer.record("86DM-1", "topics/sensor", {"roomTemperature": 23})
+    buffer.record(None, "sharing", {"x": 1})
+
+    snapshot = buffer.snapshot()
+    assert set(snapshot) == {"86DM-1/topics/sensor", "-/sharing"}
+    assert snapshot["86DM-1/topics/sensor"]["payload"] == {"roomTemperature": 23}
+    assert "previous" not in snapshot["86DM-1/topics/sensor"]
+    assert buffer.stats()["evicted"] == 1
+
+
+def test_raw_capture_per_topic_retention_lists_previous():
+    """Older messages within the per-topic retention are returned oldest first."""
+    buffer = RawCaptureBuffer(max_bytes=10_000, per_topic=3)
+    for value in range(5):
+        buffer.record("86DM-1", "topics/sensor", {"v": value})
+
+    entry = buffer.snapshot()["86DM-1/topics/sensor"]
+    assert entry["payload"] == {"v": 4}
+    assert [older["payload"] for older in entry["previous"]] == [{"v": 2}, {"v": 3}]
+
+
+def test_raw_capture_byte_budget_evicts_oldest_across_topics():
+    """Exceeding the byte budget drops the globally oldest messages first."""
+    buffer = RawCaptureBuffer(max_bytes=40, per_topic=10)
+    buffer.record("A", "t1", {"v": "a" * 10})  # 18 bytes
+    buffer.record("B", "t2", {"v": "b" * 10})
+    buffer.record("C", "t3", {"v": "c" * 10})
+
+    assert set(buffer.snapshot()) == {"B/t2", "C/t3"}
+    assert buffer.size <= 40
+
+
+def test_raw_capture_drops_oversized_and_filters_serial():
+    """A message over the whole budget is dropped; other serials are ignored."""
+    buffer = RawCaptureBuffer(max_bytes=20, serial="86DM-1")
+    buffer.record("86DM-1", "shadows/state", {"v": "x" * 100})
+    buffer.record("86DM-2", "shadows/state", {"v": 1})
+
+    assert buffer.snapshot() == {}
+    assert buffer.stats()["dropped"] == 1
+    assert buffer.stats()["received"] == 1
+
+
+def test_raw_capture_from_snapshot_keeps_newest():
+    """Bounding an existing snapshot keeps the most recently received entries."""
+    snapshot = {
+        "A/t": {"payload": {"v": "a" * 10}, "received_at": "2026-01-01T00:00:02"},
+        "B/t": {"payload": {"v": "b" * 10}, "received_at": "2026-01-01T00:00:01"},
+    }
+    bounded = RawCaptureBuffer.from_snapshot(snapshot, max_bytes=20)
+    assert set(bounded.snapshot()) == {"A/t"}
+
+
+# --- MQTT subscriptions -------------------------------------------------------
+
+
+def test_bacon_topic_filters_cover_only_selected_devices():
+    """Each selected device gets its shadow and topics channels, nothing else."""
+    assert bacon_topic_filters("sub-1", ["86DM-2", "86DM-1", "86DM-1"]) == [
+        "users/sub-1/devices/86DM-1/shadows/#",
+        "users/sub-1/devices/86DM-1/topics/#",
+        "users/sub-1/devices/86DM-2/shadows/#",
+        "users/sub-1/devices/86DM-2/topics/#",
+    ]
+
+
+def test_bacon_topic_filters_wildcard_is_opt_in():
+    """The debugging option subscribes to the whole user namespace."""
+    assert bacon_topic_filters("sub-1", ["86DM-1"], subscribe_all=True) == [
+        "users/sub-1/#"
+    ]
+
+
+def test_apply_bacon_topic_filters_skips_clients_without_support():
+    """A client without the on-connect handler keeps its wildcard subscription."""
+    legacy = SimpleNamespace()
+    assert apply_bacon_topic_filters(legacy, ["users/sub-1/#"]) is False
+    assert not hasattr(legacy, "_on_connect")
+
+
+def test_apply_bacon_topic_filters_narrows_the_connect_subscription():
+    """The handler's wildcard subscribe goes to the filters on every connect."""
+    mqtt_client = MagicMock()
+    client = SimpleNamespace(is_connected=False, _client=None)
+    client._on_connect = lambda c, *args: c.subscribe("users/sub-1/#")
+    filters = bacon_topic_filters("sub-1", ["86DM-1"])
+
+    assert apply_bacon_topic_filters(client, filters) is True
+    client._on_connect(mqtt_client, None, None, 0, None)
+    client._on_connect(mqtt_client, None, None, 0, None)
+
+    assert mqtt_client.subscribe.call_count == 2
+    mqtt_client.subscribe.assert_called_with([(f, 0) for f in filters])
+
+
+def test_apply_bacon_topic_filters_updates_a_live_session():
+    """A connected session subscribes the new filters and drops the old ones."""
+    mqtt_client = MagicMock()
+    client = SimpleNamespace(is_connected=False, _client=mqtt_client)
+    client._on_connect = MagicMock()
+    a_filters = bacon_topic_filters("sub-1", ["A"])
+    b_filters = bacon_topic_filters("sub-1", ["B"])
+    apply_bacon_topic_filters(client, a_filters)
+    hook = client._on_connect
+    client.is_connected = True
+
+    apply_bacon_topic_filters(client, sorted(a_filters + b_filters))
+    mqtt_client.subscribe.assert_called_once_with([(f, 0) for f in b_filters])
+    mqtt_client.unsubscribe.assert_not_called()
+
+    apply_bacon_topic_filters(client, b_filters)
+    mqtt_client.unsubscribe.assert_called_once_with(a_filters)
+    # The handler is wrapped once, not again on every call.
+    assert client._on_connect is hook
+
+
+def _sessions_client():
+    client = SimpleNamespace(is_connected=False, _client=MagicMock())
+    client._on_connect = MagicMock()
+    client.async_disconnect = AsyncMock()
+    return client
+
+
+async def test_session_registry_shares_one_client_per_account(hass):
+    """Entries of the same sub and region share a client; others get their own."""
+    registry = BaconSessionRegistry(hass)
+    create = MagicMock(side_effect=[_sessions_client(), _sessions_client()])
+    a_filters = bacon_topic_filters("sub-1", ["A"])
+    b_filters = bacon_topic_filters("sub-1", ["B"])
+
+    first = registry.async_acquire("entry-1", "sub-1", "euc1", a_filters, create)
+    first.client.is_connected = True
+    second = registry.async_acquire("entry-2", "sub-1", "euc1", b_filters, create)
+    other = registry.async_acquire("entry-3", "sub-2", "euc1", [], create)
+
+    assert first is second
+    assert other is not first
+    assert create.call_count == 2
+    assert first.client._on_connect.filters == sorted(a_filters + b_filters)
+    # The live session picked up the second entry's filters without a reconnect.
+    first.client._client.subscribe.assert_called_once_with([(f, 0) for f in b_filters])
+
+
+async def test_session_listeners_are_dropped_on_unload(hass):
+    """The client keeps one dispatcher per serial; unloaded listeners go."""
+    registry = BaconSessionRegistry(hass)
+    client = _sessions_client()
+    client.register_listener = MagicMock()
+    session = registry.async_acquire("entry-1", "sub-1", "euc1", [], lambda: client)
+    stale, live = MagicMock(), MagicMock()
+
+    remove = session.async_listen("A", stale)
+    remove()
+    session.async_listen("A", live)
+
+    client.register_listener.assert_called_once()
+    serial, dispatch = client.register_listener.call_args.args
+    dispatch({"reported": {"powerEnabled": True}})
+    assert serial == "A"
+    stale.assert_not_called()
+    live.assert_called_once_with({"reported": {"powerEnabled": True}})
+
+
+async def test_session_registry_disconnects_after_last_release(hass):
+    """The shared session stays up until the last entry lets go of it."""
+    registry = BaconSessionRegistry(hass)
+    client = _sessions_client()
+    for entry_id, serial in (("entry-1", "A"), ("entry-2", "B")):
+        registry.async_acquire(
+            entry_id,
+            "sub-1",
+            "euc1",
+            bacon_topic_filters("sub-1", [serial]),
+            lambda: client,
+        )
+
+    await registry.async_release("entry-1")
+    client.async_disconnect.assert_not_called()
+    assert client._on_connect.filters == bacon_topic_filters("sub-1", ["B"])
+    assert registry.clients() == [client]
+
+    await registry.async_release("entry-2")
+    client.async_disconnect.assert_awaited_once()
+    assert registry.clients() == []
+
+
+async def test_session_wildcard_entry_covers_device_filters(hass):
+    """A debugging entry's wildcard replaces the per-device filters."""
+    registry = BaconSessionRegistry(hass)
+    session = registry.async_acquire(
+        "entry-1",
+        "sub-1",
+        "euc1",
+        bacon_topic_filters("sub-1", ["A"]),
+        _sessions_client,
+    )
+    registry.async_acquire(
+        "entry-2",
+        "sub-1",
+        "euc1",
+        bacon_topic_filters("sub-1", ["B"], subscribe_all=True),
+        _sessions_client,
+    )
+    assert session.topic_filters() == ["users/sub-1/#"]
+
+
+# --- reconnect supervisor -----------------------------------------------------
+
+
+def test_bacon_backoff_delay_is_jittered_and_capped():
+    """Delays double per attempt, scaled into [0.5, 1] of the step, capped."""
+    assert 0.5 <= bacon_backoff_delay(0) <= 1.0
+    assert 4.0 <= bacon_backoff_delay(3) <= 8.0
+    assert 150.0 <= bacon_backoff_delay(30) <= 300.0
+
+
+async def test_supervisor_reconnects_with_backoff_and_signals(hass):
+    """A dropped session is retried until a connect succeeds, then signalled."""
+    client = SimpleNamespace(is_connected=True)
+    supervisor = BaconConnectionSupervisor(hass, client, asyncio.Lock())
+
+    async def _connect_second_time():
+        if connector.await_count == 1:
+            raise UpdateFailed("broker unavailable")
+        client.is_connected = True
+
+    connector = AsyncMock(side_effect=_connect_second_time)
+    supervisor.async_add_connector(connector)
+    restored = []
+    async_dispatcher_connect(
+        hass, supervisor.signal, callback(lambda: restored.append(1))
+    )
+    supervisor.async_start()
+
+    client.is_connected = False
+    with patch(
+        "custom_components.bosch_homecom.bacon.bacon_backoff_delay", return_value=0
+    ):
+        supervisor._async_check()
+        assert supervisor.state == "reconnecting"
+        await hass.async_block_till_done(wait_background_tasks=True)
+    supervisor.async_stop()
+
+    assert connector.await_count == 2
+    assert restored == [1]
+    assert supervisor.stats() | {"last_connected": None} == {
+        "state": "connected",
+        "connected": True,
+        "disconnects": 1,
+        "reconnects": 1,
+        "failed_attempts": 1,
+        "last_connected": None,
+        "last_disconnected": supervisor.last_disconnected,
+    }
+
+
+async def test_supervisor_ignores_connects_in_progress(hass):
+    """A coordinator holding the session lock is renewing it, not dropping it."""
+    client = SimpleNamespace(is_connected=False)
+    lock = asyncio.Lock()
+    supervisor = BaconConnectionSupervisor(hass, client, lock)
+    connector = AsyncMock()
+    supervisor.async_add_connector(connector)
+
+    async with lock:
+        supervisor._async_check()
+        assert supervisor.state == "disconnected"
+        client.is_connected = True
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    # Looked at again once the lock is free: the coordinator got there.
+    connector.assert_not_awaited()
+    assert supervisor.disconnects == 0
+    assert supervisor.state == "connected"
+
+
+async def test_supervisor_reconnects_on_the_disconnect_event(hass):
+    """The client's on-disconnect handler starts the reconnect, off-thread."""
+    on_disconnect = Mock()
+    client = SimpleNamespace(is_connected=True, _on_disconnect=on_disconnect)
+    supervisor = BaconConnectionSupervisor(hass, client, asyncio.Lock())
+
+    async def _connect():
+        client.is_connected = True
+
+    connector = AsyncMock(side_effect=_connect)
+    supervisor.async_add_connector(connector)
+    supervisor.async_start()
+
+    client.is_connected = False
+    with patch(
+        "custom_components.bosch_homecom.bacon.bacon_backoff_delay", return_value=0
+    ):
+        await hass.async_add_executor_job(client._on_disconnect, None, None, None, 7)
+        await hass.async_block_till_done(wait_background_tasks=True)
+    on_disconnect.assert_called_once_with(None, None, None, 7)
+    assert connector.await_count == 1
+    assert supervisor.disconnects == 1
+    assert supervisor.state == "connected"
+
+    # Stopped, an intentional disconnect is not followed up.
+    supervisor.async_stop()
+    client.is_connected = False
+    client._on_disconnect(None, None, None, 0)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert connector.await_count == 1
+
+
+# --- history (GraphQL) --------------------------------------------------------
+
+
+class _FakeResponse:
+    def __init__(self, body, status=200):
+        self.status = status
+        self._body = body
+
+    async def json(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    """Serve queued GraphQL bodies and record the posted requests."""
+
+    def __init__(self, *bodies):
+        self.bodies = list(bodies)
+        self.posts = []
+
+    def post(self, url, *, json, headers, timeout):
+        self.posts.append((url, json, headers))
+        return _FakeResponse(self.bodies.pop(0))
+
+
+def _page(items, next_token=None):
+    page = {"items": items, "nextToken": next_token}
+    return {"data": {"cumulateRacEmonRecords": page}}
+
+
+async def test_history_client_queries_one_serial_and_follows_next_token():
+    """Each query is for one serial; nextToken pages are concatenated."""
+    session = _FakeSession(
+        _page([{"timestamp": 1}], "t1"),
+        _page([{"timestamp": 2}]),
+    )
+    client = BaconHistoryClient(session, "euc1", lambda: "tok")
+    start = dt_util.utcnow() - timedelta(hours=2)
+
+    items = await client.async_query_items(
+        "getRacHourlyExtendedConsumptions", "query", "A", start, start
+    )
+
+    assert [item["timestamp"] for item in items] == [1, 2]
+    url, first, headers = session.posts[0]
+    assert url == "https://history.euc1.bacon.bosch-tt-cw.com/graphql"
+    assert headers == {"Authorization": "Bearer tok"}
+    assert first["variables"]["serialNumbers"] == ["A"]
+    assert first["variables"]["nextToken"] is None
+    assert session.posts[1][1]["variables"]["nextToken"] == "t1"
+
+
+async def test_history_client_raises_on_graphql_errors():
+    """GraphQL errors surface as ApiError so the import keeps its cursor."""
+    client = BaconHistoryClient(
+        _FakeSession({"errors": [{"message": "Unauthorized"}]}), "euc1", lambda: "t"
+    )
+    now = dt_util.utcnow()
+    with pytest.raises(ApiError):
+        await client.async_query_items("op", "query", "A", now, now)
+
+
+async def test_history_importer_feeds_per_mode_statistics():
+    """Each device is queried on its own; the running hour is left out."""
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    done = int((hour - timedelta(hours=1)).timestamp())
+    running = int(hour.timestamp())
+    client = MagicMock()
+    client.async_query_items = AsyncMock(
+        side_effect=[
+            [
+                {"timestamp": done, "totalElectricalEnergyConsumptionCool": 0.4},
+                {"timestamp": running, "totalElectricalEnergyConsumptionCool": 0.1},
+            ],
+            [{"timestamp": done * 1000, "roomTemperature": 23}],
+            [{"timestamp": done, "totalElectricalEnergyConsumptionHeat": 0.7}],
+            [],
+        ]
+    )
+    statistics = MagicMock()
+    statistics.async_load = AsyncMock()
+    statistics.async_add = AsyncMock(return_value=1)
+    statistics.last_start.return_value = None
+    importer = BaconHistoryImporter(client, statistics, {"A": "Living", "B": "Bed"})
+
+    await importer.async_run()
+
+    assert [call.args[2] for call in client.async_query_items.await_args_list] == [
+        "A",
+        "A",
+        "B",
+        "B",
+    ]
+    added = {
+        call.args[0].statistic_id: call.args[1]
+        for call in statistics.async_add.await_args_list
+        if call.args[1]
+    }
+    expected_start = hour - timedelta(hours=1)
+    assert added == {
+        "bosch_homecom:a_energy_cool": [(expected_start, 0.4)],
+        "bosch_homecom:b_energy_heat": [(expected_start, 0.7)],
+        "bosch_homecom:a_room_temperature": [(expected_start, 23.0)],
+    }
+    # Series without data move up to the newest hour their own query reported;
+    # B's empty sensor query only moves past hours beyond the grace period.
+    covered = {
+        call.args[0].statistic_id: call.kwargs["covered"]
+        for call in statistics.async_add.await_args_list
+    }
+    assert covered["bosch_homecom:a_energy_dry"] == expected_start
+    assert covered["bosch_homecom:b_energy_fan"] == expected_start
+    assert covered["bosch_homecom:b_room_temperature"] == hour - timedelta(hours=7)
+
+
+async def test_history_importer_window_follows_each_devices_cursors():
+    """A device's window starts after its own oldest cursor, not another's."""
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    client = MagicMock()
+    client.async_query_items = AsyncMock(return_value=[])
+    statistics = MagicMock()
+    statistics.async_load = AsyncMock()
+    statistics.async_add = AsyncMock(return_value=0)
+    statistics.last_start.side_effect = lambda statistic_id: (
+        hour - timedelta(hours=1)
+        if statistic_id.startswith("bosch_homecom:a_")
+        else hour - timedelta(hours=5)
+    )
+    importer = BaconHistoryImporter(client, statistics, {"A": "Living", "B": "Bed"})
+
+    await importer.async_run()
+
+    # A is up to date; only B is read, from the hour after its cursor.
+    assert {call.args[2] for call in client.async_query_items.await_args_list} == {"B"}
+    assert client.async_query_items.await_args.args[3] == hour - timedelta(hours=4)
+
+
+async def test_history_importer_keeps_hours_the_cloud_has_not_delivered():
+    """Without data a cursor only passes hours older than the grace period."""
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    client = MagicMock()
+    client.async_query_items = AsyncMock(
+        side_effect=[
+            [],
+            [
+                {
+                    "timestamp": int((hour - timedelta(hours=9)).timestamp()),
+                    "roomTemperature": 21,
+                }
+            ],
+        ]
+    )
+    statistics = MagicMock()
+    statistics.async_load = AsyncMock()
+    statistics.async_add = AsyncMock(return_value=0)
+    statistics.last_start.return_value = hour - timedelta(hours=10)
+    importer = BaconHistoryImporter(client, statistics, {"A": "Living"})
+
+    await importer.async_run()
+
+    assert {
+        call.kwargs["covered"] for call in statistics.async_add.await_args_list
+    } == {hour - BACON_HISTORY_GRACE - timedelta(hours=1)}
+
+
+async def test_history_importer_starts_after_cursor_and_swallows_errors():
+    """A later run asks only for hours after the cursor; failures are retried."""
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    client = MagicMock()
+    client.async_query_items = AsyncMock(side_effect=ApiError("down"))
+    statistics = MagicMock()
+    statistics.async_load = AsyncMock()
+    statistics.last_start.return_value = hour - timedelta(hours=3)
+    importer = BaconHistoryImporter(client, statistics, {"A": "Living"})
+
+    await importer.async_run()
+
+    assert client.async_query_items.await_args.args[3] == hour - timedelta(hours=2)
+    statistics.async_add.assert_not_called()
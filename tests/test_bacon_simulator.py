@@ -0,0 +1,157 @@
+"""Bacon coordinators against the local shadow broker stand-in."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+from homeassistant.const import CONF_TOKEN
+from homecom_alt import MqttNotAuthorizedError
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bosch_homecom.const import CONF_REFRESH, DOMAIN
+from custom_components.bosch_homecom.coordinator import (
+    BoschComModuleCoordinatorBaconRac,
+)
+
+from .bacon_simulator import (
+    SIM_SUB,
+    ShadowBroker,
+    SimulatedBaconClient,
+    SimulatedBaconRac,
+    measure_loop_lag,
+    topic_matches,
+)
+from .pointt_simulator import make_token
+
+
+def test_topic_matches_wildcards():
+    """Single- and multi-level wildcards behave as in MQTT."""
+    topic = "users/u/devices/A/topics/sensor"
+    assert topic_matches("users/u/#", topic)
+    assert topic_matches("users/u/devices/+/topics/sensor", topic)
+    assert not topic_matches("users/u/devices/B/#", topic)
+    assert not topic_matches("users/u/devices/A/topics", topic)
+
+
+async def test_shadow_get_and_update_accepted_or_rejected():
+    """Updates are applied and echoed; unknown fields are rejected."""
+    broker = ShadowBroker()
+    (serial,) = broker.add_fleet(1)
+    client = SimulatedBaconClient(broker)
+    await client.async_connect(make_token(SIM_SUB), SIM_SUB)
+    device = SimulatedBaconRac(client, serial)
+
+    await device.async_set_power(True, "heat")
+    state = await device.async_update()
+    with pytest.raises(ValueError):
+        await device._async_desire({"childLock": True})
+
+    assert state["reported"]["powerEnabled"] is True
+    assert state["reported"]["opMode"] == "heat"
+    assert broker.stats.rejected == 1
+    assert f"{serial}/shadows/state/update/rejected" in client.raw_snapshot()
+
+
+async def test_broker_refuses_expired_tokens_and_drops_on_expiry():
+    """CONNACK refusal and session expiry surface like the real broker's."""
+    broker = ShadowBroker()
+    client = SimulatedBaconClient(broker)
+
+    with pytest.raises(MqttNotAuthorizedError):
+        await client.async_connect(make_token(SIM_SUB, lifetime=-60), SIM_SUB)
+    broker.refuse_connects = 1
+    with pytest.raises(MqttNotAuthorizedError):
+        await client.async_connect(make_token(SIM_SUB), SIM_SUB)
+
+    await client.async_connect(make_token(SIM_SUB, lifetime=1), SIM_SUB)
+    assert client.is_connected
+    await asyncio.sleep(1.1)
+    assert not client.is_connected
+    assert (broker.stats.refused, broker.stats.dropped) == (2, 1)
+
+
+def _coordinators(hass, broker, serials, client):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_TOKEN: make_token(SIM_SUB), CONF_REFRESH: "sim-refresh"},
+    )
+    entry.add_to_hass(hass)
+    token_manager = Mock(token=make_token(SIM_SUB), refresh_token="sim-refresh")
+    token_manager.get_token = AsyncMock()
+    lock = asyncio.Lock()
+    return [
+        BoschComModuleCoordinatorBaconRac(
+            hass,
+            SimulatedBaconRac(client, serial),
+            {"deviceId": serial, "deviceType": "bacon_rac"},
+            {"value": "unknown"},
+            entry,
+            client,
+            token_manager,
+            lock,
+            index == 0,
+        )
+        for index, serial in enumerate(serials)
+    ]
+
+
+async def test_coordinator_recovers_from_connack_refusal(hass):
+    """A refused CONNACK is answered with a forced token refresh and a retry."""
+    broker = ShadowBroker()
+    serials = broker.add_fleet(1)
+    client = SimulatedBaconClient(broker)
+    (coordinator,) = _coordinators(hass, broker, serials, client)
+    broker.refuse_connects = 1
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    coordinator.token_manager.get_token.assert_awaited_with(force=True)
+    assert coordinator.data.reported["customTitle"] == "AC 0"
+    coordinator._cancel_scheduled_reconnect()
+
+
+@pytest.mark.parametrize("fleet", [10, 200])
+async def test_push_to_state_latency_under_fleet_traffic(hass, record_property, fleet):
+    """Measure push-to-state latency and loop lag with a busy fleet.
+
+    Every AC pushes topics/sensor twice a second while one changes its shadow;
+    the time until its coordinator holds the new state is the push latency.
+    Both are recorded as test properties (see ``--junitxml``).
+    """
+    broker = ShadowBroker()
+    serials = broker.add_fleet(fleet)
+    client = SimulatedBaconClient(broker)
+    coordinators = _coordinators(hass, broker, serials, client)
+    for coordinator in coordinators:
+        await coordinator.async_refresh()
+    assert all(c.last_update_success for c in coordinators)
+
+    target = coordinators[-1]
+    changed, sensed = asyncio.Event(), asyncio.Event()
+    target.async_add_listener(
+        lambda: target.data.reported.get("tempSetpoint") == 19 and changed.set()
+    )
+    target.async_add_listener(lambda: target.data.sensor is not None and sensed.set())
+    broker.start_traffic(per_device_rate=2)
+    try:
+        lag = await measure_loop_lag(0.5)
+        sent = broker.set_reported(serials[-1], tempSetpoint=19)
+        await asyncio.wait_for(changed.wait(), 5)
+        latency = time.monotonic() - sent
+        # The round robin reaches the last AC once per round, which a busy
+        # loop can stretch past the measuring window.
+        await asyncio.wait_for(sensed.wait(), 5)
+    finally:
+        broker.stop_traffic()
+        for coordinator in coordinators:
+            coordinator._cancel_scheduled_reconnect()
+
+    assert broker.stats.delivered > fleet
+    record_property("push_to_state_ms", round(latency * 1000, 2))
+    record_property("loop_lag_mean_ms", round(lag["mean"] * 1000, 2))
+    record_property("loop_lag_max_ms", round(lag["max"] * 1000, 2))
+    record_property("delivered", broker.stats.delivered)
@@ -0,0 +1,211 @@
+"""Benchmarks for entity state computation, per device type.
+
+Every entity the platforms create for one device is built from simulated
+payloads (the pointt simulator's resource trees, the bacon shadow broker) and
+the properties Home Assistant reads on each state write are timed together, as
+one update. ``extra_info`` carries the per-class breakdown: mean cost per
+update and the peak and retained allocations of one update.
+
+Skipped by the default test run; ``tox -e benchmark`` runs them offline and
+fails when one is much slower than the committed baseline (see tox.ini).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from functools import partial
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import async_get_platforms
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bosch_homecom import PLATFORMS
+from custom_components.bosch_homecom.const import CONF_DEVICES, CONF_REFRESH, DOMAIN
+from custom_components.bosch_homecom.coordinator import (
+    BoschComModuleCoordinatorBaconRac,
+)
+
+from .bacon_simulator import (
+    SIM_SUB,
+    ShadowBroker,
+    SimulatedBaconClient,
+    SimulatedBaconRac,
+)
+from .pointt_simulator import DEVICE_TREES, PointtSimulator, SimulatedDevice, make_token
+
+# What Home Assistant computes from an entity on each state write. Every one
+# reads the platform's own properties, for the features the entity supports.
+STATE_PROPERTIES = (
+    "available",
+    "state",
+    "capability_attributes",
+    "state_attributes",
+    "extra_state_attributes",
+)
+
+# The pointt simulator is a real HTTP server on the loopback interface.
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+# Rounds per class for the breakdown in extra_info.
+CLASS_ROUNDS = 200
+
+Read = Callable[[], Any]
+Entities = list[Entity]
+
+
+def _platform_entities(hass: HomeAssistant) -> Entities:
+    """Return the entities the integration's platforms added."""
+    return [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+    ]
+
+
+@asynccontextmanager
+async def _pointt_entities(
+    hass: HomeAssistant, device_type: str
+) -> AsyncIterator[Entities]:
+    device = SimulatedDevice.of_type("1", device_type)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="sim",
+        unique_id="sim",
+        data={
+            CONF_USERNAME: "sim",
+            CONF_TOKEN: make_token(),
+            CONF_REFRESH: "sim-refresh",
+            CONF_DEVICES: {f"{device.device_id}_{device_type}": True},
+        },
+    )
+    entry.add_to_hass(hass)
+    async with PointtSimulator([device]) as sim:
+        with patch(
+            "custom_components.bosch_homecom.async_create_clientsession",
+            side_effect=sim.create_clientsession,
+        ):
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            try:
+                yield _platform_entities(hass)
+            finally:
+                assert await hass.config_entries.async_unload(entry.entry_id)
+                await hass.async_block_till_done()
+
+
+@asynccontextmanager
+async def _bacon_entities(hass: HomeAssistant) -> AsyncIterator[Entities]:
+    broker = ShadowBroker()
+    (serial,) = broker.add_fleet(1)
+    client = SimulatedBaconClient(broker)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_TOKEN: make_token(SIM_SUB), CONF_REFRESH: "sim-refresh"},
+    )
+    entry.add_to_hass(hass)
+    token_manager = Mock(token=make_token(SIM_SUB), refresh_token="sim-refresh")
+    token_manager.get_token = AsyncMock()
+    coordinator = BoschComModuleCoordinatorBaconRac(
+        hass,
+        SimulatedBaconRac(client, serial),
+        {"deviceId": serial, "deviceType": "bacon_rac"},
+        {"value": "unknown"},
+        entry,
+        client,
+        token_manager,
+        asyncio.Lock(),
+        True,
+    )
+    await coordinator.async_refresh()
+    broker.push_topic(serial, "sensor", {"roomTemperature": 22.5})
+    broker.push_topic(
+        serial, "info", {"network": {"signalStrength": -58, "signalQuality": 3}}
+    )
+    await asyncio.sleep(0)
+    entry.runtime_data = [coordinator]
+    # The coordinator stands in for the entry's setup, which needs the cloud.
+    hass.config.components.add(DOMAIN)
+    entry.mock_state(hass, ConfigEntryState.LOADED)
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.async_block_till_done()
+    try:
+        yield _platform_entities(hass)
+    finally:
+        assert await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        coordinator._cancel_scheduled_reconnect()
+
+
+def _readers(entities: Entities) -> dict[str, list[Read]]:
+    """Bind every (entity, property) read, grouped by entity class."""
+    readers: dict[str, list[Read]] = defaultdict(list)
+    for entity in entities:
+        for name in STATE_PROPERTIES:
+            readers[type(entity).__name__].append(partial(getattr, entity, name))
+    return readers
+
+
+def _update(reads: list[Read]) -> None:
+    for read in reads:
+        read()
+
+
+def _class_costs(readers: dict[str, list[Read]]) -> dict[str, dict[str, Any]]:
+    """Time and trace one class at a time."""
+    costs: dict[str, dict[str, Any]] = {}
+    for name, reads in readers.items():
+        started = time.perf_counter()
+        for _ in range(CLASS_ROUNDS):
+            _update(reads)
+        elapsed = (time.perf_counter() - started) / CLASS_ROUNDS
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        base, _ = tracemalloc.get_traced_memory()
+        _update(reads)
+        _, peak = tracemalloc.get_traced_memory()
+        retained = tracemalloc.take_snapshot().compare_to(before, "filename")
+        tracemalloc.stop()
+
+        costs[name] = {
+            "reads": len(reads),
+            "us_per_update": round(elapsed * 1e6, 3),
+            "peak_bytes": max(0, peak - base),
+            "retained_blocks": sum(max(0, stat.count_diff) for stat in retained),
+        }
+    return costs
+
+
+def _benchmark(benchmark, entities: Entities) -> None:
+    readers = _readers(entities)
+    reads = [read for class_reads in readers.values() for read in class_reads]
+    assert reads, "no entity state to compute"
+    costs = _class_costs(readers)
+    benchmark.extra_info["entities"] = len(entities)
+    benchmark.extra_info["classes"] = costs
+    benchmark(_update, reads)
+
+
+@pytest.mark.parametrize("device_type", sorted(DEVICE_TREES))
+async def test_benchmark_pointt_entity_state(hass, benchmark, device_type):
+    """Cost of one state update of every entity of a pointt device."""
+    benchmark.group = "entity state"
+    async with _pointt_entities(hass, device_type) as entities:
+        _benchmark(benchmark, entities)
+
+
+async def test_benchmark_bacon_entity_state(hass, benchmark):
+    """Cost of one state update of every entity of a bacon (Matter) AC."""
+    benchmark.group = "entity state"
+    async with _bacon_entities(hass) as entities:
+        _benchmark(benchmark, entities)
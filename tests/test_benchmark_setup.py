@@ -0,0 +1,231 @@
+"""End-to-end benchmark of ``async_setup_entry`` against the pointt simulator.
+
+Each round sets the entry up and unloads it again, for fleets of growing size.
+The calls making up each setup phase are wrapped with timers, so besides the
+total the benchmark records, per phase, the number of calls, the wall-clock
+span from the first call's start to the last one's end, and the time spent
+inside the calls (which exceeds the span when calls overlap, as the first
+refreshes do). The per-phase means of all rounds are in ``extra_info``.
+
+The test is synchronous because pytest-benchmark times plain callables; every
+round runs on the Home Assistant loop through ``run_until_complete``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from contextlib import ExitStack
+from functools import wraps
+import time
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homecom_alt import HomeComAlt
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+import custom_components.bosch_homecom as integration
+from custom_components.bosch_homecom.const import CONF_DEVICES, CONF_REFRESH, DOMAIN
+
+from .pointt_simulator import PointtSimulator, SimulatorConfig, device_fleet, make_token
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+ROUNDS = 3
+PHASES = (
+    "client",
+    "device listing",
+    "bacon discovery",
+    "firmware",
+    "first refresh",
+    "device registry",
+    "platforms",
+)
+
+
+class PhaseTimer:
+    """Time the calls of named phases."""
+
+    def __init__(self) -> None:
+        """Initialize an empty timer."""
+        self.calls: Counter[str] = Counter()
+        self.busy: defaultdict[str, float] = defaultdict(float)
+        self._first: dict[str, float] = {}
+        self._last: dict[str, float] = {}
+        self._running: Counter[str] = Counter()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self.calls.clear()
+        self.busy.clear()
+        self._first.clear()
+        self._last.clear()
+
+    def wrap(
+        self, phase: str, func: Callable[..., Any], *, unless: str | None = None
+    ) -> Callable[..., Any]:
+        """Return ``func`` timed as part of ``phase``.
+
+        Calls made while phase ``unless`` runs are not counted, e.g. device
+        registry writes of the entity platforms during forwarding.
+        """
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def timed_async(*args: Any, **kwargs: Any) -> Any:
+                if unless and self._running[unless]:
+                    return await func(*args, **kwargs)
+                started = self._start(phase)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self._stop(phase, started)
+
+            return timed_async
+
+        @wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            if unless and self._running[unless]:
+                return func(*args, **kwargs)
+            started = self._start(phase)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._stop(phase, started)
+
+        return timed
+
+    def _start(self, phase: str) -> float:
+        self._running[phase] += 1
+        started = time.perf_counter()
+        self._first.setdefault(phase, started)
+        return started
+
+    def _stop(self, phase: str, started: float) -> None:
+        stopped = time.perf_counter()
+        self._running[phase] -= 1
+        self.calls[phase] += 1
+        self.busy[phase] += stopped - started
+        self._last[phase] = max(self._last.get(phase, stopped), stopped)
+
+    def breakdown(self) -> dict[str, dict[str, float]]:
+        """Return calls, span and busy time per phase, in seconds."""
+        return {
+            phase: {
+                "calls": self.calls[phase],
+                "span": self._last[phase] - self._first[phase],
+                "busy": self.busy[phase],
+            }
+            for phase in PHASES
+            if phase in self._first
+        }
+
+
+def _instrument(stack: ExitStack, hass: HomeAssistant, timer: PhaseTimer) -> None:
+    """Wrap the calls making up each setup phase."""
+    # The device clients inherit from HomeComAlt, so their own reads during the
+    # first refresh are left to that phase; the entity platforms' registry
+    # writes likewise belong to forwarding.
+    for phase, owner, name, unless in (
+        ("client", HomeComAlt, "create", None),
+        ("device listing", HomeComAlt, "async_get_devices", "first refresh"),
+        ("firmware", HomeComAlt, "async_get_firmware", "first refresh"),
+        ("bacon discovery", integration, "async_get_bacon_devices", None),
+        (
+            "first refresh",
+            DataUpdateCoordinator,
+            "async_config_entry_first_refresh",
+            None,
+        ),
+        ("device registry", dr.DeviceRegistry, "async_get_or_create", "platforms"),
+        ("platforms", hass.config_entries, "async_forward_entry_setups", None),
+    ):
+        timed = timer.wrap(phase, getattr(owner, name), unless=unless)
+        stack.enter_context(patch.object(owner, name, timed))
+
+
+def _entry(fleet) -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="sim",
+        unique_id="sim",
+        data={
+            CONF_USERNAME: "sim",
+            CONF_TOKEN: make_token(),
+            CONF_REFRESH: "sim-refresh",
+            CONF_DEVICES: {
+                f"{device.device_id}_{device.device_type}": True for device in fleet
+            },
+        },
+    )
+
+
+@pytest.mark.parametrize("count", [1, 10, 50, 100])
+def test_benchmark_setup_phases(hass, benchmark, record_property, count):
+    """Time each phase of setting up ``count`` devices."""
+    benchmark.group = "setup"
+    fleet = device_fleet(count)
+    entry = _entry(fleet)
+    entry.add_to_hass(hass)
+    sim = PointtSimulator(fleet, SimulatorConfig(latency=0.001))
+    timer = PhaseTimer()
+    rounds: list[dict[str, dict[str, float]]] = []
+
+    async def setup_and_unload() -> None:
+        timer.reset()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        rounds.append(timer.breakdown())
+        assert len(entry.runtime_data) == count
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    hass.loop.run_until_complete(sim.__aenter__())
+    try:
+        with ExitStack() as stack:
+            stack.enter_context(
+                patch(
+                    "custom_components.bosch_homecom.async_create_clientsession",
+                    side_effect=sim.create_clientsession,
+                )
+            )
+            # Large fleets would otherwise time the request budget's queue.
+            stack.enter_context(
+                patch(
+                    "custom_components.bosch_homecom.scheduler.SCHEDULER_BURST", 10**6
+                )
+            )
+            _instrument(stack, hass, timer)
+            benchmark.pedantic(
+                lambda: hass.loop.run_until_complete(setup_and_unload()),
+                rounds=ROUNDS,
+                warmup_rounds=1,
+            )
+    finally:
+        hass.loop.run_until_complete(sim.__aexit__(None, None, None))
+
+    # The warm-up round ran on an empty device registry; the measured ones
+    # take the restart path, where every device already exists.
+    measured = rounds[-ROUNDS:]
+    phases = {
+        phase: {
+            key: sum(r[phase][key] for r in measured if phase in r) / len(measured)
+            for key in ("calls", "span", "busy")
+        }
+        for phase in PHASES
+        if any(phase in r for r in measured)
+    }
+    benchmark.extra_info["devices"] = count
+    benchmark.extra_info["phases"] = phases
+    for phase, stats in phases.items():
+        record_property(
+            phase,
+            f"{stats['calls']:.0f} calls, {stats['span'] * 1000:.1f} ms span,"
+            f" {stats['busy'] * 1000:.1f} ms busy",
+        )
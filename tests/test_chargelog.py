@@ -0,0 +1,194 @@
+"""Tests for the incremental wallbox charge log sync."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+from homeassistant.const import CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from custom_components.bosch_homecom.chargelog import ChargelogSync
+from custom_components.bosch_homecom.const import (
+    CONF_REFRESH,
+    DOMAIN,
+    EVENT_CHARGE_SESSION,
+)
+from custom_components.bosch_homecom.coordinator import (
+    BoschComModuleCoordinatorCommodule,
+)
+
+from .test_coordinator import _make_commodule_data
+
+ADD_STATISTICS = (
+    "custom_components.bosch_homecom.statistics.async_add_external_statistics"
+)
+
+
+def _session(begin, minutes: int = 60, energy: float = 10.0) -> dict[str, Any]:
+    return {
+        "begin": begin.isoformat(),
+        "end": (begin + timedelta(minutes=minutes)).isoformat(),
+        "energy": str(energy),
+        "chargingDuration": minutes * 60,
+        "cost": {"total": energy * 0.3, "unit": 0.3, "currency": "EUR"},
+    }
+
+
+def _sync(hass: HomeAssistant) -> ChargelogSync:
+    return ChargelogSync(hass, "wb1", "Wallbox")
+
+
+async def _read(sync: ChargelogSync, *sessions: dict[str, Any]) -> int:
+    """Sync charge point cp0 with its log holding ``sessions``."""
+    return await sync.async_sync({"cp0": {"values": list(sessions)}})
+
+
+async def test_first_sync_records_without_events(hass: HomeAssistant):
+    """The log found at the first sync is stored, not announced."""
+    events = async_capture_events(hass, EVENT_CHARGE_SESSION)
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    sync = _sync(hass)
+
+    added = await _read(sync, _session(hour - timedelta(hours=5)))
+    await hass.async_block_till_done()
+
+    assert added == 0
+    assert events == []
+    assert len(sync.sessions("cp0")) == 1
+
+
+async def test_empty_or_failed_reads_leave_the_charge_point_unknown(
+    hass: HomeAssistant,
+):
+    """Only the first log with sessions marks a charge point as synced."""
+    events = async_capture_events(hass, EVENT_CHARGE_SESSION)
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    sync = _sync(hass)
+
+    assert await _read(sync) == 0
+    assert await sync.async_sync({"cp0": None}) == 0
+    assert sync.stats()["stored_sessions"] == {}
+
+    old = _session(hour - timedelta(days=30))
+    assert await _read(sync, old) == 0
+    new = _session(hour - timedelta(hours=2))
+    assert await _read(sync, new, old) == 1
+    await hass.async_block_till_done()
+
+    assert [event.data["begin"] for event in events] == [new["begin"]]
+    assert sync.latest["cp0"] == new
+    assert sync.logged["cp0"] == 2
+
+
+async def test_new_sessions_fire_events_once(hass: HomeAssistant):
+    """Only sessions newer than the stored ones are added and announced."""
+    events = async_capture_events(hass, EVENT_CHARGE_SESSION)
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    old = _session(hour - timedelta(hours=10))
+    sync = _sync(hass)
+    await _read(sync, old)
+
+    new = [
+        _session(hour - timedelta(hours=3), energy=7.5),
+        _session(hour - timedelta(hours=5), energy=4.0),
+    ]
+    assert await _read(sync, *new, old) == 2
+    assert await _read(sync, *new, old) == 0
+    await hass.async_block_till_done()
+
+    assert [event.data["energy"] for event in events] == [4.0, 7.5]
+    assert events[0].data["charge_point"] == "cp0"
+    assert events[0].data["currency"] == "EUR"
+    assert sync.stats()["stored_sessions"] == {"cp0": 3}
+
+
+async def test_sessions_feed_statistics_by_end_hour(hass: HomeAssistant, freezer):
+    """Energy and cost are imported once the hour a session ended is over."""
+    hass.config.components.add("recorder")
+    freezer.move_to("2026-03-01 10:30:00+00:00")
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    sync = _sync(hass)
+
+    with patch(ADD_STATISTICS) as add:
+        await _read(
+            sync,
+            _session(hour + timedelta(minutes=5), minutes=20),
+            _session(hour - timedelta(hours=2), energy=6.0),
+            _session(hour - timedelta(hours=2, minutes=50), energy=4.0),
+        )
+
+    energy, cost = (call.args[1:] for call in add.call_args_list)
+    assert energy[0]["statistic_id"] == "bosch_homecom:wb1_cp0_charged_energy"
+    assert [(row["start"], row["sum"]) for row in energy[1]] == [
+        (hour - timedelta(hours=2), 4.0),
+        (hour - timedelta(hours=1), 10.0),
+    ]
+    assert cost[0]["unit_of_measurement"] == "EUR"
+    assert cost[1][-1]["sum"] == pytest.approx(3.0)
+
+
+async def test_sessions_survive_restarts(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+):
+    """Stored sessions are known after a restart; nothing is announced twice."""
+    events = async_capture_events(hass, EVENT_CHARGE_SESSION)
+    begin = dt_util.utcnow() - timedelta(days=1)
+    session = _session(begin)
+    newer = _session(begin + timedelta(hours=6))
+    hass_storage["bosch_homecom.chargelog.wb1"] = {
+        "version": 1,
+        "key": "bosch_homecom.chargelog.wb1",
+        "data": {"sessions": {"cp0": {session["begin"]: session}}},
+    }
+    sync = _sync(hass)
+
+    assert await _read(sync, newer, session) == 1
+    await hass.async_block_till_done()
+    assert [event.data["begin"] for event in events] == [newer["begin"]]
+
+
+async def test_coordinator_syncs_the_logs_of_its_full_reads(hass: HomeAssistant):
+    """The logs come with the polls; they are never downloaded again."""
+    events = async_capture_events(hass, EVENT_CHARGE_SESSION)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_USERNAME: "u", CONF_TOKEN: "t", CONF_REFRESH: "r"}
+    )
+    entry.add_to_hass(hass)
+    device = {"deviceId": "wb1", "deviceType": "commodule"}
+    session = _session(dt_util.utcnow() - timedelta(days=1))
+    newer = _session(dt_util.utcnow() - timedelta(hours=3))
+
+    def _data(*sessions: dict[str, Any]):
+        return replace(
+            _make_commodule_data(device, {"value": "1.0"}),
+            charge_points=[
+                {"id": f"/chargepoints/{cp_id}", "chargelog": {"values": [*sessions]}}
+                for cp_id in ("cp0", "cp1")
+            ],
+        )
+
+    bhc = Mock(
+        async_update=AsyncMock(return_value=_data(session)),
+        async_get_cp_chargelog=AsyncMock(),
+    )
+    coordinator = BoschComModuleCoordinatorCommodule(
+        hass, bhc, device, {"value": "1.0"}, entry, False
+    )
+    await coordinator.async_refresh()
+    bhc.async_update.return_value = _data(newer, session)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    bhc.async_get_cp_chargelog.assert_not_called()
+    assert coordinator.chargelog.latest == dict.fromkeys(["cp0", "cp1"], newer)
+    assert [event.data["charge_point"] for event in events] == ["cp0", "cp1"]
+    await coordinator.async_shutdown()
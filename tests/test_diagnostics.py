@@ -6,10 +6,15 @@ from homeassistant.const import CONF_CODE, CONF_TOKEN, CONF_USERNAME
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.bosch_homecom.const import CONF_REFRESH, DOMAIN
+from custom_components.bosch_homecom.const import (
+    CONF_REFRESH,
+    DIAGNOSTICS_RAW_MAX_BYTES,
+    DOMAIN,
+)
 from custom_components.bosch_homecom.diagnostics import (
     async_get_config_entry_diagnostics,
 )
+from custom_components.bosch_homecom.scheduler import REQUEST_SCHEDULERS
 
 
 @pytest.mark.asyncio
@@ -45,6 +50,10 @@ async def test_async_get_config_entry_diagnostics_redacts_refresh_token(hass):
     # Non-bacon coordinators have no shadow -> None (not a spurious empty dict).
     assert diagnostics["data"][0]["reported"] is None
     assert diagnostics["data"][0]["desired"] is None
+    assert diagnostics["poll_metrics"] == [None]
+    # Downloading diagnostics does not set up a request budget of its own.
+    assert diagnostics["scheduler"] is None
+    assert REQUEST_SCHEDULERS not in hass.data
 
 
 @pytest.mark.asyncio
@@ -73,3 +82,44 @@ async def test_async_get_config_entry_diagnostics_dumps_bacon_shadow(hass):
     assert dumped["reported"]["opMode"] == "cool"
     assert dumped["reported"]["tempSetpoint"] == 23
     assert dumped["desired"] == {"tempSetpoint": 23}
+
+
+@pytest.mark.asyncio
+async def test_async_get_config_entry_diagnostics_bounds_bacon_raw(hass):
+    """The raw MQTT section is capped to a byte budget, newest entries kept."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="test-user",
+        data={CONF_USERNAME: "test-user", CONF_TOKEN: "access_token"},
+    )
+    entry.add_to_hass(hass)
+    big = "x" * (DIAGNOSTICS_RAW_MAX_BYTES // 2)
+    snapshot = {
+        "86DM-0001/topics/sensor": {
+            "payload": {"blob": big},
+            "received_at": "2026-01-01T00:00:00+00:00",
+        },
+        "86DM-0001/topics/info": {
+            "payload": {"blob": big},
+            "received_at": "2026-01-01T00:00:01+00:00",
+        },
+        "86DM-0001/shadows/state/get/accepted": {
+            "payload": {"ssid": "home", "blob": "small"},
+            "received_at": "2026-01-01T00:00:02+00:00",
+        },
+    }
+    entry.runtime_data = [
+        SimpleNamespace(
+            data=SimpleNamespace(device={"deviceId": "86DM-0001"}),
+            client=SimpleNamespace(raw_snapshot=lambda: snapshot),
+        )
+    ]
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    raw = diagnostics["bacon_raw"]
+    assert "86DM***/topics/sensor" not in raw
+    assert "86DM***/topics/info" in raw
+    assert raw["86DM***/shadows/state/get/accepted"]["payload"]["ssid"] == (
+        "**REDACTED**"
+    )
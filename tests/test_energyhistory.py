@@ -0,0 +1,134 @@
+"""Tests for the daily wallbox energy history import."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from homeassistant.util import dt as dt_util
+from homecom_alt import ApiError
+
+from custom_components.bosch_homecom.energyhistory import (
+    EnergyHistoryImporter,
+    energy_history_buckets,
+)
+
+
+def _coordinator(result) -> Mock:
+    bhc = Mock(async_request_bulk=AsyncMock(return_value=result))
+    return Mock(
+        bhc=bhc,
+        unique_id="wb1",
+        device_info={"name": "Wallbox"},
+        data=Mock(charge_points=[{"id": "/rest/v1/cp0"}, {"id": "/rest/v1/cp1"}]),
+    )
+
+
+def _statistics() -> MagicMock:
+    statistics = MagicMock()
+    statistics.async_load = AsyncMock()
+    statistics.async_add = AsyncMock(return_value=1)
+    return statistics
+
+
+def _hourly(start: datetime, energy) -> dict:
+    start = dt_util.as_local(start)
+    return {"d": start.strftime("%d-%m-%Y"), "h": start.hour, "energy": energy}
+
+
+def test_energy_history_buckets_parse_hourly_entries():
+    """Hourly entries are parsed; day totals and malformed ones dropped."""
+    local = dt_util.get_default_time_zone()
+    buckets = energy_history_buckets(
+        {
+            "id": "/rest/v1/cp0/energyhistory",
+            "type": "array",
+            "value": [
+                {"d": "01-03-2026", "h": 10, "energy": "1.5"},
+                {"d": "02-03-2026", "h": 7, "energy": 2},
+                {"d": "03-03-2026", "energy": 12},
+                {"d": "04-03-2026", "h": 24, "energy": 1},
+                {"d": "not a day", "h": 1, "energy": 3},
+                {"d": "05-03-2026", "h": 1},
+                {"timestamp": "2026-03-01T11:00:00+00:00", "energy": 1},
+                "garbage",
+            ],
+        }
+    )
+
+    assert buckets == [
+        (datetime(2026, 3, 1, 10, tzinfo=local), 1.5),
+        (datetime(2026, 3, 2, 7, tzinfo=local), 2.0),
+    ]
+    assert energy_history_buckets(None) == []
+
+
+async def test_importer_reads_all_charge_points_in_one_request():
+    """One bulk read per wallbox; only completed hours reach statistics."""
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    coordinator = _coordinator(
+        {
+            "/rest/v1/cp0/energyhistory": {
+                "value": [
+                    _hourly(hour - timedelta(hours=1), 4.2),
+                    _hourly(hour, 0.3),
+                ]
+            },
+        }
+    )
+    statistics = _statistics()
+
+    await EnergyHistoryImporter([coordinator], statistics).async_run()
+
+    coordinator.bhc.async_request_bulk.assert_awaited_once_with(
+        "wb1", ["/rest/v1/cp0/energyhistory", "/rest/v1/cp1/energyhistory"]
+    )
+    added = {
+        call.args[0].statistic_id: call.args[1]
+        for call in statistics.async_add.await_args_list
+    }
+    assert added == {
+        "bosch_homecom:wb1_cp0_energy_history": [(hour - timedelta(hours=1), 4.2)],
+    }
+
+
+async def test_importer_skips_day_totals():
+    """Day totals are not imported; the hours of the day are."""
+    yesterday = dt_util.start_of_local_day() - timedelta(days=1)
+    coordinator = _coordinator(
+        {
+            "/rest/v1/cp0/energyhistory": {
+                "value": [
+                    {"d": yesterday.strftime("%d-%m-%Y"), "energy": 20},
+                    _hourly(yesterday + timedelta(hours=8), 2),
+                ]
+            },
+            "/rest/v1/cp1/energyhistory": {
+                "value": [{"d": yesterday.strftime("%d-%m-%Y"), "energy": 5}]
+            },
+        }
+    )
+    statistics = _statistics()
+
+    await EnergyHistoryImporter([coordinator], statistics).async_run()
+
+    added = {
+        call.args[0].statistic_id: call.args[1]
+        for call in statistics.async_add.await_args_list
+    }
+    assert added == {
+        "bosch_homecom:wb1_cp0_energy_history": [(yesterday + timedelta(hours=8), 2.0)],
+    }
+
+
+async def test_importer_swallows_errors():
+    """A failed read imports nothing; the next run tries again."""
+    coordinator = _coordinator(None)
+    coordinator.bhc.async_request_bulk.side_effect = ApiError("down")
+    statistics = _statistics()
+    importer = EnergyHistoryImporter([coordinator], statistics)
+
+    await importer.async_run()
+
+    statistics.async_add.assert_not_called()
+    assert not importer._running
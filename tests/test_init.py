@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, Mock, patch
 from homeassistant.const import CONF_CODE, CONF_TOKEN, CONF_USERNAME
 from homeassistant.helpers import device_registry as dr
 from homeassistant.setup import async_setup_component
-from homecom_alt import BHCDeviceRac
+from homecom_alt import BaconMqttClient, BHCDeviceRac
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -173,3 +173,74 @@ async def test_get_shadow_service_rejects_non_bacon(hass):
     )
 
     assert result == {}
+
+
+@pytest.mark.asyncio
+async def test_capture_raw_service_is_bounded(hass):
+    """capture_raw_service records through a byte-bounded ring buffer."""
+    assert await async_setup_component(hass, DOMAIN, {}) is True
+
+    client = Mock(spec=BaconMqttClient)
+
+    def _register(listener):
+        listener("86DM-1", "topics/sensor", {"roomTemperature": 22})
+        listener("86DM-1", "topics/sensor", {"roomTemperature": 23})
+        listener("86DM-1", "topics/info", {"online": True})
+
+    client.register_raw_listener.side_effect = _register
+
+    entry = MockConfigEntry(domain=DOMAIN, title="t", data={CONF_USERNAME: "t"})
+    entry.add_to_hass(hass)
+    entry.runtime_data = [
+        SimpleNamespace(
+            device={"deviceId": "86DM-1", "deviceType": "bacon_rac"},
+            client=client,
+        )
+    ]
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "capture_raw_service",
+        {"seconds": 0, "per_topic": 2},
+        blocking=True,
+        return_response=True,
+    )
+
+    sensor = result["captured"]["86DM-1/topics/sensor"]
+    assert sensor["payload"] == {"roomTemperature": 23}
+    assert sensor["previous"][0]["payload"] == {"roomTemperature": 22}
+    assert result["topics_seen"] == ["86DM-1/topics/info", "86DM-1/topics/sensor"]
+    assert result["buffer"]["messages"] == 3
+    client.remove_raw_listener.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_capture_raw_service_clamps_its_bounds(hass):
+    """A budget or retention below the services.yaml minimum is raised to it."""
+    assert await async_setup_component(hass, DOMAIN, {}) is True
+
+    client = Mock(spec=BaconMqttClient)
+    client.register_raw_listener.side_effect = lambda listener: listener(
+        "86DM-1", "topics/sensor", {"roomTemperature": 22}
+    )
+    entry = MockConfigEntry(domain=DOMAIN, title="t", data={CONF_USERNAME: "t"})
+    entry.add_to_hass(hass)
+    entry.runtime_data = [
+        SimpleNamespace(
+            device={"deviceId": "86DM-1", "deviceType": "bacon_rac"},
+            client=client,
+        )
+    ]
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "capture_raw_service",
+        {"seconds": 0, "max_bytes": -5, "per_topic": 0},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result["buffer"]["max_bytes"] == 1024
+    assert result["captured"]["86DM-1/topics/sensor"]["payload"] == {
+        "roomTemperature": 22
+    }
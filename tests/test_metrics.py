@@ -0,0 +1,172 @@
+"""Tests for the coordinators' poll metrics."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from homeassistant.const import CONF_TOKEN, CONF_USERNAME
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from yarl import URL
+
+from custom_components.bosch_homecom.const import CONF_DEVICES, CONF_REFRESH, DOMAIN
+from custom_components.bosch_homecom.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.bosch_homecom.metrics import (
+    MAX_ENDPOINTS,
+    EndpointStats,
+    LatencyHistogram,
+    PollMetrics,
+    endpoint_key,
+    metrics_trace_config,
+)
+
+from .pointt_simulator import PointtSimulator, SimulatedDevice, make_token
+
+API = "https://pointt-api.bosch-thermotechnology.com/pointt-api/api/v1"
+
+
+def test_poll_records_phases_and_failures():
+    """Phases add up per poll, nested polls join, failures are flagged."""
+    metrics = PollMetrics(window=2)
+
+    with metrics.poll():
+        with metrics.phase("token"):
+            pass
+        with metrics.poll(), metrics.phase("update"):
+            metrics.record_request(200)
+            metrics.record_request(404)
+            metrics.record_bytes(100)
+        with metrics.phase("update"):
+            metrics.record_request(None)
+    with pytest.raises(RuntimeError), metrics.poll():
+        raise RuntimeError
+    metrics.record_request(200)
+
+    first, second = metrics.samples
+    assert set(first.phases) == {"token", "update"}
+    assert (first.requests, first.errors, first.bytes_received) == (3, 2, 100)
+    assert not first.failed
+    assert second.failed
+    assert second.requests == 0
+    summary = metrics.summary()
+    assert summary["polls"] == 2
+    assert summary["failed_polls"] == 1
+    assert summary["requests"] == {"last": 0, "mean": 1.5}
+    assert summary["errors"] == 2
+
+    with metrics.poll():
+        pass
+    assert [sample.failed for sample in metrics.samples] == [True, False]
+
+
+def test_latency_histogram_percentiles():
+    """Percentiles interpolate inside buckets; the overflow answers the max."""
+    histogram = LatencyHistogram()
+    for milliseconds in [5] * 50 + [60] * 40 + [200] * 9 + [45000]:
+        histogram.add(milliseconds)
+
+    assert 0 < histogram.percentile(50) <= 10
+    assert 50 < histogram.percentile(90) <= 100
+    assert 100 < histogram.percentile(99) <= 250
+    assert histogram.percentile(100) == 45000
+    assert LatencyHistogram().percentile(50) is None
+
+
+@pytest.mark.parametrize(
+    ("url", "key"),
+    [
+        (f"{API}/gateways/", "gateways"),
+        (
+            f"{API}/gateways/101/resource/heatSources/hs1/actualModulation",
+            "/heatSources/*",
+        ),
+        (f"{API}/gateways/101/resource/recordings/heatSources/emon", "/recordings/*"),
+        (f"{API}/bulk", "bulk"),
+        ("https://singlekey-id.com/auth/connect/token", "singlekey-id.com/auth"),
+    ],
+)
+def test_endpoint_key_groups_urls(url, key):
+    """Ids do not split an endpoint; unknown hosts group by first segment."""
+    assert endpoint_key(URL(url)) == key
+
+
+def test_endpoint_stats_cap_and_measure():
+    """Endpoints beyond the cap pool as "other"; exceptions become statuses."""
+    stats = EndpointStats()
+    with pytest.raises(TimeoutError), stats.measure("shadow get"):
+        raise TimeoutError
+    with stats.measure("shadow get"):
+        pass
+    for n in range(MAX_ENDPOINTS + 5):
+        stats.record(f"/node{n}/*", 0.01, 200)
+
+    summary = stats.summary()
+    assert summary["shadow get"]["statuses"] == {"TimeoutError": 1, "ok": 1}
+    assert set(summary["shadow get"]) >= {"p50_ms", "p90_ms", "p99_ms", "histogram"}
+    assert len(summary) == MAX_ENDPOINTS + 1
+    assert summary["other"]["count"] == 6
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_trace_config_feeds_the_current_poll():
+    """Requests count toward the poll whose context sent them, and only that."""
+    metrics = PollMetrics()
+    endpoints = EndpointStats()
+    async with PointtSimulator([SimulatedDevice.of_type("1", "k40")]) as sim:
+        session = sim.client_session([metrics_trace_config(endpoints)])
+        with metrics.poll():
+            async with session.get(f"{API}/gateways/") as response:
+                await response.read()
+            async with session.get(f"{API}/gateways/1/resource/nope") as response:
+                await response.read()
+        async with session.get(f"{API}/gateways/") as response:
+            await response.read()
+
+    (sample,) = metrics.samples
+    assert sample.requests == 2
+    assert sample.errors == 1
+    assert sample.bytes_received > 0
+    summary = endpoints.summary()
+    assert summary["gateways"]["statuses"] == {"200": 2}
+    assert summary["/nope/*"]["statuses"] == {"404": 1}
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_setup_polls_report_metrics(hass):
+    """A set-up coordinator reports phases and requests, also in diagnostics."""
+    device = SimulatedDevice.of_type("1", "k40")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="sim",
+        unique_id="sim",
+        data={
+            CONF_USERNAME: "sim",
+            CONF_TOKEN: make_token(),
+            CONF_REFRESH: "sim-refresh",
+            CONF_DEVICES: {"1_k40": True},
+        },
+    )
+    entry.add_to_hass(hass)
+
+    async with PointtSimulator([device]) as sim:
+        with patch(
+            "custom_components.bosch_homecom.async_create_clientsession",
+            side_effect=sim.create_clientsession,
+        ):
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            (coordinator,) = entry.runtime_data
+            await coordinator.async_refresh()
+            diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+            assert await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+
+    first, second = coordinator.metrics.samples
+    assert {"token", "update", "extra_endpoints", "recordings"} <= set(first.phases)
+    # Recordings are fetched hourly, not on every poll.
+    assert "recordings" not in second.phases
+    assert first.requests > second.requests > 0
+    assert diagnostics["poll_metrics"][0]["polls"] == 2
+    assert {"gateways", "bulk"} <= set(diagnostics["endpoints"])
@@ -0,0 +1,150 @@
+"""Tests for the incremental heat pump COP figures."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.bosch_homecom.performance import (
+    SEASON_DAYS,
+    HeatPumpPerformance,
+    cop,
+    recorded_domains,
+)
+from custom_components.bosch_homecom.recordings import Recording
+
+ADD_STATISTICS = (
+    "custom_components.bosch_homecom.statistics.async_add_external_statistics"
+)
+
+
+def _recording(values: list[float | None], day_start) -> Recording:
+    return Recording.parse(
+        {"recording": [{"y": y or 0.0, "c": 0 if y is None else 1} for y in values]},
+        day_start,
+    )
+
+
+def _day(heat: list[float], compressor: list[float], day_start) -> dict:
+    return {
+        "heat_produced_total": _recording(heat, day_start),
+        "energy_compressor_total": _recording(compressor, day_start),
+    }
+
+
+def test_cop_needs_some_electricity():
+    """Tiny electricity use gives no COP rather than a huge one."""
+    assert cop(4.0, 1.0) == 4.0
+    assert cop(0.5, 0.0) is None
+
+
+def test_recorded_domains_need_heat_and_electricity():
+    """Only domains whose heat and some electricity are recorded get a COP."""
+    assert recorded_domains(
+        [
+            "heat_produced_total",
+            "energy_eheater_total",
+            "heat_produced_pool",
+            "energy_compressor_dhw",
+        ]
+    ) == ["total"]
+
+
+async def test_hours_counted_once(hass: HomeAssistant):
+    """Re-reading a day only counts the hours not seen yet."""
+    start = dt_util.start_of_local_day()
+    performance = HeatPumpPerformance(hass, "hp1", "Heat pump")
+
+    before = start + timedelta(hours=2)
+    added = await performance.async_add(
+        start.date(), _day([4.0, 6.0, 9.0], [1.0, 2.0, 3.0], start), before
+    )
+    assert added == 2
+    assert performance.cop("total", "hour") == 3.0
+    assert performance.cop("total", "today") == round(10.0 / 3.0, 2)
+
+    before += timedelta(hours=1)
+    days = _day([4.0, 6.0, 9.0], [1.0, 2.0, 3.0], start)
+    assert await performance.async_add(start.date(), days, before) == 1
+    assert await performance.async_add(start.date(), days, before) == 0
+    assert performance.cop("total", "today") == round(19.0 / 6.0, 2)
+    assert performance.cop("ch", "today") is None
+
+
+async def test_season_drops_old_days(hass: HomeAssistant, hass_storage: dict[str, Any]):
+    """The season sums the stored days and subtracts those that age out."""
+    today = dt_util.start_of_local_day()
+    old = today.date() - timedelta(days=SEASON_DAYS)
+    recent = today.date() - timedelta(days=10)
+    hass_storage["bosch_homecom.performance.hp1"] = {
+        "version": 1,
+        "key": "bosch_homecom.performance.hp1",
+        "data": {
+            "days": {
+                "total": {
+                    old.isoformat(): [100.0, 10.0],
+                    recent.isoformat(): [30.0, 10.0],
+                }
+            },
+            "counted": {},
+        },
+    }
+    performance = HeatPumpPerformance(hass, "hp1", "Heat pump")
+    await performance.async_load()
+    assert performance.cop("total", "season") == round(130.0 / 20.0, 2)
+
+    await performance.async_add(
+        today.date(), _day([5.0], [2.5], today), today + timedelta(hours=1)
+    )
+    assert performance.cop("total", "season") == round(35.0 / 12.5, 2)
+    assert performance.stats()["total"]["season_days"] == 2
+
+
+async def test_hourly_cop_imported_into_statistics(hass: HomeAssistant):
+    """Each counted hour's COP is a mean statistic."""
+    hass.config.components.add("recorder")
+    start = dt_util.start_of_local_day()
+    performance = HeatPumpPerformance(hass, "hp1", "Heat pump")
+
+    with patch(ADD_STATISTICS) as add:
+        await performance.async_add(
+            start.date(),
+            _day([4.0, 0.0], [1.0, 0.0], start),
+            start + timedelta(hours=2),
+        )
+
+    (call,) = add.mock_calls
+    assert call.args[1]["statistic_id"] == "bosch_homecom:hp1_cop_total"
+    assert [(row["start"], row["mean"]) for row in call.args[2]] == [
+        (dt_util.as_utc(start), 4.0)
+    ]
+
+
+async def test_hour_counts_a_missing_electricity_bucket_as_zero(
+    hass: HomeAssistant,
+):
+    """A past hour with any electricity in counts; the missing buckets are 0."""
+    start = dt_util.start_of_local_day()
+    performance = HeatPumpPerformance(hass, "hp1", "Heat pump")
+    before = start + timedelta(hours=3)
+    # The heater ran in the first hour only; the compressor's third hour is
+    # not in yet.
+    recordings = _day([4.0, 6.0, 5.0], [1.0, 2.0], start) | {
+        "energy_eheater_total": _recording([0.5], start)
+    }
+
+    assert await performance.async_add(start.date(), recordings, before) == 2
+    assert performance.cop("total", "hour") == 3.0
+    assert performance.cop("total", "today") == round(10.0 / 3.5, 2)
+
+    # A heater without any bucket all day holds no hour back either.
+    day = start - timedelta(days=1)
+    idle = _day([3.0], [1.0], day) | {"energy_eheater_total": _recording([None], day)}
+    assert await performance.async_add(day.date(), idle, start) == 1
+
+    assert await performance.async_add(start.date(), recordings, before, True) == 1
+    assert performance.cop("total", "today") == round(15.0 / 3.5, 2)
@@ -0,0 +1,157 @@
+"""Load and latency tests against the local pointt API simulator."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_TOKEN, CONF_USERNAME
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bosch_homecom.const import CONF_DEVICES, CONF_REFRESH, DOMAIN
+
+from .pointt_simulator import (
+    PointtSimulator,
+    SimulatedDevice,
+    SimulatorConfig,
+    device_fleet,
+    make_token,
+)
+
+API = "https://pointt-api.bosch-thermotechnology.com/pointt-api/api/v1"
+
+# The simulator is a real HTTP server on the loopback interface.
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+async def test_simulator_serves_leaves_and_inner_nodes():
+    """Leaves come back as stored; inner nodes as refEnum of their children."""
+    async with PointtSimulator([SimulatedDevice.of_type("1", "k40")]) as sim:
+        session = sim.client_session()
+        async with session.get(
+            f"{API}/gateways/1/resource/dhwCircuits/dhw1/actualTemp"
+        ) as response:
+            assert (await response.json())["value"] == 48.0
+        async with session.get(
+            f"{API}/gateways/1/resource/heatingCircuits"
+        ) as response:
+            listing = await response.json()
+        async with session.get(f"{API}/gateways/1/resource/nope") as missing:
+            assert missing.status == 404
+
+    assert listing["type"] == "refEnum"
+    assert [ref["id"] for ref in listing["references"]] == [
+        "/heatingCircuits/hc1",
+        "/heatingCircuits/hc2",
+    ]
+    assert sim.stats.by_status == {200: 2, 404: 1}
+
+
+async def test_simulator_bulk_and_writes():
+    """Bulk answers per resource; PUTs only land on writeable leaves."""
+    async with PointtSimulator([SimulatedDevice.of_type("1", "rrc2")]) as sim:
+        session = sim.client_session()
+        async with session.put(
+            f"{API}/gateways/1/resource/zones/zn1/manualTemperatureHeating",
+            json={"value": 19.5},
+        ) as response:
+            assert response.status == 204
+        async with session.post(
+            f"{API}/bulk",
+            json=[
+                {
+                    "gatewayId": "1",
+                    "resourcePaths": [
+                        "/zones/zn1/manualTemperatureHeating",
+                        "/zones/zn9/name",
+                    ],
+                }
+            ],
+        ) as response:
+            bulk = await response.json()
+
+    first, second = bulk[0]["resourcePaths"]
+    assert first["gatewayResponse"]["payload"]["value"] == 19.5
+    assert second["gatewayResponse"]["status"] == 404
+    assert sim.stats.bulk_resources == 2
+
+
+async def test_simulator_injects_errors_and_rate_limits():
+    """Error rates and the token bucket shape the responses."""
+    config = SimulatorConfig(error_500=1.0)
+    async with PointtSimulator(device_fleet(1), config) as sim:
+        async with sim.client_session().get(f"{API}/gateways/") as response:
+            assert response.status == 500
+
+    config = SimulatorConfig(rate_limit=1.0, burst=2)
+    async with PointtSimulator(device_fleet(1), config) as sim:
+        session = sim.client_session()
+        statuses = []
+        for _ in range(3):
+            async with session.get(f"{API}/gateways/") as response:
+                statuses.append(response.status)
+                retry_after = response.headers.get("Retry-After")
+
+    assert statuses == [200, 200, 429]
+    assert retry_after == "1"
+
+
+@pytest.mark.parametrize("count", [1, 10, 100])
+async def test_setup_and_poll_against_simulator(hass, record_property, count):
+    """Set up and poll ``count`` devices end to end over HTTP.
+
+    Records wall time and request counts per phase as test properties (see
+    ``--junitxml``); with ``latency`` set this shows how the per-device request
+    fan-out scales.
+    """
+    fleet = device_fleet(count)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="sim",
+        unique_id="sim",
+        data={
+            CONF_USERNAME: "sim",
+            CONF_TOKEN: make_token(),
+            CONF_REFRESH: "sim-refresh",
+            CONF_DEVICES: {
+                f"{device.device_id}_{device.device_type}": True for device in fleet
+            },
+        },
+    )
+    entry.add_to_hass(hass)
+
+    async with PointtSimulator(fleet, SimulatorConfig(latency=0.001)) as sim:
+        with (
+            patch(
+                "custom_components.bosch_homecom.async_create_clientsession",
+                side_effect=sim.create_clientsession,
+            ),
+            # Measures the fan-out itself, not the account's request budget.
+            patch("custom_components.bosch_homecom.scheduler.SCHEDULER_BURST", 10**6),
+        ):
+            started = time.perf_counter()
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            setup_seconds = time.perf_counter() - started
+            setup_requests = sim.stats.requests
+
+            sim.stats.reset()
+            started = time.perf_counter()
+            for coordinator in entry.runtime_data:
+                await coordinator.async_refresh()
+            poll_seconds = time.perf_counter() - started
+
+            assert entry.state is ConfigEntryState.LOADED
+            assert len(entry.runtime_data) == count
+            assert all(c.last_update_success for c in entry.runtime_data)
+            assert sim.stats.requests > 0
+
+            assert await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+
+    record_property("setup_seconds", round(setup_seconds, 3))
+    record_property("setup_requests", setup_requests)
+    record_property("poll_seconds", round(poll_seconds, 3))
+    record_property("poll_requests", sim.stats.requests)
@@ -0,0 +1,315 @@
+"""Tests for the poll scheduling policies."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+import random
+from unittest.mock import AsyncMock, Mock, patch
+
+from homeassistant.const import CONF_TOKEN, CONF_USERNAME
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homecom_alt import ApiError, NotRespondingError
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from tenacity import RetryError
+
+from custom_components.bosch_homecom.const import CONF_REFRESH, DOMAIN
+from custom_components.bosch_homecom.coordinator import (
+    BoschComModuleCoordinatorCommodule,
+    BoschComModuleCoordinatorK40,
+    BoschComModuleCoordinatorWddw2,
+)
+from custom_components.bosch_homecom.polling import (
+    AdaptivePollInterval,
+    BreakerState,
+    ChargingCadence,
+    CircuitBreaker,
+    stagger_offsets,
+)
+
+from .test_coordinator import _make_commodule_data, _make_k40_data, _make_wddw2_data
+
+BASE = timedelta(seconds=60)
+
+
+def _entry() -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "u", CONF_TOKEN: "t", CONF_REFRESH: "r"},
+    )
+
+
+def test_relaxes_while_stable_and_snaps_back_on_change():
+    """Unchanged polls stretch the interval up to the maximum; a change resets."""
+    adaptive = AdaptivePollInterval(BASE, maximum=timedelta(minutes=5), factor=2)
+
+    intervals = [adaptive.observe("idle") for _ in range(5)]
+    assert intervals == [
+        BASE,
+        timedelta(minutes=2),
+        timedelta(minutes=4),
+        timedelta(minutes=5),
+        timedelta(minutes=5),
+    ]
+    assert adaptive.observe("heating") == BASE
+    assert adaptive.stats()["changed_polls"] == 2
+    assert adaptive.stats()["stable_polls"] == 4
+
+
+def test_write_holds_the_configured_interval(freezer):
+    """After a write the interval stays at the configured one for a while."""
+    adaptive = AdaptivePollInterval(BASE, factor=2, hold=timedelta(minutes=5))
+    adaptive.observe("idle")
+    adaptive.observe("idle")
+
+    assert adaptive.note_write() == BASE
+    assert adaptive.observe("idle") == BASE
+    freezer.tick(timedelta(minutes=6))
+    assert adaptive.observe("idle") == 2 * BASE
+
+
+def test_maximum_never_below_the_configured_interval():
+    """A configured interval above the maximum stays fixed."""
+    adaptive = AdaptivePollInterval(timedelta(minutes=30))
+    adaptive.observe(1)
+    assert adaptive.observe(1) == timedelta(minutes=30)
+
+
+async def test_k40_follows_heat_demand(hass):
+    """Only the heat source's activity moves a K40's interval."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+    device = {"deviceId": "1", "deviceType": "k40"}
+    firmware = {"value": "1.0"}
+    bhc = Mock()
+    coordinator = BoschComModuleCoordinatorK40(
+        hass, bhc, device, firmware, entry, False
+    )
+    coordinator._fetch_extra_endpoints = AsyncMock()
+    coordinator._fetch_recordings = AsyncMock()
+    coordinator.adaptive = AdaptivePollInterval(BASE, factor=2)
+
+    async def poll(demand: float, outdoor: float) -> timedelta:
+        data = replace(
+            _make_k40_data(device, firmware),
+            heat_sources={"actualHeatDemand": {"value": demand}},
+            outdoor_temp={"value": outdoor},
+        )
+        bhc.async_update = AsyncMock(return_value=data)
+        await coordinator._async_update_data()
+        return coordinator.update_interval
+
+    assert await poll(0, 5.0) == BASE
+    assert await poll(0, 5.5) == 2 * BASE
+    assert await poll(40, 5.5) == BASE
+
+    with patch.object(DataUpdateCoordinator, "async_request_refresh") as refresh:
+        await poll(40, 5.5)
+        await coordinator.async_request_refresh()
+    refresh.assert_awaited_once()
+    assert coordinator.update_interval == BASE
+
+
+def test_commodule_activity_is_the_charge_point_state(hass):
+    """A wallbox is active when a charge point changes state or power."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+    device = {"deviceId": "2", "deviceType": "commodule"}
+    coordinator = BoschComModuleCoordinatorCommodule(
+        hass, Mock(), device, {"value": "1.0"}, entry, False
+    )
+    data = replace(
+        _make_commodule_data(device, {}),
+        charge_points=[
+            {
+                "id": "/chargepoints/cp1",
+                "telemetry": {"values": {"wbState": "CHARGING", "actualPower": 7400}},
+                "conf": {"ignored": True},
+            }
+        ],
+    )
+
+    assert coordinator._activity(data) == (("/chargepoints/cp1", "CHARGING", 7400),)
+
+
+def test_stagger_offsets_spread_the_interval():
+    """Offsets fill the interval in order, each within its own slot."""
+    offsets = stagger_offsets(4, timedelta(seconds=60), 0.2, random.Random(1))
+
+    assert offsets == sorted(offsets)
+    for index, offset in enumerate(offsets):
+        assert 15 * index <= offset.total_seconds() <= 15 * index + 3
+    assert stagger_offsets(0, timedelta(seconds=60)) == []
+
+
+async def test_stagger_shifts_only_the_next_poll(hass):
+    """The offset moves one scheduled poll; later ones keep the interval."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+    device = {"deviceId": "3", "deviceType": "commodule"}
+    coordinator = BoschComModuleCoordinatorCommodule(
+        hass, Mock(), device, {"value": "1.0"}, entry, False
+    )
+    coordinator.update_interval = BASE
+    scheduled: list[timedelta] = []
+
+    def schedule(self) -> None:
+        scheduled.append(self.update_interval)
+
+    with patch.object(DataUpdateCoordinator, "_schedule_refresh", schedule):
+        coordinator._unsub_refresh = Mock()
+        coordinator.stagger(timedelta(seconds=20))
+        coordinator._schedule_refresh()
+
+    assert scheduled == [BASE + timedelta(seconds=20), BASE]
+    assert coordinator.update_interval == BASE
+
+
+def test_breaker_opens_backs_off_and_closes(freezer):
+    """Opens at the threshold, doubles the wait on failed probes, then closes."""
+    breaker = CircuitBreaker(
+        threshold=2, backoff=timedelta(minutes=1), max_backoff=timedelta(minutes=3)
+    )
+    breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert not breaker.allow()
+
+    waits = []
+    for _ in range(3):
+        freezer.tick(breaker.backoff)
+        assert breaker.state is BreakerState.HALF_OPEN
+        breaker.record_failure()
+        waits.append(breaker.backoff)
+    assert waits == [timedelta(minutes=2), timedelta(minutes=3), timedelta(minutes=3)]
+
+    freezer.tick(breaker.backoff)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.stats()["trips"] == 1
+    assert breaker.backoff == timedelta(minutes=1)
+
+
+async def test_open_breaker_skips_the_request(hass, freezer):
+    """A device that keeps not responding is not asked until the probe."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+    device = {"deviceId": "4", "deviceType": "wddw2"}
+    firmware = {"value": "1.0"}
+    bhc = Mock()
+    coordinator = BoschComModuleCoordinatorWddw2(
+        hass, bhc, device, firmware, entry, False
+    )
+    coordinator._fetch_recordings = AsyncMock()
+    bhc.async_update = AsyncMock(side_effect=NotRespondingError("down"))
+    for _ in range(3):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+    assert coordinator.breaker.state is BreakerState.OPEN
+
+    with pytest.raises(UpdateFailed, match="not responding"):
+        await coordinator._async_update_data()
+    assert bhc.async_update.await_count == 3
+
+    freezer.tick(coordinator.breaker.backoff)
+    bhc.async_update = AsyncMock(return_value=_make_wddw2_data(device, firmware))
+    await coordinator._async_update_data()
+    assert coordinator.breaker.state is BreakerState.CLOSED
+
+
+@pytest.mark.parametrize(
+    ("error", "counts"),
+    [(RetryError("error"), True), (TimeoutError(), True), (ApiError("error"), False)],
+)
+async def test_breaker_counts_only_unresponsive_failures(hass, error, counts):
+    """API errors mean the device answered; they do not count."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+    device = {"deviceId": "5", "deviceType": "wddw2"}
+    bhc = Mock(async_update=AsyncMock(side_effect=error))
+    coordinator = BoschComModuleCoordinatorWddw2(
+        hass, bhc, device, {"value": "1.0"}, entry, False
+    )
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert coordinator.breaker.failures == int(counts)
+
+
+def test_charging_cadence_follows_sessions(freezer):
+    """A session polls telemetry fast; full reads keep the configured interval."""
+    cadence = ChargingCadence(BASE)
+    assert cadence.observe(False, BASE) == timedelta(minutes=5)
+    assert cadence.full_read_due()
+
+    assert cadence.observe(True, BASE) == timedelta(seconds=10)
+    cadence.note_read(full=True)
+    assert not cadence.full_read_due()
+    freezer.tick(BASE)
+    assert cadence.full_read_due()
+
+    assert cadence.observe(False, timedelta(seconds=10)) == timedelta(minutes=5)
+    assert cadence.observe(False, timedelta(minutes=20)) == timedelta(minutes=20)
+    assert cadence.stats()["sessions"] == 1
+
+
+def test_charging_cadence_restores_the_interval_after_a_session():
+    """The interval in use before a session comes back once it ends."""
+    cadence = ChargingCadence(BASE)
+    resting = timedelta(minutes=30)
+    assert cadence.observe(False, resting) == resting
+    assert cadence.observe(True, resting) == timedelta(seconds=10)
+    assert cadence.observe(True, timedelta(seconds=10)) == timedelta(seconds=10)
+    assert cadence.observe(False, timedelta(seconds=10)) == resting
+    assert cadence.observe(False, resting) == resting
+
+
+async def test_commodule_reads_only_telemetry_while_charging(hass, freezer):
+    """During a session polls read the telemetry in one bulk request."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+    device = {"deviceId": "6", "deviceType": "commodule"}
+    firmware = {"value": "1.0"}
+    data = replace(
+        _make_commodule_data(device, firmware),
+        charge_points=[
+            {
+                "id": "/chargepoints/cp0",
+                "telemetry": {
+                    "id": "/rest/v1/cp0/telemetry",
+                    "values": {"wbState": "CHARGING", "actualPower": 7400},
+                },
+                "conf": {"values": {"locked": False}},
+            }
+        ],
+    )
+    telemetry = {
+        "id": "/rest/v1/cp0/telemetry",
+        "values": {"wbState": "CHARGING", "actualPower": 11000},
+    }
+    bhc = Mock(
+        async_update=AsyncMock(return_value=data),
+        async_request_bulk=AsyncMock(
+            return_value={"/rest/v1/cp0/telemetry": telemetry}
+        ),
+    )
+    coordinator = BoschComModuleCoordinatorCommodule(
+        hass, bhc, device, firmware, entry, False
+    )
+
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=10)
+    coordinator.data = await coordinator._async_update_data()
+    bhc.async_request_bulk.assert_awaited_once_with("6", ["/rest/v1/cp0/telemetry"])
+    assert bhc.async_update.await_count == 1
+    (cp,) = coordinator.data.charge_points
+    assert cp["telemetry"]["values"]["actualPower"] == 11000
+    assert cp["conf"] == {"values": {"locked": False}}
+
+    freezer.tick(BASE)
+    data.charge_points[0]["telemetry"]["values"]["wbState"] = "AVAILABLE"
+    coordinator.data = await coordinator._async_update_data()
+    assert bhc.async_update.await_count == 2
+    assert coordinator.update_interval == timedelta(minutes=5)
@@ -0,0 +1,170 @@
+"""Tests for the recordings parser and its aggregations."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, Mock
+
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.bosch_homecom.recordings import (
+    HOUR,
+    QUARTER_HOUR,
+    RECORDINGS_TAIL_WINDOW,
+    Recording,
+    RecordingDays,
+    async_read_recordings,
+    local_day_length,
+)
+
+DAY = dt_util.parse_datetime("2026-03-01T00:00:00+00:00")
+
+
+def _payload(*slots) -> dict:
+    return {
+        "type": "yRecording",
+        "recording": [
+            {"y": y, "c": c} if c is not None else "garbage" for y, c in slots
+        ],
+    }
+
+
+def test_parse_drops_placeholders_and_garbage():
+    """Slots with c <= 0 or a non-numeric y are not buckets."""
+    recording = Recording.parse(
+        _payload((2700.0, 100), (1.0, 0), (None, None), ("x", 1), (4500.0, 150)),
+        DAY,
+    )
+
+    assert len(recording) == 2
+    assert list(recording.slots) == [0, 4]
+    assert recording.buckets("avg") == [
+        (DAY, 27.0),
+        (DAY + timedelta(hours=4), 30.0),
+    ]
+    assert len(Recording.parse(None, DAY)) == 0
+
+
+@pytest.mark.parametrize(
+    ("agg", "expected"),
+    [("sum", 7200.0), ("avg", 28.8), ("min", 27.0), ("max", 30.0), ("last", 30.0)],
+)
+def test_aggregations(agg: str, expected: float):
+    """``avg`` is weighted by the sample counts; the others by bucket."""
+    recording = Recording.parse(_payload((2700.0, 100), (4500.0, 150)), DAY)
+
+    assert recording.aggregate(agg) == pytest.approx(expected)
+
+
+def test_empty_recording_aggregations():
+    """Without buckets the sum is 0 and everything else unknown."""
+    recording = Recording.parse(_payload((1.0, 0)), DAY)
+
+    assert recording.aggregate("sum") == 0
+    assert recording.aggregate("avg") is None
+    assert recording.aggregate("last") is None
+
+
+def test_quarter_hour_recording_merged_per_hour():
+    """A 96-slot day is in quarter hours; hourly() merges them."""
+    slots = [(0.25, 1)] * 6 + [(0.0, 0)] * 90
+    recording = Recording.parse(_payload(*slots), DAY)
+
+    assert recording.step == QUARTER_HOUR
+    hourly = recording.hourly()
+    assert hourly.buckets() == [(DAY, 1.0), (DAY + timedelta(hours=1), 0.5)]
+    assert hourly.buckets(before=DAY + timedelta(hours=1)) == [(DAY, 1.0)]
+
+
+async def test_step_follows_the_sample_rate_and_the_local_day(hass):
+    """The sample rate decides; else the slots are set against the day's hours."""
+    await hass.config.async_set_time_zone("Europe/Berlin")
+    fall_back = dt_util.start_of_local_day(date(2026, 10, 25))
+    spring_forward = dt_util.start_of_local_day(date(2026, 3, 29))
+    assert local_day_length(fall_back) == timedelta(hours=25)
+    assert local_day_length(spring_forward) == timedelta(hours=23)
+
+    assert Recording.parse(_payload(*[(1.0, 1)] * 25), fall_back).step == HOUR
+    assert (
+        Recording.parse(_payload(*[(1.0, 1)] * 24), spring_forward).step == QUARTER_HOUR
+    )
+    quarters = {**_payload(*[(1.0, 1)] * 24), "sampleRate": "PT15M"}
+    assert Recording.parse(quarters, fall_back).step == QUARTER_HOUR
+
+
+def _day(*last) -> dict:
+    """Return a full hourly day of DAY whose final slots are ``last``."""
+    hours = local_day_length(DAY) // HOUR
+    return _payload(*[(1.0, 1)] * (hours - len(last)), *last)
+
+
+def test_complete_when_final_slot_populated():
+    """A day is whole once the slot of its last local hour holds a bucket."""
+    assert not Recording.parse(_day((1.0, 0)), DAY).complete
+    assert Recording.parse(_day((1.0, 1)), DAY).complete
+
+
+def test_truncated_day_is_not_complete():
+    """A day cut short by Bosch is not whole, however full its last slot."""
+    assert not Recording.parse(_payload((1.0, 1), (1.0, 1)), DAY, HOUR).complete
+    hours = local_day_length(DAY) // HOUR
+    quarters = _payload(*[(1.0, 1)] * (hours * 4 - 1))
+    assert not Recording.parse(quarters, DAY, QUARTER_HOUR).complete
+
+
+def test_recording_days_read_tail_until_complete():
+    """After midnight yesterday's open paths ride along, then are sealed."""
+    days = RecordingDays()
+    evening = dt_util.start_of_local_day() - timedelta(hours=1)
+    yesterday = dt_util.as_local(evening).date()
+    assert days.requests(evening, ["/a", "/b"]) == {
+        (yesterday, "/a"): f"/a?interval={yesterday}",
+        (yesterday, "/b"): f"/b?interval={yesterday}",
+    }
+
+    night = evening + timedelta(hours=2)
+    today = dt_util.as_local(night).date()
+    requests = days.requests(night, ["/a", "/b"])
+    assert list(requests) == [
+        (yesterday, "/a"),
+        (today, "/a"),
+        (yesterday, "/b"),
+        (today, "/b"),
+    ]
+    days.note("/a", Recording.parse(_day((1.0, 1)), DAY))
+    days.note("/b", Recording.parse(_day((0.0, 0)), DAY))
+    days.seal_if_complete(["/a", "/b"])
+    assert days.tail == yesterday
+    assert list(days.requests(night, ["/a", "/b"])) == [
+        (today, "/a"),
+        (yesterday, "/b"),
+        (today, "/b"),
+    ]
+
+    days.note_not_recorded("/b")
+    days.seal_if_complete(["/a", "/b"])
+    assert days.tail is None
+    assert days.sealed == yesterday
+
+
+def test_recording_days_seal_after_window():
+    """A tail that never completes is sealed after the window."""
+    days = RecordingDays()
+    midnight = dt_util.start_of_local_day()
+    days.requests(midnight - timedelta(hours=1), ["/a"])
+    days.requests(midnight + timedelta(minutes=5), ["/a"])
+    assert days.tail is not None
+
+    days.requests(midnight + RECORDINGS_TAIL_WINDOW, ["/a"])
+    assert days.tail is None
+
+
+async def test_read_recordings_in_chunks():
+    """More paths than one bulk request takes are split up."""
+    bhc = Mock(async_request_bulk=AsyncMock(side_effect=[{"/p0": 1}, None]))
+    paths = [f"/p{index}" for index in range(45)]
+
+    assert await async_read_recordings(bhc, "dev", paths) == {"/p0": 1}
+    calls = bhc.async_request_bulk.await_args_list
+    assert [len(call.args[1]) for call in calls] == [30, 15]
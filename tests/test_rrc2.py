@@ -0,0 +1,265 @@
+"""Tests for the RRC2 bulk reader."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+from homeassistant.const import CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homecom_alt import BHCDeviceRrc2
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bosch_homecom.const import (
+    CONF_REFRESH,
+    DOMAIN,
+    RRC2_STRUCTURE_INTERVAL,
+)
+from custom_components.bosch_homecom.coordinator import BoschComModuleCoordinatorRrc2
+from custom_components.bosch_homecom.rrc2 import (
+    Rrc2BulkReader,
+    is_structure,
+    resource_paths,
+)
+
+DEVICE = {"deviceId": "rrc2-1", "deviceType": "rrc2"}
+ZONE_FIELDS = (
+    "currentRoomSetpoint",
+    "manualRoomSetpoint",
+    "temperatureActual",
+    "userMode",
+    "heatingType",
+)
+
+
+def _leaf(path: str, value: Any) -> dict[str, Any]:
+    return {"id": path, "type": "floatValue", "value": value}
+
+
+def _make_rrc2_data(zones: int) -> BHCDeviceRrc2:
+    """Build rrc2 data with ``zones`` zones of five state resources each."""
+    return BHCDeviceRrc2(
+        device=DEVICE,
+        firmware=[],
+        notifications=[],
+        zones=[
+            {
+                "id": f"/zones/zn{index}",
+                "name": _leaf(f"/zones/zn{index}/name", f"Zone {index}"),
+                **{
+                    field: _leaf(f"/zones/zn{index}/{field}", 20.0)
+                    for field in ZONE_FIELDS
+                },
+            }
+            for index in range(1, zones + 1)
+        ],
+        heating_circuits=[{"id": "/heatingCircuits/hc1"}],
+        dhw_circuits=[
+            {
+                "id": "/dhwCircuits/dhw1",
+                "operationMode": _leaf("/dhwCircuits/dhw1/operationMode", "on"),
+            }
+        ],
+        heat_sources={},
+        away_mode=_leaf("/system/awayMode/enabled", "false"),
+        outdoor_temp=_leaf("/system/sensors/temperatures/outdoor_t1", 8.5),
+        indoor_humidity=None,
+        devices=[],
+        gateway_info={"uuid": _leaf("/gateway/uuid", DEVICE["deviceId"])},
+        system_location=None,
+    )
+
+
+def _bulk(
+    bhc: Mock,
+    values: dict[str, Any],
+    absent: set[str] = frozenset(),
+    status: int = 404,
+) -> Mock:
+    """Answer bulk requests like homecom_alt.
+
+    Paths in ``absent`` are left out of the answer and their ``status`` noted.
+    """
+    bhc._last_endpoint_status = statuses = {}
+
+    async def request_bulk(device_id: str, paths: list[str]) -> dict[str, Any]:
+        for path in absent.intersection(paths):
+            statuses[device_id, path] = status
+        return {
+            path: _leaf(path, values.get(path, 21.5))
+            for path in paths
+            if path not in absent
+        }
+
+    bhc.async_request_bulk = AsyncMock(side_effect=request_bulk)
+    return bhc
+
+
+async def test_chunks_paths_and_updates_values(hass: HomeAssistant):
+    """Nine zones are read in two concurrent requests of at most 30 paths."""
+    data = _make_rrc2_data(zones=9)
+    bhc = _bulk(Mock(), {"/system/awayMode/enabled": "true"})
+    reader = Rrc2BulkReader(hass, bhc, DEVICE["deviceId"])
+
+    fresh = await reader.async_read(data)
+
+    sizes = [len(call.args[1]) for call in bhc.async_request_bulk.await_args_list]
+    assert sizes == [30, 18]
+    assert reader.requests == 2
+    assert fresh.away_mode["value"] == "true"
+    assert fresh.zones[0]["temperatureActual"]["value"] == 21.5
+    assert fresh.heating_circuits == [{"id": "/heatingCircuits/hc1"}]
+    assert fresh.device is DEVICE
+
+
+async def test_not_found_paths_are_skipped_and_persisted(hass: HomeAssistant):
+    """A resource left out of a bulk answer is not asked for again."""
+    data = _make_rrc2_data(zones=1)
+    missing = "/zones/zn1/heatingType"
+    bhc = _bulk(Mock(), {}, absent={missing})
+    reader = Rrc2BulkReader(hass, bhc, DEVICE["deviceId"])
+
+    fresh = await reader.async_read(data)
+    assert fresh.zones[0]["heatingType"] is None
+    await reader.async_read(data)
+
+    second = bhc.async_request_bulk.await_args_list[1].args[1]
+    assert missing not in second
+    assert reader.skip.skips(missing)
+    assert len(reader.skip) == 1
+
+
+async def test_empty_answer_marks_nothing_missing(hass: HomeAssistant):
+    """A failed bulk request keeps the previous values instead of skipping."""
+    data = _make_rrc2_data(zones=1)
+    bhc = Mock(async_request_bulk=AsyncMock(return_value={}))
+    bhc._last_endpoint_status = {}
+    reader = Rrc2BulkReader(hass, bhc, DEVICE["deviceId"])
+
+    fresh = await reader.async_read(data)
+
+    assert fresh.zones == data.zones
+    assert len(reader.skip) == 0
+
+
+async def test_only_not_found_marks_a_path_missing(hass: HomeAssistant):
+    """A resource left out with another status keeps its previous value."""
+    data = _make_rrc2_data(zones=1)
+    failed = "/zones/zn1/heatingType"
+    bhc = _bulk(Mock(), {}, absent={failed}, status=500)
+    reader = Rrc2BulkReader(hass, bhc, DEVICE["deviceId"])
+
+    fresh = await reader.async_read(data)
+
+    assert fresh.zones[0]["heatingType"] == data.zones[0]["heatingType"]
+    assert not reader.skip.skips(failed)
+
+
+async def test_skip_cache_survives_restarts(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+):
+    """Paths stored by a previous run are skipped until they expire."""
+    now = dt_util.utcnow()
+    hass_storage[f"{DOMAIN}.rrc2_skip.{DEVICE['deviceId']}"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.rrc2_skip.{DEVICE['deviceId']}",
+        "data": {
+            "paths": {
+                "/dhwCircuits/dhw1/operationMode": now.isoformat(),
+                "/zones/zn1/userMode": (now - timedelta(days=2)).isoformat(),
+            }
+        },
+    }
+    bhc = _bulk(Mock(), {})
+    reader = Rrc2BulkReader(hass, bhc, DEVICE["deviceId"])
+
+    await reader.async_read(_make_rrc2_data(zones=1))
+
+    paths = bhc.async_request_bulk.await_args.args[1]
+    assert "/dhwCircuits/dhw1/operationMode" not in paths
+    assert "/zones/zn1/userMode" in paths
+
+
+async def test_coordinator_reads_structure_hourly(hass: HomeAssistant, freezer):
+    """The full update runs first and hourly; bulk reads fill the polls between."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "u", CONF_TOKEN: "t", CONF_REFRESH: "r"},
+    )
+    entry.add_to_hass(hass)
+    data = _make_rrc2_data(zones=2)
+    bhc = _bulk(Mock(async_update=AsyncMock(return_value=data)), {})
+    coordinator = BoschComModuleCoordinatorRrc2(
+        hass, bhc, DEVICE, {"value": "1.0"}, entry, False
+    )
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert bhc.async_update.await_count == 1
+    assert bhc.async_request_bulk.await_count == 1
+    assert coordinator.data.zones[1]["userMode"]["value"] == 21.5
+    assert len(resource_paths(coordinator.data.zones)) == 12
+
+    freezer.tick(RRC2_STRUCTURE_INTERVAL)
+    await coordinator.async_refresh()
+    assert bhc.async_update.await_count == 2
+    assert bhc.async_request_bulk.await_count == 1
+
+
+def test_structure_resources():
+    """Names, lists and gateway identity are structure; readings are state."""
+    assert is_structure("zones", "/zones/zn1/name")
+    assert is_structure("devices", "/devices/list")
+    assert is_structure("gateway_info", "/gateway/versionHardware")
+    assert is_structure("dhw_circuits", "/dhwCircuits/dhw1/programs/pg1/week")
+    assert not is_structure("zones", "/zones/zn1/temperatureActual")
+    assert not is_structure("away_mode", "/system/awayMode/enabled")
+
+
+async def test_structure_read_only_when_asked(hass: HomeAssistant):
+    """Fast polls leave the structure out; a structure poll includes it."""
+    data = _make_rrc2_data(zones=2)
+    bhc = _bulk(Mock(), {"/zones/zn1/name": "Kitchen"})
+    reader = Rrc2BulkReader(hass, bhc, DEVICE["deviceId"])
+
+    fresh = await reader.async_read(data)
+    paths = bhc.async_request_bulk.await_args.args[1]
+    assert "/zones/zn1/name" not in paths
+    assert "/gateway/uuid" not in paths
+    assert fresh.zones[0]["name"]["value"] == "Zone 1"
+
+    fresh = await reader.async_read(data, structure=True)
+    assert fresh.zones[0]["name"]["value"] == "Kitchen"
+    assert reader.stats()["structure_paths"] == 3
+
+
+async def test_coordinator_rereads_structure_on_change(hass: HomeAssistant):
+    """A write brings the structure along; a removed zone forces a full read."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "u", CONF_TOKEN: "t", CONF_REFRESH: "r"},
+    )
+    entry.add_to_hass(hass)
+    bhc = _bulk(Mock(async_update=AsyncMock(return_value=_make_rrc2_data(zones=2))), {})
+    coordinator = BoschComModuleCoordinatorRrc2(
+        hass, bhc, DEVICE, {"value": "1.0"}, entry, False
+    )
+    await coordinator.async_refresh()
+
+    await coordinator.async_request_refresh()
+    await hass.async_block_till_done()
+    assert "/zones/zn2/name" in bhc.async_request_bulk.await_args.args[1]
+
+    removed = {f"/zones/zn2/{field}" for field in ZONE_FIELDS}
+    _bulk(bhc, {}, absent=removed)
+    await coordinator.async_refresh()
+    assert coordinator.bulk.structure_changed
+    assert bhc.async_update.await_count == 1
+
+    bhc.async_update.return_value = _make_rrc2_data(zones=1)
+    await coordinator.async_refresh()
+    assert bhc.async_update.await_count == 2
+    assert not coordinator.bulk.structure_changed
+    assert len(coordinator.data.zones) == 1
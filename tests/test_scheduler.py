@@ -0,0 +1,169 @@
+"""Tests for the account-wide request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from email.utils import format_datetime
+
+from aiohttp import ClientTimeout
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.bosch_homecom.const import (
+    SCHEDULER_DEFAULT_RETRY_AFTER,
+    SCHEDULER_MAX_RETRY_AFTER,
+)
+from custom_components.bosch_homecom.scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    ScheduledSession,
+    async_get_request_scheduler,
+    parse_retry_after,
+    request_priority,
+    scheduler_trace_config,
+)
+
+from .pointt_simulator import PointtSimulator, SimulatedDevice, SimulatorConfig
+
+API = "https://pointt-api.bosch-thermotechnology.com/pointt-api/api/v1"
+
+
+def test_parse_retry_after():
+    """Seconds and HTTP dates are honoured within bounds; junk gets the default."""
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after("-5") == 0
+    assert parse_retry_after("100000") == SCHEDULER_MAX_RETRY_AFTER
+    assert parse_retry_after(None) == SCHEDULER_DEFAULT_RETRY_AFTER
+    assert parse_retry_after("soon") == SCHEDULER_DEFAULT_RETRY_AFTER
+    when = format_datetime(dt_util.utcnow() + timedelta(seconds=60), usegmt=True)
+    assert 55 < parse_retry_after(when) <= 60
+
+
+async def test_empty_bucket_serves_by_priority():
+    """Once the burst is spent, queued requests are released by priority."""
+    scheduler = RequestScheduler(rate=50, burst=1)
+    await scheduler.acquire(RequestPriority.POLL)
+    served: list[RequestPriority] = []
+
+    async def request(priority: RequestPriority) -> None:
+        await scheduler.acquire(priority)
+        served.append(priority)
+
+    order = [
+        RequestPriority.DIAGNOSTIC,
+        RequestPriority.BACKGROUND,
+        RequestPriority.POLL,
+        RequestPriority.WRITE,
+    ]
+    await asyncio.gather(*(request(priority) for priority in order))
+
+    assert served == sorted(order)
+    stats = scheduler.stats()
+    assert stats["queued"] == 0
+    assert set(stats["waited"]) == {"write", "poll", "background", "diagnostic"}
+
+
+async def test_cancelled_request_leaves_the_queue():
+    """A request cancelled while queued does not take a token."""
+    scheduler = RequestScheduler(rate=20, burst=1)
+    await scheduler.acquire(RequestPriority.POLL)
+    waiting = asyncio.ensure_future(scheduler.acquire(RequestPriority.WRITE))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    await scheduler.acquire(RequestPriority.DIAGNOSTIC)
+
+    assert scheduler.stats()["queued"] == 0
+
+
+async def test_pause_holds_requests_back():
+    """A 429 pauses everything for the asked seconds and empties the bucket."""
+    scheduler = RequestScheduler(rate=1000, burst=10)
+    scheduler.pause(0.1)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await scheduler.acquire(RequestPriority.WRITE)
+
+    assert loop.time() - started >= 0.09
+    assert scheduler.stats()["throttled"] == 1
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_scheduled_session_keeps_within_the_cloud_limit():
+    """Through a scheduled session a burst of polls draws no 429s."""
+    device = SimulatedDevice.of_type("1", "k40")
+    config = SimulatorConfig(rate_limit=50, burst=5)
+    scheduler = RequestScheduler(rate=40, burst=5)
+    async with PointtSimulator([device], config) as sim:
+        session = ScheduledSession(sim.client_session(), scheduler)
+
+        async def get() -> int:
+            async with session.get(f"{API}/gateways/") as response:
+                return response.status
+
+        statuses = await asyncio.gather(*(get() for _ in range(20)))
+        with request_priority(RequestPriority.DIAGNOSTIC):
+            assert await get() == 200
+
+    assert set(statuses) == {200}
+    assert scheduler.stats()["waited"]["poll"] > 0
+    assert scheduler.stats()["waited"]["diagnostic"] == 1
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_awaited_requests_take_a_token_by_method():
+    """homecom_alt awaits request(); writes are served as writes."""
+    device = SimulatedDevice.of_type("1", "k40")
+    scheduler = RequestScheduler(rate=20, burst=1)
+    async with PointtSimulator([device]) as sim:
+        session = ScheduledSession(sim.client_session(), scheduler)
+        for method in ("GET", "PUT"):
+            response = await session.request(method, f"{API}/gateways/")
+            response.release()
+
+    assert scheduler.stats()["waited"] == {"write": 1}
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_queued_time_does_not_run_down_the_timeout():
+    """A request's timeout starts once it has its token."""
+    device = SimulatedDevice.of_type("1", "k40")
+    scheduler = RequestScheduler(rate=5, burst=1)
+    async with PointtSimulator([device]) as sim:
+        session = ScheduledSession(sim.client_session(), scheduler)
+        for _ in range(2):
+            # The second request queues for about 0.2 s.
+            async with session.get(
+                f"{API}/gateways/", timeout=ClientTimeout(total=0.1)
+            ) as response:
+                assert response.status == 200
+
+    assert scheduler.stats()["wait_seconds"]["poll"] > 0.1
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_trace_config_pauses_on_429():
+    """A 429 from the cloud pauses the account's budget."""
+    device = SimulatedDevice.of_type("1", "k40")
+    config = SimulatorConfig(rate_limit=0.5, burst=1)
+    scheduler = RequestScheduler(rate=1000, burst=10)
+    async with PointtSimulator([device], config) as sim:
+        session = ScheduledSession(
+            sim.client_session([scheduler_trace_config(scheduler)]), scheduler
+        )
+        for _ in range(2):
+            async with session.get(f"{API}/gateways/") as response:
+                await response.read()
+
+    assert response.status == 429
+    stats = scheduler.stats()
+    assert stats["throttled"] == 1
+    assert stats["paused_for"] > 0
+    assert stats["tokens"] == 0
+
+
+@pytest.mark.parametrize("accounts", [("a", "a"), ("a", "b")])
+async def test_one_scheduler_per_account(hass, accounts):
+    """Entries of the same account share a scheduler."""
+    first, second = (async_get_request_scheduler(hass, a) for a in accounts)
+    assert (first is second) is (accounts[0] == accounts[1])
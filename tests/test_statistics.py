@@ -0,0 +1,119 @@
+"""Tests for the incremental external-statistics importer."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.bosch_homecom.statistics import (
+    StatisticSeries,
+    StatisticsImporter,
+    external_statistic_id,
+)
+
+ENERGY = StatisticSeries(
+    external_statistic_id("86DM-1", "energy_cool"),
+    "Living energy (cool)",
+    "kWh",
+    "energy",
+)
+TEMPERATURE = StatisticSeries(
+    external_statistic_id("86DM-1", "room_temperature"),
+    "Living room temperature",
+    "°C",
+    "temperature",
+    kind="mean",
+)
+
+
+def test_external_statistic_id_is_slugified():
+    """Serials become lower-case slugs under the integration's source."""
+    assert ENERGY.statistic_id == "bosch_homecom:86dm_1_energy_cool"
+
+
+async def test_importer_accumulates_sums_across_runs(hass: HomeAssistant):
+    """Sums continue from the cursor and already imported hours are skipped."""
+    hass.config.components.add("recorder")
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    importer = StatisticsImporter(hass, "test")
+
+    with patch(
+        "custom_components.bosch_homecom.statistics.async_add_external_statistics"
+    ) as add:
+        first = await importer.async_add(
+            ENERGY,
+            [
+                (hour - timedelta(hours=2), 1.0),
+                (hour - timedelta(hours=1, minutes=-30), 0.25),
+                (hour - timedelta(hours=1), 0.5),
+            ],
+        )
+        second = await importer.async_add(
+            ENERGY, [(hour - timedelta(hours=1), 0.5), (hour, 2.0)]
+        )
+
+    assert (first, second) == (2, 1)
+    metadata, rows = add.call_args_list[0].args[1:]
+    assert metadata["has_sum"] is True
+    assert metadata["unit_of_measurement"] == "kWh"
+    assert [(row["state"], row["sum"]) for row in rows] == [(1.0, 1.0), (0.75, 1.75)]
+    rows = add.call_args_list[1].args[2]
+    assert [(row["start"], row["sum"]) for row in rows] == [(hour, 3.75)]
+    assert importer.last_start(ENERGY.statistic_id) == hour
+
+
+async def test_importer_mean_series(hass: HomeAssistant):
+    """Sampled values are imported as mean/min/max without a sum."""
+    hass.config.components.add("recorder")
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    importer = StatisticsImporter(hass, "test")
+
+    with patch(
+        "custom_components.bosch_homecom.statistics.async_add_external_statistics"
+    ) as add:
+        assert await importer.async_add(TEMPERATURE, [(hour, 22.5)]) == 1
+
+    metadata, rows = add.call_args.args[1:]
+    assert metadata["has_sum"] is False
+    assert rows[0]["mean"] == rows[0]["min"] == rows[0]["max"] == 22.5
+
+
+async def test_importer_moves_the_cursor_of_an_empty_series(hass: HomeAssistant):
+    """A read that had nothing to import still moves the cursor up to it."""
+    hass.config.components.add("recorder")
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    importer = StatisticsImporter(hass, "test")
+
+    with patch(
+        "custom_components.bosch_homecom.statistics.async_add_external_statistics"
+    ) as add:
+        assert await importer.async_add(ENERGY, [], covered=hour) == 0
+        assert importer.last_start(ENERGY.statistic_id) == hour
+        # An older read neither imports nor moves the cursor back.
+        assert (
+            await importer.async_add(
+                ENERGY,
+                [(hour - timedelta(hours=1), 1.0)],
+                covered=hour - timedelta(hours=1),
+            )
+            == 0
+        )
+
+    add.assert_not_called()
+    assert importer.last_start(ENERGY.statistic_id) == hour
+
+
+async def test_importer_without_recorder_is_a_noop(hass: HomeAssistant):
+    """Nothing is imported, and no cursor moves, without the recorder."""
+    importer = StatisticsImporter(hass, "test")
+
+    with patch(
+        "custom_components.bosch_homecom.statistics.async_add_external_statistics"
+    ) as add:
+        assert await importer.async_add(ENERGY, [(dt_util.utcnow(), 1.0)]) == 0
+
+    add.assert_not_called()
+    assert importer.last_start(ENERGY.statistic_id) is None
@@ -0,0 +1,237 @@
+"""Tests for entities following the zones, circuits and sub-devices."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from homeassistant.const import CONF_TOKEN, CONF_USERNAME, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bosch_homecom.climate import _build_k40_climates
+from custom_components.bosch_homecom.const import (
+    CONF_REFRESH,
+    DOMAIN,
+    RRC2_STRUCTURE_INTERVAL,
+    STRUCTURE_REMOVE_AFTER,
+)
+from custom_components.bosch_homecom.coordinator import BoschComModuleCoordinatorRrc2
+from custom_components.bosch_homecom.select import _build_k40_circuit_selects
+from custom_components.bosch_homecom.sensor import (
+    _build_k40_circuit_sensors,
+    _build_wddw2_dhw_sensors,
+)
+from custom_components.bosch_homecom.structure import (
+    async_track_structure,
+    device_structure,
+)
+from custom_components.bosch_homecom.switch import _build_wddw2_dhw_switches
+from custom_components.bosch_homecom.water_heater import _build_wddw2_water_heaters
+
+from .test_rrc2 import DEVICE, _bulk, _make_rrc2_data
+from .test_wddw2 import _DHW_READ_ONLY, _coordinator as _wddw2_coordinator
+
+
+def _zone_entities(coordinator) -> list[Entity]:
+    entities = []
+    for ref in coordinator.data.zones or []:
+        entity = Entity()
+        entity._attr_unique_id = f"{DEVICE['deviceId']}-{ref['id'].split('/')[-1]}"
+        entities.append(entity)
+    return entities
+
+
+def test_device_structure_lists_circuit_ids():
+    """Zones, circuits and sub-devices make up the structure."""
+    assert device_structure(_make_rrc2_data(zones=2)) == {
+        "/zones/zn1",
+        "/zones/zn2",
+        "/heatingCircuits/hc1",
+        "/dhwCircuits/dhw1",
+    }
+
+
+async def test_entities_follow_added_and_removed_zones(hass: HomeAssistant, freezer):
+    """A new zone adds its entities, a removed one retires them; no reload."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "u", CONF_TOKEN: "t", CONF_REFRESH: "r"},
+    )
+    entry.add_to_hass(hass)
+    bhc = _bulk(Mock(async_update=AsyncMock(return_value=_make_rrc2_data(zones=2))), {})
+    coordinator = BoschComModuleCoordinatorRrc2(
+        hass, bhc, DEVICE, {"value": "1.0"}, entry, False
+    )
+    await coordinator.async_refresh()
+    registry = er.async_get(hass)
+    initial = _zone_entities(coordinator)
+    for entity in initial:
+        registry.async_get_or_create(
+            Platform.CLIMATE, DOMAIN, entity.unique_id, config_entry=entry
+        )
+    add_entities = Mock()
+    async_track_structure(
+        entry,
+        coordinator,
+        Platform.CLIMATE,
+        _zone_entities,
+        initial,
+        add_entities,
+    )
+
+    # Polls that keep the structure leave the entities alone.
+    await coordinator.async_refresh()
+    add_entities.assert_not_called()
+
+    bhc.async_update.return_value = _make_rrc2_data(zones=3)
+    freezer.tick(RRC2_STRUCTURE_INTERVAL)
+    await coordinator.async_refresh()
+    assert coordinator.structure_changes == 1
+    (added,), _ = add_entities.call_args
+    assert [entity.unique_id for entity in added] == [f"{DEVICE['deviceId']}-zn3"]
+
+    bhc.async_update.return_value = _make_rrc2_data(zones=1)
+    freezer.tick(RRC2_STRUCTURE_INTERVAL)
+    await coordinator.async_refresh()
+    assert registry.async_get_entity_id(
+        Platform.CLIMATE, DOMAIN, f"{DEVICE['deviceId']}-zn2"
+    )
+    for _ in range(STRUCTURE_REMOVE_AFTER - 1):
+        await coordinator.async_refresh()
+    assert add_entities.call_count == 1
+    assert (
+        registry.async_get_entity_id(
+            Platform.CLIMATE, DOMAIN, f"{DEVICE['deviceId']}-zn2"
+        )
+        is None
+    )
+    assert registry.async_get_entity_id(
+        Platform.CLIMATE, DOMAIN, f"{DEVICE['deviceId']}-zn1"
+    )
+    await coordinator.async_shutdown()
+
+
+async def test_empty_and_failed_reads_keep_the_entities(hass: HomeAssistant, freezer):
+    """Only a zone missing from several good reads in a row is removed."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "u", CONF_TOKEN: "t", CONF_REFRESH: "r"},
+    )
+    entry.add_to_hass(hass)
+    bhc = _bulk(Mock(async_update=AsyncMock(return_value=_make_rrc2_data(zones=2))), {})
+    coordinator = BoschComModuleCoordinatorRrc2(
+        hass, bhc, DEVICE, {"value": "1.0"}, entry, False
+    )
+    await coordinator.async_refresh()
+    registry = er.async_get(hass)
+    initial = _zone_entities(coordinator)
+    for entity in initial:
+        registry.async_get_or_create(
+            Platform.CLIMATE, DOMAIN, entity.unique_id, config_entry=entry
+        )
+    add_entities = Mock()
+    async_track_structure(
+        entry, coordinator, Platform.CLIMATE, _zone_entities, initial, add_entities
+    )
+
+    async def full_read(data) -> None:
+        bhc.async_update.return_value = data
+        freezer.tick(RRC2_STRUCTURE_INTERVAL)
+        await coordinator.async_refresh()
+
+    # An answer without any zone or circuit, a failed poll and a zone missing
+    # once all leave the entities in place.
+    await full_read(
+        replace(
+            _make_rrc2_data(zones=0), heating_circuits=[], dhw_circuits=[], devices=[]
+        )
+    )
+    await full_read(_make_rrc2_data(zones=2))
+    bhc.async_update.side_effect = TimeoutError
+    freezer.tick(RRC2_STRUCTURE_INTERVAL)
+    await coordinator.async_refresh()
+    bhc.async_update.side_effect = None
+    await full_read(_make_rrc2_data(zones=1))
+    await full_read(_make_rrc2_data(zones=2))
+    for _ in range(STRUCTURE_REMOVE_AFTER):
+        await coordinator.async_refresh()
+
+    add_entities.assert_not_called()
+    for entity in initial:
+        assert registry.async_get_entity_id(Platform.CLIMATE, DOMAIN, entity.unique_id)
+    await coordinator.async_shutdown()
+
+
+def _k40_coordinator(device_type: str, circuits: int) -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.unique_id = "101"
+    coordinator.data = SimpleNamespace(
+        device={"deviceId": "101", "deviceType": device_type},
+        heating_circuits=[
+            {
+                "id": f"/heatingCircuits/hc{n}",
+                "operationMode": {"value": "auto", "allowedValues": ["auto", "manual"]},
+            }
+            for n in range(1, circuits + 1)
+        ],
+        dhw_circuits=[
+            {
+                "id": f"/dhwCircuits/dhw{n}",
+                "operationMode": {"value": "eco", "allowedValues": ["eco", "off"]},
+            }
+            for n in range(1, circuits + 1)
+        ],
+        zones=[{"id": f"/zones/zn{n}"} for n in range(1, circuits + 1)],
+        devices=[
+            {"id": f"/devices/device{n}", "roomtemperature": {"value": 21}}
+            for n in range(1, circuits + 1)
+        ],
+    )
+    return coordinator
+
+
+def _unique_ids(entities) -> set[str]:
+    return {entity.unique_id for entity in entities}
+
+
+def test_k40_builders_follow_circuits_and_zones():
+    """K40/ICOM circuit entities are built for every circuit listed."""
+    one = _k40_coordinator("k40", 1)
+    two = _k40_coordinator("k40", 2)
+    for build in (
+        _build_k40_climates,
+        _build_k40_circuit_selects,
+        partial(_build_k40_circuit_sensors, config_entry=Mock()),
+    ):
+        assert _unique_ids(build(one)) < _unique_ids(build(two))
+
+    assert _unique_ids(_build_k40_climates(two)) == {
+        "101-hc1",
+        "101-hc2",
+        "101-zn1",
+        "101-zn2",
+    }
+    # icom has no zones or thermostats
+    icom = _k40_coordinator("icom", 2)
+    assert _unique_ids(_build_k40_climates(icom)) == {"101-hc1", "101-hc2"}
+    assert len(_build_k40_circuit_sensors(icom, Mock())) == 4
+
+
+def test_wddw2_builders_follow_dhw_circuits():
+    """WDDW2 DHW entities are built for every dhwX circuit listed."""
+    second = {**_DHW_READ_ONLY[0], "id": "/dhwCircuits/dhw2"}
+    one = _wddw2_coordinator(_DHW_READ_ONLY)
+    two = _wddw2_coordinator([*_DHW_READ_ONLY, second])
+    for build in (
+        _build_wddw2_water_heaters,
+        _build_wddw2_dhw_switches,
+        partial(_build_wddw2_dhw_sensors, config_entry=Mock()),
+    ):
+        added = _unique_ids(build(two)) - _unique_ids(build(one))
+        assert added
+        assert all("dhw2" in unique_id for unique_id in added)
@@ -1,10 +1,17 @@
 """Tests for wddw2 (Tronic TR4001) switches, water heater and notifications."""
 
-from unittest.mock import AsyncMock, Mock
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
 
 from homeassistant.components.water_heater import WaterHeaterEntityFeature
-from homecom_alt import BHCDeviceWddw2
-
+from homeassistant.const import CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homecom_alt import ApiError, BHCDeviceWddw2
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bosch_homecom.const import CONF_REFRESH, DOMAIN
+from custom_components.bosch_homecom.coordinator import BoschComModuleCoordinatorWddw2
 from custom_components.bosch_homecom.sensor import BoschComSensorNotificationsWddw2
 from custom_components.bosch_homecom.switch import (
     BoschComWddw2HolidayModeSwitch,
@@ -270,3 +277,194 @@ def test_notifications_history_attribute():
         "active": False,
         "severity": "warning",
     }
+
+
+# ---------------------------------------------------------------------------
+# Recordings
+# ---------------------------------------------------------------------------
+
+ADD_STATISTICS = (
+    "custom_components.bosch_homecom.statistics.async_add_external_statistics"
+)
+
+
+def _recording(*buckets, unit="l") -> dict:
+    return {
+        "type": "yRecording",
+        "unitOfMeasure": unit,
+        "recording": [{"y": y, "c": c} for y, c in buckets],
+    }
+
+
+def _recordings_coordinator(
+    hass: HomeAssistant, bulk: AsyncMock
+) -> BoschComModuleCoordinatorWddw2:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "u", CONF_TOKEN: "t", CONF_REFRESH: "r"},
+    )
+    entry.add_to_hass(hass)
+    bhc = Mock(
+        async_update=AsyncMock(return_value=_make_data(_DHW_READ_ONLY)),
+        async_request_bulk=bulk,
+    )
+    return BoschComModuleCoordinatorWddw2(
+        hass,
+        bhc,
+        {"deviceId": "102051881", "deviceType": "wddw2"},
+        {"value": "1.0"},
+        entry,
+        False,
+    )
+
+
+async def test_recordings_cached_and_imported_by_completed_hour(
+    hass: HomeAssistant, freezer
+):
+    """Today's totals are cached; only completed hours reach statistics."""
+    hass.config.components.add("recorder")
+    freezer.move_to(dt_util.start_of_local_day() + timedelta(hours=2, minutes=30))
+
+    def _bulk(device_id, paths):
+        result = {}
+        for path in paths:
+            if "sensor/water" in path:
+                result[path] = _recording((20.0, 1), (5.0, 1), (3.0, 1))
+            elif "sensor/gas" in path:
+                result[path] = _recording((0.4, 1), (0.0, 0), unit="m3")
+        return result
+
+    coordinator = _recordings_coordinator(hass, AsyncMock(side_effect=_bulk))
+    with patch(ADD_STATISTICS) as add:
+        await coordinator._async_update_data()
+        # Within the hour the recordings are not read again.
+        await coordinator._async_update_data()
+
+    assert coordinator.bhc.async_request_bulk.await_count == 1
+    assert coordinator.recordings == {
+        "water_consumption_today": 28.0,
+        "gas_consumption_today": 0.4,
+    }
+    imported = {call.args[1]["statistic_id"]: call.args for call in add.mock_calls}
+    water = imported["bosch_homecom:102051881_dhwcircuits_dhw1_sensor_water"]
+    assert [row["sum"] for row in water[2]] == [20.0, 25.0]
+    gas = imported["bosch_homecom:102051881_heatsources_hs1_sensor_gas"]
+    assert gas[1]["unit_of_measurement"] == "m³"
+
+
+async def test_recordings_failure_keeps_last_values(hass: HomeAssistant):
+    """A failed read keeps the cached totals and is retried next poll."""
+    coordinator = _recordings_coordinator(hass, AsyncMock(side_effect=ApiError("down")))
+    coordinator.recordings["water_consumption_today"] = 42.0
+
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+
+    assert coordinator.recordings["water_consumption_today"] == 42.0
+    assert coordinator.bhc.async_request_bulk.await_count == 2
+
+
+async def test_recordings_read_yesterdays_final_hour_after_midnight(
+    hass: HomeAssistant, freezer
+):
+    """The last hour of yesterday is imported before today's first one."""
+    hass.config.components.add("recorder")
+    midnight = dt_util.start_of_local_day()
+    yesterday = (midnight - timedelta(days=1)).date().isoformat()
+    today = midnight.date().isoformat()
+    days = {
+        yesterday: _recording(*[(1.0, 1)] * 23, (0.0, 0)),
+        today: _recording((2.0, 1), *[(0.0, 0)] * 23),
+    }
+
+    def _bulk(device_id, paths):
+        # The device records only water; the other paths answer 404.
+        coordinator.bhc._last_endpoint_status = {
+            (device_id, path): 404 for path in paths if "sensor/water" not in path
+        }
+        return {
+            path: days[path.rsplit("=", 1)[1]]
+            for path in paths
+            if "sensor/water" in path
+        }
+
+    coordinator = _recordings_coordinator(hass, AsyncMock(side_effect=_bulk))
+    freezer.move_to(midnight - timedelta(minutes=30))
+    with patch(ADD_STATISTICS) as add:
+        await coordinator._async_update_data()
+        days[yesterday] = _recording(*[(1.0, 1)] * 24)
+        freezer.move_to(midnight + timedelta(hours=1, minutes=5))
+        await coordinator._async_update_data()
+
+    rows = [row for call in add.mock_calls for row in call.args[2]]
+    assert [row["start"] for row in rows[-2:]] == [
+        dt_util.as_utc(midnight) - timedelta(hours=1),
+        dt_util.as_utc(midnight),
+    ]
+    assert rows[-1]["sum"] == 26.0
+    assert coordinator.recordings_previous_day == {"water_consumption_today": 24.0}
+    assert coordinator.recordings == {"water_consumption_today": 2.0}
+    assert coordinator.recording_days.sealed == midnight.date() - timedelta(days=1)
+
+
+async def test_recordings_start_today_afresh_while_yesterday_is_open(
+    hass: HomeAssistant, freezer
+):
+    """After midnight today's totals never show yesterday's."""
+    midnight = dt_util.start_of_local_day()
+    yesterday = (midnight - timedelta(days=1)).date().isoformat()
+    today = midnight.date().isoformat()
+    days = {yesterday: _recording(*[(1.0, 1)] * 23, (0.0, 0))}
+
+    def _bulk(device_id, paths):
+        coordinator.bhc._last_endpoint_status = {
+            (device_id, path): 404 for path in paths if "sensor/water" not in path
+        }
+        return {
+            path: days[day]
+            for path in paths
+            if "sensor/water" in path and (day := path.rsplit("=", 1)[1]) in days
+        }
+
+    coordinator = _recordings_coordinator(hass, AsyncMock(side_effect=_bulk))
+    freezer.move_to(midnight - timedelta(minutes=30))
+    await coordinator._async_update_data()
+    assert coordinator.recordings == {"water_consumption_today": 23.0}
+
+    # Today's read failed; yesterday's final hour is not in yet.
+    freezer.move_to(midnight + timedelta(hours=1, minutes=5))
+    await coordinator._async_update_data()
+    assert coordinator.recording_days.is_open(
+        "/recordings/dhwCircuits/dhw1/sensor/water"
+    )
+    assert coordinator.recordings == {}
+
+    days[today] = _recording((2.0, 1), (3.0, 1), *[(0.0, 0)] * 22)
+    freezer.tick(timedelta(hours=1))
+    await coordinator._async_update_data()
+    assert coordinator.recording_days.is_open(
+        "/recordings/dhwCircuits/dhw1/sensor/water"
+    )
+    assert coordinator.recordings == {"water_consumption_today": 5.0}
+
+
+async def test_recordings_keep_yesterday_open_when_a_read_fails(
+    hass: HomeAssistant, freezer
+):
+    """Only a 404 closes yesterday; a path that failed is read again."""
+    midnight = dt_util.start_of_local_day()
+
+    def _bulk(device_id, paths):
+        coordinator.bhc._last_endpoint_status = {
+            (device_id, path): 500 for path in paths
+        }
+        return {}
+
+    coordinator = _recordings_coordinator(hass, AsyncMock(side_effect=_bulk))
+    freezer.move_to(midnight - timedelta(minutes=30))
+    await coordinator._async_update_data()
+    freezer.move_to(midnight + timedelta(hours=1, minutes=5))
+    await coordinator._async_update_data()
+
+    assert coordinator.recording_days.tail == midnight.date() - timedelta(days=1)
+    assert coordinator.recording_days.sealed is None